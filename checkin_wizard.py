@@ -6,9 +6,10 @@ Interactive wizard for finding and checking in guests
 
 import sys
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, TextIO
 from hotel_simulator import HotelSimulator, ReservationSystem
 from database import HotelDatabase
+from compat import console_session
 
 
 class CheckinWizard:
@@ -89,16 +90,11 @@ class CheckinWizard:
                 WHERE r.status IN ('confirmed', 'checked_in')
             """
             
-            params = []
-            
             # Add name conditions
-            if first_name:
-                query += " AND g.first_name LIKE ?"
-                params.append(f"%{first_name}%")
-            
-            if last_name:
-                query += " AND g.last_name LIKE ?"
-                params.append(f"%{last_name}%")
+            conditions, params = self.db.guest_search_conditions(
+                {'first_name': first_name, 'last_name': last_name}, alias='g')
+            for condition in conditions:
+                query += f" AND {condition}"
             
             # Add date condition (check-in date)
             query += " AND r.check_in_date = ?"
@@ -354,6 +350,18 @@ class CheckinWizard:
                 print("\n❌ Invalid option. Please select 1, 2, or 3.")
 
 
+def run_search(stdin: TextIO, stdout: TextIO, db_path: str = 'hotel.db') -> List[Dict]:
+    """Run the search wizard in-process, answering its prompts from stdin
+    
+    Same as `python3 checkin_wizard.py search` with stdin/stdout redirected,
+    without starting another interpreter.
+    """
+    with console_session(stdin, stdout) as resources:
+        wizard = CheckinWizard(db_path)
+        resources.enter_context(wizard.db)
+        return wizard.search_reservations_wizard()
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) > 1:
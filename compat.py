@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Hotel Simulator - Shared Helpers
+Interpreter-dependent settings and console plumbing used by several modules
+"""
+
+import sys
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from typing import Optional, TextIO
+
+# Keyword arguments for @dataclass: slotted dataclasses need Python 3.10+,
+# older interpreters keep a per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@contextmanager
+def console_session(stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None):
+    """Run a block with input() read from stdin and print() sent to stdout
+    
+    Either stream defaults to the console, so an entry point can answer its
+    prompts and capture its output in-process. Yields an ExitStack: whatever
+    the block registers on it (the wizard's database, say) is closed on the
+    way out, even on error, before the console streams are restored.
+    """
+    saved_stdin = sys.stdin
+    if stdin is not None:
+        sys.stdin = stdin
+    try:
+        with redirect_stdout(stdout if stdout is not None else sys.stdout), ExitStack() as resources:
+            yield resources
+    finally:
+        sys.stdin = saved_stdin
@@ -14,9 +14,10 @@ import os
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from database import HotelDatabase
+from compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DailyTransactionSummary:
     """Summary of transactions and occupancy for a specific date"""
     date: str
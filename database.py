@@ -6,8 +6,14 @@ Handles all database operations and schema creation
 
 import sqlite3
 import os
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 
+# Generated columns in the schema need 3.31 and the reports' MATERIALIZED
+# CTEs need 3.35
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+
 class HotelDatabase:
     """Handles all database operations for the hotel simulator"""
     
@@ -20,6 +26,7 @@ class HotelDatabase:
         """
         self.db_path = db_path
         self.conn = None
+        self.has_guest_search = False
         
         # Create parent directories if needed
         if create_dir:
@@ -34,9 +41,20 @@ class HotelDatabase:
     
     def _connect(self):
         """Create database connection"""
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} or newer is required "
+                f"(found {sqlite3.sqlite_version}); see Prerequisites in README.md")
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # Queries are fixed, parameterized SQL text; a larger statement
+            # cache (keyed on that text) keeps them prepared across calls
+            self.conn = sqlite3.connect(self.db_path, cached_statements=256)
             self.conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            # The simulator, wizards and reports all open this one file, often
+            # at the same time: WAL lets their reads run alongside a writer.
+            # Unlike the other PRAGMAs this is stored in the database file
+            # itself, so it is set here, once, for every tool that uses it
+            self.conn.execute("PRAGMA journal_mode = WAL")
             print(f"Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
@@ -125,6 +143,10 @@ class HotelDatabase:
                     total_price DECIMAL(10,2),
                     booking_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     payment_status TEXT DEFAULT 'pending',
+                    cancellation_date TIMESTAMP,
+                    notes TEXT,
+                    nights REAL GENERATED ALWAYS AS (julianday(check_out_date) - julianday(check_in_date)) VIRTUAL,
+                    nightly_rate REAL GENERATED ALWAYS AS (total_price / (julianday(check_out_date) - julianday(check_in_date))) VIRTUAL,
                     FOREIGN KEY (room_id) REFERENCES rooms(id) ON DELETE CASCADE,
                     FOREIGN KEY (guest_id) REFERENCES guests(id) ON DELETE CASCADE
                 )''',
@@ -159,12 +181,49 @@ class HotelDatabase:
                 '''CREATE INDEX IF NOT EXISTS idx_reservations_room ON reservations(room_id)''',
                 '''CREATE INDEX IF NOT EXISTS idx_reservations_guest ON reservations(guest_id)''',
                 '''CREATE INDEX IF NOT EXISTS idx_reservations_dates ON reservations(check_in_date, check_out_date)''',
-                '''CREATE INDEX IF NOT EXISTS idx_transactions_reservation ON transactions(reservation_id)'''
+                '''CREATE INDEX IF NOT EXISTS idx_transactions_reservation ON transactions(reservation_id)''',
+                # Car lookups are ordered by last name, so carry it in the index
+                '''CREATE INDEX IF NOT EXISTS idx_guests_car_make ON guests(car_make, last_name)''',
+                '''CREATE INDEX IF NOT EXISTS idx_guests_car_color ON guests(car_color, last_name)''',
+                # Guest searches list matches by name, so walk them in that order
+                '''CREATE INDEX IF NOT EXISTS idx_guests_name ON guests(last_name, first_name)''',
+                
+                # Covering indexes for the reports and the simulation's daily queries
+                # Occupied-room counts per hotel
+                '''CREATE INDEX IF NOT EXISTS idx_rooms_hotel_status ON rooms(hotel_id, id, status)''',
+                '''CREATE INDEX IF NOT EXISTS idx_reservations_room_dates
+                   ON reservations(room_id, check_in_date, check_out_date, status, total_price)''',
+                # Stay aggregates read nights/nightly_rate from the index instead
+                # of evaluating julianday() twice per row
+                '''CREATE INDEX IF NOT EXISTS idx_reservations_stay
+                   ON reservations(room_id, check_in_date, status, nights, nightly_rate, total_price)''',
+                '''CREATE INDEX IF NOT EXISTS idx_reservations_room_booking
+                   ON reservations(room_id, booking_date, status)''',
+                # Status synchronization joins each room to its confirmed or
+                # checked-in reservations covering the day
+                '''CREATE INDEX IF NOT EXISTS idx_reservations_room_status
+                   ON reservations(room_id, status, check_in_date, check_out_date)''',
+                # Confirmed arrivals for a date (target-driven check-ins)
+                '''CREATE INDEX IF NOT EXISTS idx_reservations_checkin_status
+                   ON reservations(check_in_date, status)''',
+                '''CREATE INDEX IF NOT EXISTS idx_transactions_date
+                   ON transactions(transaction_date, transaction_type, payment_method, amount, reservation_id)''',
+                '''CREATE INDEX IF NOT EXISTS idx_housekeeping_room_status
+                   ON housekeeping(room_id, status, last_cleaned)'''
             ]
             
+            # Bring tables created by older versions up to date before the
+            # indexes below refer to their newer columns
+            self._add_missing_columns(cursor, 'guests', self._GUEST_CAR_COLUMNS)
+            self._add_missing_columns(cursor, 'reservations', self._RESERVATION_CANCELLATION_COLUMNS)
+            self._add_missing_columns(cursor, 'reservations', self._RESERVATION_STAY_COLUMNS)
+            
             for table_sql in tables:
                 cursor.execute(table_sql)
             
+            self._initialize_guest_search(cursor)
+            self._analyze_once(cursor)
+            
             self.conn.commit()
             print("Database schema initialized successfully")
             
@@ -174,14 +233,109 @@ class HotelDatabase:
                 self.conn.rollback()
             raise
     
+    # Columns added after the first release, as name -> column definition;
+    # the CREATE TABLE statements above already include them
+    _GUEST_CAR_COLUMNS = {
+        'car_make': 'TEXT',
+        'car_model': 'TEXT',
+        'car_color': 'TEXT'
+    }
+    # When and why a reservation was cancelled, for the cancellation report
+    _RESERVATION_CANCELLATION_COLUMNS = {
+        'cancellation_date': 'TIMESTAMP',
+        'notes': 'TEXT'
+    }
+    # ALTER TABLE can only add VIRTUAL generated columns
+    _RESERVATION_STAY_COLUMNS = {
+        'nights': 'REAL GENERATED ALWAYS AS (julianday(check_out_date) - julianday(check_in_date)) VIRTUAL',
+        'nightly_rate': 'REAL GENERATED ALWAYS AS '
+                        '(total_price / (julianday(check_out_date) - julianday(check_in_date))) VIRTUAL'
+    }
+    
+    def _add_missing_columns(self, cursor, table, column_defs):
+        """Add any of column_defs a table created by an older version lacks"""
+        # table_xinfo also lists generated columns, which table_info hides
+        cursor.execute(f"PRAGMA table_xinfo({table})")
+        columns = {row[1] for row in cursor.fetchall()}
+        if not columns:
+            # No table yet; CREATE TABLE makes it with every column
+            return
+        for column, definition in column_defs.items():
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
+    def _analyze_once(self, cursor):
+        """Gather planner statistics the first time the database has data
+        
+        The composite indexes above are only costed properly with
+        sqlite_stat1; analysis_limit bounds the rows sampled per index on
+        large files. Until some table has rows there is nothing to record,
+        so an empty database is checked again on the next connection.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone():
+            cursor.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1")
+            if cursor.fetchone():
+                return
+        cursor.execute("PRAGMA analysis_limit = 1000")
+        cursor.execute("ANALYZE")
+    
+    _GUEST_SEARCH_COLUMNS = ('first_name', 'last_name', 'phone', 'address',
+                             'car_make', 'car_model', 'car_color')
+    
+    # Shortest search text the trigram index can serve
+    _TRIGRAM_MIN_LENGTH = 3
+    
+    def _initialize_guest_search(self, cursor):
+        """Create the guests_fts substring index and the triggers that sync it
+        
+        guests_fts is an external-content FTS5 table over guests using the
+        trigram tokenizer, so `guests_fts.<column> LIKE '%text%'` is served
+        from the index (for patterns of 3+ characters) instead of scanning
+        every guest row. SQLite builds without FTS5 simply go without it.
+        """
+        columns = ', '.join(self._GUEST_SEARCH_COLUMNS)
+        new_values = ', '.join(f'new.{c}' for c in self._GUEST_SEARCH_COLUMNS)
+        old_values = ', '.join(f'old.{c}' for c in self._GUEST_SEARCH_COLUMNS)
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'guests_fts'")
+        if cursor.fetchone():
+            self.has_guest_search = True
+            return
+        try:
+            cursor.execute(f'''CREATE VIRTUAL TABLE guests_fts USING fts5(
+                {columns}, content='guests', content_rowid='id', tokenize='trigram')''')
+        except sqlite3.OperationalError as e:
+            print(f"Guest search index unavailable: {e}")
+            return
+        self.has_guest_search = True
+        
+        cursor.execute(f'''CREATE TRIGGER IF NOT EXISTS guests_fts_insert AFTER INSERT ON guests BEGIN
+            INSERT INTO guests_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END''')
+        cursor.execute(f'''CREATE TRIGGER IF NOT EXISTS guests_fts_delete AFTER DELETE ON guests BEGIN
+            INSERT INTO guests_fts(guests_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END''')
+        cursor.execute(f'''CREATE TRIGGER IF NOT EXISTS guests_fts_update AFTER UPDATE ON guests BEGIN
+            INSERT INTO guests_fts(guests_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO guests_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END''')
+        # Index the guests that existed before the table was added
+        cursor.execute("INSERT INTO guests_fts(guests_fts) VALUES ('rebuild')")
+    
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
             print("Database connection closed")
     
-    def execute_query(self, query: str, params: tuple = None, fetch: bool = False) -> Optional[List[Dict[str, Any]]]:
-        """Execute a SQL query with optional parameters"""
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = False,
+                      commit: bool = True) -> Optional[List[Dict[str, Any]]]:
+        """Execute a SQL query with optional parameters
+        
+        Writes are committed immediately unless commit is False, in which
+        case they stay in the caller's open transaction.
+        """
         try:
             cursor = self.conn.cursor()
             
@@ -197,12 +351,16 @@ class HotelDatabase:
                 results = cursor.fetchall()
                 return [dict(zip(columns, row)) for row in results]
             else:
-                self.conn.commit()
+                if commit:
+                    self.conn.commit()
                 return None
                 
         except sqlite3.Error as e:
             print(f"Query execution error: {e}")
-            self.conn.rollback()
+            # Only undo what this call would have committed, so a failed
+            # read leaves the caller's open transaction alone
+            if commit and not fetch:
+                self.conn.rollback()
             raise
     
     def execute_many(self, query: str, params_list: List[tuple]):
@@ -391,6 +549,41 @@ class HotelDatabase:
         results = self.execute_query(query, (guest_id,), fetch=True)
         return results[0] if results else None
 
+    def guest_search_conditions(self, criteria: Dict[str, str], alias: str = 'guests'):
+        """Build WHERE conditions for guests whose fields contain the given text
+        
+        Text of 3 or more characters in a column covered by guests_fts is
+        matched through the trigram index in a single subquery. Shorter text
+        is not served by the index (and it misses non-ASCII matches there),
+        so it falls back to a plain LIKE on the guests table, as does any
+        other column, or every column when the index is unavailable.
+        
+        Args:
+            criteria: Column name -> text it must contain; empty text is ignored
+            alias: Name the surrounding query uses for the guests table
+            
+        Returns:
+            Tuple of (conditions to AND together, their parameters)
+        """
+        criteria = {column: text for column, text in criteria.items() if text}
+        indexed = [column for column, text in criteria.items()
+                   if self.has_guest_search and column in self._GUEST_SEARCH_COLUMNS
+                   and len(text) >= self._TRIGRAM_MIN_LENGTH]
+        conditions = []
+        params = []
+        
+        if indexed:
+            matches = " AND ".join(f"{column} LIKE ?" for column in indexed)
+            conditions.append(f"{alias}.id IN (SELECT rowid FROM guests_fts WHERE {matches})")
+            params.extend(f"%{criteria[column]}%" for column in indexed)
+        
+        for column, text in criteria.items():
+            if column not in indexed:
+                conditions.append(f"{alias}.{column} LIKE ?")
+                params.append(f"%{text}%")
+        
+        return conditions, params
+
     def update_guest(self, guest_id: int, **kwargs) -> bool:
         """Update guest information by ID
         
@@ -500,7 +693,8 @@ class HotelDatabase:
         
         return self.execute_query(query, tuple(params), fetch=True)
     
-    def create_room(self, hotel_id: int, floor_number: int, room_number: str, room_type_name: str, price_per_night: float = 100.00, max_occupancy: int = 2) -> int:
+    def create_room(self, hotel_id: int, floor_number: int, room_number: str, room_type_name: str, price_per_night: float = 100.00, max_occupancy: int = 2,
+                    commit: bool = True) -> int:
         """Create a single room with the specified parameters
         
         Args:
@@ -510,6 +704,7 @@ class HotelDatabase:
             room_type_name: Name of room type
             price_per_night: Price per night (default: 100.00)
             max_occupancy: Maximum occupancy (default: 2)
+            commit: Commit immediately (False leaves it to the caller's transaction)
             
         Returns:
             ID of the created room
@@ -547,11 +742,13 @@ class HotelDatabase:
                 (hotel_id, floor_id, room_number, room_type_id, 'available', price_per_night, max_occupancy)
             )
             
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
             print(f"Error creating room: {e}")
-            self.conn.rollback()
+            if commit:
+                self.conn.rollback()
             raise
 
     def update_room_price(self, room_id: int, new_price: float) -> bool:
@@ -665,6 +862,24 @@ class HotelDatabase:
             self.conn.rollback()
             return 0
 
+    @contextmanager
+    def transaction(self):
+        """Run a block of work as a single transaction
+        
+        The block's writes are committed together when it finishes, and an
+        exception rolls back the whole block. Methods called inside it must
+        be passed commit=False, since a commit of their own would end the
+        transaction early.
+        """
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+    
     def __enter__(self):
         """Context manager entry"""
         return self
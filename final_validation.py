@@ -15,8 +15,9 @@ def run_test(test_file, description):
     
     try:
         result = subprocess.run(
-            ['python3', test_file],
+            [sys.executable, test_file],
             capture_output=True,
+            close_fds=False,
             text=True,
             timeout=30
         )
@@ -5,9 +5,11 @@ Interactive wizards for adding and searching guests
 """
 
 import sys
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, TextIO
+from contextlib import ExitStack
 from hotel_simulator import HotelSimulator, Guest
 from database import HotelDatabase
+from compat import console_session
 
 
 class GuestWizard:
@@ -144,41 +146,18 @@ class GuestWizard:
             car_model = input("Car Model (partial match): ").strip()
             car_color = input("Car Color (partial match): ").strip()
             
-            # Build search query
-            conditions = []
-            params = []
-            
-            if first_name:
-                conditions.append("first_name LIKE ?")
-                params.append(f"%{first_name}%")
-            
-            if last_name:
-                conditions.append("last_name LIKE ?")
-                params.append(f"%{last_name}%")
-            
-            if email:
-                conditions.append("email LIKE ?")
-                params.append(f"%{email}%")
-            
-            if phone:
-                conditions.append("phone LIKE ?")
-                params.append(f"%{phone}%")
-            
-            if address:
-                conditions.append("address LIKE ?")
-                params.append(f"%{address}%")
-            
-            if car_make:
-                conditions.append("car_make LIKE ?")
-                params.append(f"%{car_make}%")
-            
-            if car_model:
-                conditions.append("car_model LIKE ?")
-                params.append(f"%{car_model}%")
-            
-            if car_color:
-                conditions.append("car_color LIKE ?")
-                params.append(f"%{car_color}%")
+            # Build search query; substring matches on the indexed columns
+            # are served from the guests_fts trigram index
+            conditions, params = self.db.guest_search_conditions({
+                'first_name': first_name,
+                'last_name': last_name,
+                'email': email,
+                'phone': phone,
+                'address': address,
+                'car_make': car_make,
+                'car_model': car_model,
+                'car_color': car_color
+            })
             
             if not conditions:
                 print("\n⚠️  No search criteria provided. Showing all guests (limited to 50).")
@@ -255,28 +234,38 @@ class GuestWizard:
                 print("\n❌ Invalid option. Please select 1, 2, or 3.")
 
 
-def main():
-    """Main entry point"""
-    if len(sys.argv) > 1:
-        if sys.argv[1] == 'add':
-            wizard = GuestWizard()
-            wizard.add_guest_wizard()
-        elif sys.argv[1] == 'search':
-            wizard = GuestWizard()
-            wizard.search_guest_wizard()
-        elif sys.argv[1] == 'menu':
-            wizard = GuestWizard()
-            wizard.main_menu()
-        else:
-            print("Usage: python3 guest_wizard.py [add|search|menu]")
-            print("  add    - Run the add guest wizard")
-            print("  search - Run the search guest wizard")
-            print("  menu   - Show interactive menu")
-            sys.exit(1)
-    else:
-        # Default to main menu
-        wizard = GuestWizard()
-        wizard.main_menu()
+def main(argv: Optional[List[str]] = None, stdin: Optional[TextIO] = None,
+         stdout: Optional[TextIO] = None):
+    """Main entry point
+    
+    argv defaults to sys.argv[1:]. Pass stdin/stdout to answer prompts and
+    capture output in-process instead of going through the console.
+    """
+    with console_session(stdin, stdout) as resources:
+        _main(sys.argv[1:] if argv is None else argv, resources)
+
+
+# Command -> wizard method it runs
+_COMMANDS = {
+    'add': GuestWizard.add_guest_wizard,
+    'search': GuestWizard.search_guest_wizard,
+    'menu': GuestWizard.main_menu
+}
+
+
+def _main(argv: List[str], resources: ExitStack):
+    # Default to main menu
+    command = argv[0] if argv else 'menu'
+    if command not in _COMMANDS:
+        print("Usage: python3 guest_wizard.py [add|search|menu]")
+        print("  add    - Run the add guest wizard")
+        print("  search - Run the search guest wizard")
+        print("  menu   - Show interactive menu")
+        sys.exit(1)
+    
+    wizard = GuestWizard()
+    resources.enter_context(wizard.db)
+    _COMMANDS[command](wizard)
 
 
 if __name__ == "__main__":
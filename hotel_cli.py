@@ -2,11 +2,13 @@ import argparse
 import sys
 import cmd
 import readline
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from hotel_simulator import HotelSimulator, ReservationSystem
 from database import HotelDatabase
 from simulation_engine import HotelSimulationEngine
 from reporting_system import HotelReportingSystem, ReportConfig, ReportType, TimePeriod
+from compat import console_session
 class HotelCLI(cmd.Cmd):
     """Interactive command-line interface for Hotel Simulator"""
     
@@ -19,6 +21,12 @@ class HotelCLI(cmd.Cmd):
         self.simulator = HotelSimulator()
         self.reporter = HotelReportingSystem()
         self.res_system = ReservationSystem(self.db)
+    
+    def close(self):
+        """Close the database connections the CLI opened"""
+        self.db.close()
+        self.simulator.db.close()
+        self.reporter.conn.close()
         
     def do_create_hotel(self, arg):
         """Create a new hotel: create_hotel <name> <address> <stars> <floors> <rooms>"""
@@ -990,7 +998,26 @@ class HotelCLI(cmd.Cmd):
         except Exception as e:
             print(f"Error: {e}")
 
-def main():
+def parse_room_spec(spec):
+    """Parse a rooms-bulk spec like '101:Standard,102:Deluxe' into (number, type) pairs"""
+    rooms = []
+    for entry in spec.split(','):
+        room_number, sep, room_type = entry.strip().partition(':')
+        if not sep or not room_number or not room_type:
+            raise argparse.ArgumentTypeError(f"Invalid room spec: {entry!r}. Use ROOM:TYPE[,ROOM:TYPE...]")
+        rooms.append((room_number, room_type))
+    return rooms
+
+def main(argv=None, stdin=None, stdout=None):
+    """Run the CLI with the given arguments
+    
+    argv defaults to sys.argv[1:]. Pass stdin/stdout to answer prompts and
+    capture output in-process instead of going through the console.
+    """
+    with console_session(stdin, stdout) as resources:
+        _main(argv, resources)
+
+def _main(argv, resources: ExitStack):
     parser = argparse.ArgumentParser(description='Hotel Simulator CLI')
     subparsers = parser.add_subparsers(dest='command')
     
@@ -1018,6 +1045,15 @@ def main():
     room_parser.add_argument('--price', type=float, default=100.00, help='Price per night (default: 100.00)')
     room_parser.add_argument('--occupancy', type=int, default=2, help='Maximum occupancy (default: 2)')
     
+    # Create several rooms on one floor
+    rooms_bulk_parser = subparsers.add_parser('rooms-bulk', help='Create several rooms on a floor in one transaction')
+    rooms_bulk_parser.add_argument('--hotel-id', type=int, required=True, help='Hotel ID')
+    rooms_bulk_parser.add_argument('--floor', type=int, required=True, help='Floor number')
+    rooms_bulk_parser.add_argument('--spec', type=parse_room_spec, required=True,
+                                   help='Rooms as ROOM:TYPE pairs, e.g. 101:Standard,102:Deluxe')
+    rooms_bulk_parser.add_argument('--price', type=float, default=100.00, help='Price per night (default: 100.00)')
+    rooms_bulk_parser.add_argument('--occupancy', type=int, default=2, help='Maximum occupancy (default: 2)')
+    
     # List room types
     list_room_types_parser = subparsers.add_parser('list-room-types', help='List all room types')
     
@@ -1071,7 +1107,7 @@ def main():
     delete_parser.add_argument('--force', action='store_true', help='Force deletion without confirmation')
     
     increase_parser.add_argument('--percentage', type=float, required=True, help='Percentage increase')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.command == 'create':
         with HotelDatabase() as db:
@@ -1094,6 +1130,13 @@ def main():
         with HotelDatabase() as db:
             room_id = db.create_room(args.hotel_id, args.floor, args.room_number, args.room_type, args.price, args.occupancy)
             print(f'Room created with ID: {room_id}')
+    elif args.command == 'rooms-bulk':
+        with HotelDatabase() as db:
+            with db.transaction():
+                room_ids = [db.create_room(args.hotel_id, args.floor, room_number, room_type,
+                                           args.price, args.occupancy, commit=False)
+                            for room_number, room_type in args.spec]
+            print(f'Created {len(room_ids)} rooms with IDs: {", ".join(map(str, room_ids))}')
     elif args.command == 'list-room-types':
         with HotelDatabase() as db:
             room_types = db.execute_query(
@@ -1122,10 +1165,12 @@ def main():
     elif args.command == 'wizard':
         # Interactive hotel creation wizard
         cli = HotelCLI()
+        resources.callback(cli.close)
         cli.do_create_hotel_interactive('')
     elif args.command == 'interactive':
         # Start interactive mode
         cli = HotelCLI()
+        resources.callback(cli.close)
         cli.cmdloop()
     elif args.command == 'batch':
         # Batch simulation mode
@@ -1135,6 +1180,7 @@ def main():
         
         try:
             engine = HotelSimulationEngine(args.hotel_id)
+            resources.enter_context(engine.db)
             results = engine.run_simulation(args.days, verbose=True)
             print(f"\nBatch simulation completed successfully!")
             print(f"Hotel ID: {args.hotel_id}")
@@ -1175,7 +1221,7 @@ def main():
                 return
             
             # Create reporting system
-            reporter = HotelReportingSystem()
+            reporter = resources.enter_context(HotelReportingSystem())
             
             # Determine time period
             if args.start_date and args.end_date:
@@ -16,6 +16,7 @@ from enum import Enum
 # Add the parent directory to Python path so we can import hotel_sim.database
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from database import HotelDatabase
+from compat import DATACLASS_SLOTS
 
 
 # Enums for status values
@@ -47,7 +48,7 @@ class TransactionType(Enum):
     ADJUSTMENT = "adjustment"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Guest:
     """Represents a hotel guest
     
@@ -107,9 +108,13 @@ class Reservation:
 class HotelSimulator:
     """Main hotel simulation class that orchestrates all operations"""
     
-    def __init__(self, db_path: str = 'hotel.db'):
-        """Initialize the hotel simulator with database connection"""
-        self.db = HotelDatabase(db_path)
+    def __init__(self, db_path: str = 'hotel.db', db: HotelDatabase = None):
+        """Initialize the hotel simulator with database connection
+        
+        Pass an existing HotelDatabase as db to share its connection instead
+        of opening a new one on db_path.
+        """
+        self.db = db if db is not None else HotelDatabase(db_path)
         self.hotel_id = None
         self.room_types = {}
         self.rooms = []
@@ -171,7 +176,7 @@ class HotelSimulator:
     
     def create_guest(self, first_name: str, last_name: str, email: str = "", 
                     phone: str = "", address: str = "", car_make: str = "",
-                    car_model: str = "", car_color: str = "") -> Guest:
+                    car_model: str = "", car_color: str = "", commit: bool = True) -> Guest:
         """Create a new guest and add to database
         
         Args:
@@ -180,6 +185,7 @@ class HotelSimulator:
             email: Guest's email
             phone: Guest's cell/mobile phone number (cell numbers only)
             address: Guest's physical address
+            commit: Commit immediately (False leaves it to the caller's transaction)
             
         Returns:
             Created Guest object with ID
@@ -191,7 +197,8 @@ class HotelSimulator:
             """
             cursor = self.db.conn.cursor()
             cursor.execute(query, (first_name, last_name, email, phone, address, car_make, car_model, car_color))
-            self.db.conn.commit()
+            if commit:
+                self.db.conn.commit()
             guest_id = cursor.lastrowid
             
             guest = Guest(
@@ -212,9 +219,22 @@ class HotelSimulator:
             
         except sqlite3.Error as e:
             print(f"Error creating guest: {e}")
-            self.db.conn.rollback()
+            if commit:
+                self.db.conn.rollback()
             raise
-    
+
+    def create_guests_bulk(self, guests: List[Dict[str, Any]]) -> List[Guest]:
+        """Create several guests in a single transaction
+
+        Args:
+            guests: One dict of create_guest() keyword arguments per guest
+
+        Returns:
+            Created Guest objects with IDs, in the order given
+        """
+        with self.db.transaction():
+            return [self.create_guest(**fields, commit=False) for fields in guests]
+
     def find_available_rooms(self, room_type: str = None, floor: int = None, 
                            check_in: str = None, check_out: str = None) -> List[Room]:
         """Find available rooms with optional filtering
@@ -341,7 +361,8 @@ class ReservationSystem:
         self.db = db
     
     def create_reservation(self, hotel_sim: HotelSimulator, guest: Guest, 
-                          room: Room, check_in: str, check_out: str) -> Reservation:
+                          room: Room, check_in: str, check_out: str,
+                          commit: bool = True) -> Reservation:
         """Create a new reservation
         
         Args:
@@ -350,6 +371,7 @@ class ReservationSystem:
             room: Room object
             check_in: Check-in date (YYYY-MM-DD)
             check_out: Check-out date (YYYY-MM-DD)
+            commit: Commit immediately (False leaves it to the caller's transaction)
             
         Returns:
             Created Reservation object
@@ -373,11 +395,12 @@ class ReservationSystem:
                 ReservationStatus.CONFIRMED.value, 
                 total_price
             ))
-            self.db.conn.commit()
+            if commit:
+                self.db.conn.commit()
             reservation_id = cursor.lastrowid
             
             # Update room status
-            self._update_room_status(room.id, RoomStatus.RESERVED)
+            self._update_room_status(room.id, RoomStatus.RESERVED, commit=commit)
             
             # Create reservation object
             reservation = Reservation(
@@ -398,23 +421,25 @@ class ReservationSystem:
             
         except Exception as e:
             print(f"Error creating reservation: {e}")
-            self.db.conn.rollback()
+            if commit:
+                self.db.conn.rollback()
             raise
     
-    def _update_room_status(self, room_id: int, status: RoomStatus):
+    def _update_room_status(self, room_id: int, status: RoomStatus, commit: bool = True):
         """Update room status in database"""
         try:
             query = "UPDATE rooms SET status = ? WHERE id = ?"
-            self.db.execute_query(query, (status.value, room_id))
+            self.db.execute_query(query, (status.value, room_id), commit=commit)
         except sqlite3.Error as e:
             print(f"Error updating room status: {e}")
             raise
     
-    def check_in(self, reservation_id: int) -> bool:
+    def check_in(self, reservation_id: int, commit: bool = True) -> bool:
         """Process guest check-in
         
         Args:
             reservation_id: ID of the reservation
+            commit: Commit immediately (False leaves it to the caller's transaction)
             
         Returns:
             True if successful, False otherwise
@@ -437,24 +462,26 @@ class ReservationSystem:
             
             # Update reservation status
             query = "UPDATE reservations SET status = ? WHERE id = ?"
-            self.db.execute_query(query, (ReservationStatus.CHECKED_IN.value, reservation_id))
+            self.db.execute_query(query, (ReservationStatus.CHECKED_IN.value, reservation_id), commit=commit)
             
             # Update room status
-            self._update_room_status(reservation['room_id'], RoomStatus.OCCUPIED)
+            self._update_room_status(reservation['room_id'], RoomStatus.OCCUPIED, commit=commit)
             
             print(f"✓ Checked in reservation #{reservation_id}")
             return True
             
         except Exception as e:
             print(f"Error during check-in: {e}")
-            self.db.conn.rollback()
+            if commit:
+                self.db.conn.rollback()
             return False
     
-    def check_out(self, reservation_id: int) -> Tuple[bool, float]:
+    def check_out(self, reservation_id: int, commit: bool = True) -> Tuple[bool, float]:
         """Process guest check-out and calculate final charges
         
         Args:
             reservation_id: ID of the reservation
+            commit: Commit immediately (False leaves it to the caller's transaction)
             
         Returns:
             Tuple of (success: bool, final_amount: float)
@@ -484,17 +511,18 @@ class ReservationSystem:
                 ReservationStatus.CHECKED_OUT.value, 
                 PaymentStatus.PAID.value, 
                 reservation_id
-            ))
+            ), commit=commit)
             
             # Update room status
-            self._update_room_status(reservation['room_id'], RoomStatus.AVAILABLE)
+            self._update_room_status(reservation['room_id'], RoomStatus.AVAILABLE, commit=commit)
             
             # Create payment transaction
             self._create_transaction(
                 reservation_id, 
                 final_amount, 
                 TransactionType.PAYMENT,
-                "Final payment for stay"
+                "Final payment for stay",
+                commit=commit
             )
             
             print(f"✓ Checked out reservation #{reservation_id}")
@@ -504,12 +532,13 @@ class ReservationSystem:
             
         except Exception as e:
             print(f"Error during check-out: {e}")
-            self.db.conn.rollback()
+            if commit:
+                self.db.conn.rollback()
             return False, 0.0
     
     def _create_transaction(self, reservation_id: int, amount: float, 
                            transaction_type: TransactionType, description: str, 
-                           transaction_date: str = None):
+                           transaction_date: str = None, commit: bool = True):
         """Create a financial transaction with optional date"""
         try:
             if transaction_date:
@@ -524,7 +553,7 @@ class ReservationSystem:
                     transaction_type.value,
                     description,
                     transaction_date
-                ))
+                ), commit=commit)
             else:
                 query = """
                     INSERT INTO transactions 
@@ -536,16 +565,21 @@ class ReservationSystem:
                     amount,
                     transaction_type.value,
                     description
-                ))
+                ), commit=commit)
         except sqlite3.Error as e:
             print(f"Error creating transaction: {e}")
             raise
     
-    def cancel_reservation(self, reservation_id: int) -> bool:
+    def cancel_reservation(self, reservation_id: int, commit: bool = True,
+                           reason: Optional[str] = None,
+                           cancellation_date: Optional[str] = None) -> bool:
         """Cancel a reservation
         
         Args:
             reservation_id: ID of the reservation to cancel
+            commit: Commit immediately (False leaves it to the caller's transaction)
+            reason: Why it was cancelled, kept in the reservation's notes
+            cancellation_date: When it was cancelled (defaults to now)
             
         Returns:
             True if successful, False otherwise
@@ -566,19 +600,29 @@ class ReservationSystem:
                 print(f"Cannot cancel reservation #{reservation_id} (status: {reservation['status']})")
                 return False
             
-            # Update reservation status
-            query = "UPDATE reservations SET status = ? WHERE id = ?"
-            self.db.execute_query(query, (ReservationStatus.CANCELLED.value, reservation_id))
+            # Update reservation status; the default cancellation date uses
+            # the same clock as the booking_date default, so notice periods
+            # line up
+            query = """
+                UPDATE reservations
+                SET status = ?, cancellation_date = COALESCE(?, CURRENT_TIMESTAMP),
+                    notes = COALESCE(?, notes)
+                WHERE id = ?
+            """
+            self.db.execute_query(
+                query, (ReservationStatus.CANCELLED.value, cancellation_date, reason, reservation_id),
+                commit=commit)
             
             # Update room status
-            self._update_room_status(reservation['room_id'], RoomStatus.AVAILABLE)
+            self._update_room_status(reservation['room_id'], RoomStatus.AVAILABLE, commit=commit)
             
             print(f"✓ Cancelled reservation #{reservation_id}")
             return True
             
         except Exception as e:
             print(f"Error cancelling reservation: {e}")
-            self.db.conn.rollback()
+            if commit:
+                self.db.conn.rollback()
             return False
 
 
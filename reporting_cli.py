@@ -5,6 +5,8 @@ Standalone command-line interface for generating hotel reports
 """
 
 import argparse
+import io
+import re
 import sys
 from datetime import datetime, timedelta
 from reporting_system import HotelReportingSystem, ReportConfig, ReportType, TimePeriod
@@ -13,9 +15,19 @@ from database import HotelDatabase
 from hotel_simulator import ReservationSystem
 
 
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+
 def parse_date(date_str):
     """Parse and validate date string in YYYY-MM-DD format"""
     try:
+        # Fast path for canonical YYYY-MM-DD input: validate the calendar
+        # date directly and return the string unchanged
+        if _ISO_DATE_RE.fullmatch(date_str):
+            year, month, day = date_str.split('-')
+            datetime(int(year), int(month), int(day))
+            return date_str
+        # Fall back to strptime for looser input such as 2026-2-1
         return datetime.strptime(date_str, '%Y-%m-%d').strftime('%Y-%m-%d')
     except ValueError:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
@@ -177,13 +189,8 @@ def generate_transactions_report(args):
     
     date = args.date if args.date else datetime.now().strftime('%Y-%m-%d')
     
-    if args.format == 'text':
-        result = tracker.generate_daily_report(args.hotel_id, date, 'text')
-    elif args.format == 'csv':
-        result = tracker.generate_daily_report(args.hotel_id, date, 'csv')
-    elif args.format == 'json':
-        result = tracker.generate_daily_report(args.hotel_id, date, 'json')
-    
+    # args.format is already restricted to text/csv/json by argparse choices
+    result = tracker.generate_daily_report(args.hotel_id, date, args.format)
     print(result)
 
 
@@ -288,13 +295,16 @@ def list_reservations(args):
             print("No reservations found.")
             return
         
-        # Format output based on format type
+        # Format output based on format type, buffering rows so the
+        # whole listing is emitted with a single stdout write
+        buf = io.StringIO()
+        write = buf.write
         if args.format == 'text':
-            # Print Header
-            print(f"\n{'ID':<5} {'Hotel (ID)':<25} {'Guest':<20} {'Room':<10} {'Dates':<23} {'Status':<10}")
-            print("-" * 95)
+            # Header
+            write(f"\n{'ID':<5} {'Hotel (ID)':<25} {'Guest':<20} {'Room':<10} {'Dates':<23} {'Status':<10}\n")
+            write("-" * 95 + "\n")
             
-            # Print Rows
+            # Rows
             for res in reservations:
                 hotel_display = f"{res['hotel_name']} ({res['hotel_id']})"
                 dates_display = f"{res['check_in_date']} -> {res['check_out_date']}"
@@ -309,13 +319,13 @@ def list_reservations(args):
                     status = f"🔴 {status}"
                 else:
                     status = f"🔵 {status}"
-                print(f"{res['id']:<5} {hotel_display[:24]:<25} {res['guest_name'][:19]:<20} {res['room_number']:<10} {dates_display:<23} {status}")
+                write(f"{res['id']:<5} {hotel_display[:24]:<25} {res['guest_name'][:19]:<20} {res['room_number']:<10} {dates_display:<23} {status}\n")
         
         elif args.format == 'csv':
             # CSV format
-            print("ID,Hotel ID,Hotel Name,Guest Name,Room Number,Check-in Date,Check-out Date,Status")
+            write("ID,Hotel ID,Hotel Name,Guest Name,Room Number,Check-in Date,Check-out Date,Status\n")
             for res in reservations:
-                print(f"{res['id']},{res['hotel_id']},\"{res['hotel_name']}\",\"{res['guest_name']}\",{res['room_number']},{res['check_in_date']},{res['check_out_date']},{res['status']}")
+                write(f"{res['id']},{res['hotel_id']},\"{res['hotel_name']}\",\"{res['guest_name']}\",{res['room_number']},{res['check_in_date']},{res['check_out_date']},{res['status']}\n")
         
         elif args.format == 'json':
             # JSON format
@@ -332,7 +342,9 @@ def list_reservations(args):
                     'check_out_date': res['check_out_date'],
                     'status': res['status']
                 })
-            print(json.dumps(result, indent=2))
+            write(json.dumps(result, indent=2) + "\n")
+        
+        sys.stdout.write(buf.getvalue())
             
     except Exception as e:
         print(f"❌ Error listing reservations: {e}")
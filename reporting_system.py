@@ -4,14 +4,35 @@ Hotel Simulator - Reporting System (Phase 4)
 Comprehensive reporting functionality for hotel operations
 """
 
+import calendar
+import csv
+import io
+import json
+import re
 import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
-import csv
+from functools import lru_cache
 import os
-from tabulate import tabulate
+
+from compat import DATACLASS_SLOTS
+from database import HotelDatabase
+
+_YMD_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD string, caching results since reports re-parse the same few dates"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+@lru_cache(maxsize=4096)
+def _ymd_ordinal(date_str: str) -> int:
+    """Day number of a YYYY-MM-DD string, so day spans are plain int subtraction"""
+    return _parse_ymd(date_str).toordinal()
 
 
 class ReportType(Enum):
@@ -36,9 +57,9 @@ class TimePeriod(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ReportConfig:
-    """Configuration for report generation"""
+    """Configuration for report generation (frozen so it can be hashed)"""
     report_type: ReportType
     time_period: TimePeriod
     hotel_id: int
@@ -50,7 +71,7 @@ class ReportConfig:
     room_number: Optional[str] = None  # For room-specific reports (using room number instead of ID)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ReportResult:
     """Container for report data"""
     report_type: ReportType
@@ -61,15 +82,139 @@ class ReportResult:
     summary: Dict[str, Any]
 
 
+@lru_cache(maxsize=None)
+def _build_usage_help() -> str:
+    """Build the reporting usage guide (it never changes, so it is built once)"""
+    help_text = [
+        "📊 HOTEL REPORTING SYSTEM - USAGE GUIDE",
+        "=" * 60,
+        "",
+        "📋 REPORT TYPES:",
+        "  • daily_status - Daily occupancy and status report",
+        "  • financial_summary - Financial performance summary",
+        "  • occupancy_analysis - Occupancy trends and analysis",
+        "  • revenue_by_room_type - Revenue breakdown by room type",
+        "  • guest_demographics - Guest information and statistics",
+        "  • housekeeping_status - Housekeeping operations report",
+        "  • cancellation_analysis - Cancellation patterns and reasons",
+        "",
+        "📅 TIME PERIODS:",
+        "  • daily - Single day (use with specific_date)",
+        "  • weekly - Last 7 days",
+        "  • monthly - Last 30 days (default)",
+        "  • quarterly - Last 90 days",
+        "  • yearly - Last 365 days",
+        "  • custom - Custom date range (requires start_date and end_date)",
+        "",
+        "🗓️ DATE FORMAT: YYYY-MM-DD (Example: 2026-02-01)",
+        "",
+        "📈 USAGE EXAMPLES:",
+    ]
+    
+    examples = [
+        ("Daily Status Report (today)", 
+         "ReportConfig(report_type=ReportType.DAILY_STATUS, time_period=TimePeriod.DAILY, hotel_id=1)"),
+        
+        ("Daily Status Report (specific date)",
+         "ReportConfig(report_type=ReportType.DAILY_STATUS, time_period=TimePeriod.DAILY, hotel_id=1, specific_date='2026-02-01')"),
+        
+        ("Occupancy Analysis (weekly)",
+         "ReportConfig(report_type=ReportType.OCCUPANCY_ANALYSIS, time_period=TimePeriod.WEEKLY, hotel_id=1)"),
+        
+        ("Occupancy Analysis (custom range)",
+         "ReportConfig(report_type=ReportType.OCCUPANCY_ANALYSIS, time_period=TimePeriod.CUSTOM, hotel_id=1, start_date='2026-01-01', end_date='2026-01-31')"),
+        
+        ("Financial Summary (monthly)",
+         "ReportConfig(report_type=ReportType.FINANCIAL_SUMMARY, time_period=TimePeriod.MONTHLY, hotel_id=1)"),
+    ]
+    
+    for title, example in examples:
+        help_text.append(f"  {title}:")
+        help_text.append(f"    {example}")
+        help_text.append("")
+    
+    help_text.extend([
+        "💡 TIPS:",
+        "  • Use specific_date for daily reports to analyze historical days",
+        "  • Use CUSTOM time period with start_date and end_date for date ranges",
+        "  • Date format must be YYYY-MM-DD (e.g., 2026-02-01)",
+        "  • Maximum date range is 365 days for performance reasons",
+        "  • All reports support text, csv, and json output formats",
+        "",
+        "❌ COMMON ERRORS:",
+        "  • Wrong date format: '02/01/2026' → Use '2026-02-01' instead",
+        "  • Missing dates for CUSTOM period: Provide both start_date and end_date",
+        "  • Invalid date range: start_date cannot be after end_date",
+        "  • Date range too large: Maximum 365 days allowed",
+        "",
+        "=" * 60
+    ])
+    
+    return "\n".join(help_text)
+
+
 class HotelReportingSystem:
     """Comprehensive reporting system for hotel operations"""
     
+    # Length in days of each rolling reporting window
+    _PERIOD_DAYS = {
+        TimePeriod.DAILY: 0,
+        TimePeriod.WEEKLY: 7,
+        TimePeriod.MONTHLY: 30,
+        TimePeriod.QUARTERLY: 90,
+        TimePeriod.YEARLY: 365
+    }
+    
+    # Guests listed in the demographics report unless include_details is set
+    _TOP_GUESTS = 100
+    
     def __init__(self, db_path: str = 'hotel.db'):
         """Initialize reporting system with database connection"""
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # HotelDatabase brings a file created by an older version up to date
+        # before the first report reads the columns added since (nights,
+        # nightly_rate, cancellation_date). Its connection keeps a statement
+        # cache large enough to hold every report query at once
+        self.conn = HotelDatabase(db_path).conn
         self.conn.row_factory = sqlite3.Row
         
+        # Reports are read-heavy aggregate scans: keep pages in a large
+        # cache / memory map with temp B-trees for GROUP BY in RAM (the
+        # file's WAL journal mode is set by HotelDatabase)
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -262144")  # 256 MB
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+        
+        # Configs whose date parameters already passed validation
+        self._validated_configs = set()
+        # Hotel IDs already confirmed to exist on this connection
+        self._known_hotels = set()
+        
+        # Report type -> generator, looked up once per report instead of
+        # walking an if/elif chain
+        self._report_generators = {
+            ReportType.DAILY_STATUS: self._generate_daily_status_report,
+            ReportType.FINANCIAL_SUMMARY: self._generate_financial_summary_report,
+            ReportType.OCCUPANCY_ANALYSIS: self._generate_occupancy_analysis_report,
+            ReportType.REVENUE_BY_ROOM_TYPE: self._generate_revenue_by_room_type_report,
+            ReportType.GUEST_DEMOGRAPHICS: self._generate_guest_demographics_report,
+            ReportType.HOUSEKEEPING_STATUS: self._generate_housekeeping_status_report,
+            ReportType.CANCELLATION_ANALYSIS: self._generate_cancellation_analysis_report,
+            ReportType.ROOM_SPECIFIC_REPORT: self._generate_room_specific_report
+        }
+        
+        # Per-type date validation and text sections, keyed the same way
+        self._date_validators = {
+            ReportType.DAILY_STATUS: self._validate_specific_date,
+            ReportType.OCCUPANCY_ANALYSIS: self._validate_custom_range
+        }
+        self._text_renderers = {
+            ReportType.DAILY_STATUS: self._render_daily_status_text,
+            ReportType.FINANCIAL_SUMMARY: self._render_financial_summary_text,
+            ReportType.OCCUPANCY_ANALYSIS: self._render_occupancy_analysis_text
+        }
+        
     def __enter__(self):
         return self
         
@@ -81,33 +226,36 @@ class HotelReportingSystem:
         generated_at = datetime.now().isoformat()
         
         # Validate hotel exists
-        if not self._hotel_exists(config.hotel_id):
-            raise ValueError(f"Hotel ID {config.hotel_id} does not exist")
+        if config.hotel_id not in self._known_hotels:
+            if not self._hotel_exists(config.hotel_id):
+                raise ValueError(f"Hotel ID {config.hotel_id} does not exist")
+            self._known_hotels.add(config.hotel_id)
         
         # Validate date parameters for reports that require them
-        if config.report_type in [ReportType.DAILY_STATUS, ReportType.OCCUPANCY_ANALYSIS]:
+        if config.report_type in self._date_validators and config not in self._validated_configs:
             self._validate_date_parameters(config)
+            self._validated_configs.add(config)
         
         # Generate the appropriate report
-        if config.report_type == ReportType.DAILY_STATUS:
-            data, summary = self._generate_daily_status_report(config)
-        elif config.report_type == ReportType.FINANCIAL_SUMMARY:
-            data, summary = self._generate_financial_summary_report(config)
-        elif config.report_type == ReportType.OCCUPANCY_ANALYSIS:
-            data, summary = self._generate_occupancy_analysis_report(config)
-        elif config.report_type == ReportType.REVENUE_BY_ROOM_TYPE:
-            data, summary = self._generate_revenue_by_room_type_report(config)
-        elif config.report_type == ReportType.GUEST_DEMOGRAPHICS:
-            data, summary = self._generate_guest_demographics_report(config)
-        elif config.report_type == ReportType.HOUSEKEEPING_STATUS:
-            data, summary = self._generate_housekeeping_status_report(config)
-        elif config.report_type == ReportType.CANCELLATION_ANALYSIS:
-            data, summary = self._generate_cancellation_analysis_report(config)
-        elif config.report_type == ReportType.ROOM_SPECIFIC_REPORT:
-            data, summary = self._generate_room_specific_report(config)
-        else:
+        generator = self._report_generators.get(config.report_type)
+        if generator is None:
             raise ValueError(f"Unknown report type: {config.report_type}")
         
+        # Run all of the report's queries in one read transaction so SQLite
+        # takes the shared lock once instead of per statement; a transaction
+        # the caller already has open is left for the caller to finish
+        owns_transaction = not self.conn.in_transaction
+        if owns_transaction:
+            self.conn.execute("BEGIN DEFERRED")
+        try:
+            data, summary = generator(config)
+        except BaseException:
+            if owns_transaction:
+                self.conn.rollback()
+            raise
+        if owns_transaction:
+            self.conn.commit()
+        
         return ReportResult(
             report_type=config.report_type,
             time_period=config.time_period,
@@ -208,89 +356,79 @@ class HotelReportingSystem:
         # First, synchronize room and reservation statuses to ensure data consistency
         self._synchronize_room_reservation_statuses(config.hotel_id, current_date)
         
-        # Get hotel info
+        # Fetch hotel info, room status, reservation stats, today's activity
+        # and housekeeping status in one round-trip. Each result set comes
+        # back as tagged (section, key, value) rows that are split out below.
         cursor.execute("""
-            SELECT name, total_floors, total_rooms 
-            FROM hotel 
-            WHERE id = ?
-        """, (config.hotel_id,))
-        hotel_info = cursor.fetchone()
-        
-        # Get room status counts
-        cursor.execute("""
-            SELECT 
-                status, 
-                COUNT(*) as count
-            FROM rooms 
-            WHERE hotel_id = ?
-            GROUP BY status
-        """, (config.hotel_id,))
-        room_status = {row['status']: row['count'] for row in cursor.fetchall()}
-        
-        # Get reservations for today
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_reservations,
-                SUM(CASE WHEN status = 'checked_in' THEN 1 ELSE 0 END) as checked_in,
-                SUM(CASE WHEN status = 'checked_out' THEN 1 ELSE 0 END) as checked_out,
-                SUM(CASE WHEN status = 'confirmed' THEN 1 ELSE 0 END) as confirmed,
-                SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancelled
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
+            WITH hotel_reservations AS (
+                SELECT res.status, res.check_in_date, res.check_out_date
+                FROM reservations res
+                JOIN rooms r ON r.id = res.room_id
+                WHERE r.hotel_id = :hotel_id
+            ),
+            reservation_stats AS (
+                SELECT 
+                    COUNT(*) as total_reservations,
+                    SUM(status = 'checked_in') as checked_in,
+                    SUM(status = 'checked_out') as checked_out,
+                    SUM(status = 'confirmed') as confirmed,
+                    SUM(status = 'cancelled') as cancelled
+                FROM hotel_reservations
+                WHERE check_in_date <= :date AND check_out_date >= :date
             )
-            AND (check_in_date <= ? AND check_out_date >= ?)
-        """, (config.hotel_id, current_date, current_date))
-        reservation_stats = cursor.fetchone()
-        
-        # Get today's actual check-ins (reservations that were checked in today)
-        cursor.execute("""
-            SELECT COUNT(*) as today_check_ins
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
+            SELECT 'hotel_info' as section, 'name' as key, name as value FROM hotel WHERE id = :hotel_id
+            UNION ALL SELECT 'hotel_info', 'total_floors', total_floors FROM hotel WHERE id = :hotel_id
+            UNION ALL SELECT 'hotel_info', 'total_rooms', total_rooms FROM hotel WHERE id = :hotel_id
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'room_status', status, COUNT(*)
+                FROM rooms 
+                WHERE hotel_id = :hotel_id
+                GROUP BY status
             )
-            AND status = 'checked_in'
-            AND check_in_date = ?
-        """, (config.hotel_id, current_date))
-        today_check_ins = cursor.fetchone()['today_check_ins']
-        
-        # Get today's actual check-outs (reservations that were checked out today)
-        cursor.execute("""
-            SELECT COUNT(*) as today_check_outs
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
+            UNION ALL SELECT 'reservation_stats', 'total_reservations', total_reservations FROM reservation_stats
+            UNION ALL SELECT 'reservation_stats', 'checked_in', checked_in FROM reservation_stats
+            UNION ALL SELECT 'reservation_stats', 'checked_out', checked_out FROM reservation_stats
+            UNION ALL SELECT 'reservation_stats', 'confirmed', confirmed FROM reservation_stats
+            UNION ALL SELECT 'reservation_stats', 'cancelled', cancelled FROM reservation_stats
+            UNION ALL
+            SELECT 'today', 'check_ins', COUNT(*)
+            FROM hotel_reservations
+            WHERE status = 'checked_in' AND check_in_date = :date
+            UNION ALL
+            SELECT 'today', 'check_outs', COUNT(*)
+            FROM hotel_reservations
+            WHERE status = 'checked_out' AND check_out_date = :date
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'housekeeping_status', h.status, COUNT(*)
+                FROM housekeeping h
+                JOIN rooms r ON h.room_id = r.id
+                WHERE r.hotel_id = :hotel_id
+                GROUP BY h.status
             )
-            AND status = 'checked_out'
-            AND check_out_date = ?
-        """, (config.hotel_id, current_date))
-        today_check_outs = cursor.fetchone()['today_check_outs']
+        """, {'hotel_id': config.hotel_id, 'date': current_date})
+        
+        sections = {
+            'hotel_info': {},
+            'room_status': {},
+            'reservation_stats': {},
+            'today': {},
+            'housekeeping_status': {}
+        }
+        for section, key, value in cursor:
+            sections[section][key] = value
         
-        # Get current guests (reservations that are checked in and overlap with today)
-        cursor.execute("""
-            SELECT COUNT(*) as current_guests
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND status = 'checked_in'
-            AND check_in_date <= ?
-            AND check_out_date >= ?
-        """, (config.hotel_id, current_date, current_date))
-        current_guests = cursor.fetchone()['current_guests']
+        hotel_info = sections['hotel_info']
+        room_status = sections['room_status']
+        reservation_stats = sections['reservation_stats']
+        today_check_ins = sections['today']['check_ins']
+        today_check_outs = sections['today']['check_outs']
+        housekeeping_status = sections['housekeeping_status']
         
-        # Get housekeeping status
-        cursor.execute("""
-            SELECT 
-                h.status, 
-                COUNT(*) as count
-            FROM housekeeping h
-            JOIN rooms r ON h.room_id = r.id
-            WHERE r.hotel_id = ?
-            GROUP BY h.status
-        """, (config.hotel_id,))
-        housekeeping_status = {row['status']: row['count'] for row in cursor.fetchall()}
+        # Current guests are the checked-in reservations overlapping today,
+        # which is exactly the checked_in bucket of the reservation stats
+        current_guests = reservation_stats['checked_in'] or 0
         
         data = {
             'hotel_info': dict(hotel_info),
@@ -325,97 +463,72 @@ class HotelReportingSystem:
         cursor = self.conn.cursor()
         
         # Determine date range based on time period
-        if config.time_period == TimePeriod.DAILY:
-            start_date = datetime.now().strftime('%Y-%m-%d')
-            end_date = start_date
-        elif config.time_period == TimePeriod.WEEKLY:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        elif config.time_period == TimePeriod.MONTHLY:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        else:
-            start_date = config.start_date or (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = config.end_date or datetime.now().strftime('%Y-%m-%d')
+        start_date, end_date, period_days = self._resolve_period(
+            config, (TimePeriod.DAILY, TimePeriod.WEEKLY, TimePeriod.MONTHLY))
         
         # Get total revenue
         cursor.execute("""
             SELECT 
-                SUM(amount) as total_revenue
-            FROM transactions 
-            WHERE transaction_type = 'payment'
-            AND transaction_date BETWEEN ? AND ?
-            AND reservation_id IN (
-                SELECT id FROM reservations 
-                WHERE room_id IN (
-                    SELECT id FROM rooms WHERE hotel_id = ?
-                )
-            )
+                SUM(t.amount) as total_revenue
+            FROM transactions t
+            JOIN reservations res ON res.id = t.reservation_id
+            JOIN rooms r ON r.id = res.room_id
+            WHERE t.transaction_type = 'payment'
+            AND t.transaction_date BETWEEN ? AND ?
+            AND r.hotel_id = ?
         """, (start_date, end_date, config.hotel_id))
         total_revenue = cursor.fetchone()['total_revenue'] or 0.0
         
         # Get revenue by category
-        cursor.execute("""
+        revenue_by_type = self._fetch_pairs("""
             SELECT 
-                transaction_type, 
-                SUM(amount) as amount
-            FROM transactions 
-            WHERE transaction_date BETWEEN ? AND ?
-            AND reservation_id IN (
-                SELECT id FROM reservations 
-                WHERE room_id IN (
-                    SELECT id FROM rooms WHERE hotel_id = ?
-                )
-            )
-            GROUP BY transaction_type
+                t.transaction_type, 
+                SUM(t.amount) as amount
+            FROM transactions t
+            JOIN reservations res ON res.id = t.reservation_id
+            JOIN rooms r ON r.id = res.room_id
+            WHERE t.transaction_date BETWEEN ? AND ?
+            AND r.hotel_id = ?
+            GROUP BY t.transaction_type
         """, (start_date, end_date, config.hotel_id))
-        revenue_by_type = {row['transaction_type']: row['amount'] for row in cursor.fetchall()}
         
         # Get payment methods
-        cursor.execute("""
+        payment_methods = self._fetch_pairs("""
             SELECT 
-                payment_method, 
-                SUM(amount) as amount
-            FROM transactions 
-            WHERE transaction_date BETWEEN ? AND ?
-            AND reservation_id IN (
-                SELECT id FROM reservations 
-                WHERE room_id IN (
-                    SELECT id FROM rooms WHERE hotel_id = ?
-                )
-            )
-            GROUP BY payment_method
+                t.payment_method, 
+                SUM(t.amount) as amount
+            FROM transactions t
+            JOIN reservations res ON res.id = t.reservation_id
+            JOIN rooms r ON r.id = res.room_id
+            WHERE t.transaction_date BETWEEN ? AND ?
+            AND r.hotel_id = ?
+            GROUP BY t.payment_method
         """, (start_date, end_date, config.hotel_id))
-        payment_methods = {row['payment_method']: row['amount'] for row in cursor.fetchall()}
         
         # Get average daily rate
         cursor.execute("""
             SELECT 
-                AVG(total_price / (julianday(check_out_date) - julianday(check_in_date))) as adr
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND check_in_date BETWEEN ? AND ?
-            AND status = 'completed'
+                AVG(res.nightly_rate) as adr
+            FROM reservations res
+            JOIN rooms r ON r.id = res.room_id
+            WHERE r.hotel_id = ?
+            AND res.check_in_date BETWEEN ? AND ?
+            AND res.status = 'completed'
         """, (config.hotel_id, start_date, end_date))
         adr = cursor.fetchone()['adr'] or 0.0
         
         # Get occupancy rate
         cursor.execute("""
             SELECT 
-                COUNT(DISTINCT room_id) as occupied_rooms,
-                (SELECT COUNT(*) FROM rooms WHERE hotel_id = ?) as total_rooms
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND check_in_date <= ? AND check_out_date >= ?
-            AND status = 'checked_in'
-        """, (config.hotel_id, config.hotel_id, end_date, end_date))
-        result = cursor.fetchone()
-        occupied_rooms = result['occupied_rooms']
-        total_rooms = result['total_rooms']
+                COUNT(DISTINCT res.room_id) as occupied_rooms,
+                (SELECT COUNT(*) FROM rooms WHERE hotel_id = :hotel_id) as total_rooms
+            FROM reservations res
+            JOIN rooms r ON r.id = res.room_id
+            WHERE r.hotel_id = :hotel_id
+            AND res.check_in_date <= :date AND res.check_out_date >= :date
+            AND res.status = 'checked_in'
+        """, {'hotel_id': config.hotel_id, 'date': end_date})
+        occupied_rooms, total_rooms = cursor.fetchone()
         occupancy_rate = (occupied_rooms / total_rooms * 100) if total_rooms > 0 else 0
         
         data = {
@@ -433,7 +546,7 @@ class HotelReportingSystem:
             'total_revenue': total_revenue,
             'occupancy_rate': occupancy_rate,
             'average_daily_rate': adr,
-            'period_days': (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days + 1
+            'period_days': period_days
         }
         
         return data, summary
@@ -443,43 +556,26 @@ class HotelReportingSystem:
         cursor = self.conn.cursor()
         
         # Determine date range based on time period
-        if config.time_period == TimePeriod.DAILY:
-            # For daily occupancy analysis, use specific_date if provided, otherwise today
-            target_date = config.specific_date if config.specific_date else datetime.now().strftime('%Y-%m-%d')
-            start_date = target_date
-            end_date = target_date
-        elif config.time_period == TimePeriod.WEEKLY:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        elif config.time_period == TimePeriod.MONTHLY:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        elif config.time_period == TimePeriod.QUARTERLY:
-            start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        elif config.time_period == TimePeriod.YEARLY:
-            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        elif config.time_period == TimePeriod.CUSTOM:
-            # Use the validated start_date and end_date from config
-            start_date = config.start_date or (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = config.end_date or datetime.now().strftime('%Y-%m-%d')
-        else:
-            # Default to monthly
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        start_date, end_date, period_days = self._resolve_period(
+            config, tuple(TimePeriod), use_specific_date=True)
         
-        # Get daily occupancy data
+        # Get daily occupancy data; the hotel's reservations touching the
+        # period are read once into the CTE, then grouped by each date column
         cursor.execute("""
+            WITH period_reservations AS MATERIALIZED (
+                SELECT res.check_in_date, res.check_out_date
+                FROM reservations res
+                JOIN rooms r ON r.id = res.room_id
+                WHERE r.hotel_id = :hotel_id
+                AND (res.check_in_date BETWEEN :start_date AND :end_date
+                     OR res.check_out_date BETWEEN :start_date AND :end_date)
+            )
             SELECT 
                 date(check_in_date) as date,
                 COUNT(*) as check_ins,
                 0 as check_outs
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND check_in_date BETWEEN ? AND ?
+            FROM period_reservations
+            WHERE check_in_date BETWEEN :start_date AND :end_date
             GROUP BY date(check_in_date)
             
             UNION ALL
@@ -488,23 +584,14 @@ class HotelReportingSystem:
                 date(check_out_date) as date,
                 0 as check_ins,
                 COUNT(*) as check_outs
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND check_out_date BETWEEN ? AND ?
+            FROM period_reservations
+            WHERE check_out_date BETWEEN :start_date AND :end_date
             GROUP BY date(check_out_date)
             
             ORDER BY date
-        """, (config.hotel_id, start_date, end_date, config.hotel_id, start_date, end_date))
+        """, {'hotel_id': config.hotel_id, 'start_date': start_date, 'end_date': end_date})
         
-        daily_data = []
-        for row in cursor.fetchall():
-            daily_data.append({
-                'date': row['date'],
-                'check_ins': row['check_ins'],
-                'check_outs': row['check_outs']
-            })
+        daily_data = [dict(row) for row in cursor]
         
         # Get occupancy by room type
         cursor.execute("""
@@ -523,48 +610,34 @@ class HotelReportingSystem:
             GROUP BY rt.name
         """, (end_date, end_date, config.hotel_id))
         
-        occupancy_by_type = []
-        for row in cursor.fetchall():
-            occupancy_by_type.append({
-                'room_type': row['room_type'],
-                'total_rooms': row['total_rooms'],
-                'occupied_rooms': row['occupied_rooms'],
-                'occupancy_rate': row['occupancy_rate']
-            })
+        # Column aliases match the record keys, so rows convert directly
+        occupancy_by_type = [dict(row) for row in cursor]
         
         # Get average stay length
         cursor.execute("""
             SELECT 
-                AVG(julianday(check_out_date) - julianday(check_in_date)) as avg_stay_length
-            FROM reservations 
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND check_in_date BETWEEN ? AND ?
-            AND status = 'completed'
+                AVG(res.nights) as avg_stay_length
+            FROM reservations res
+            JOIN rooms r ON r.id = res.room_id
+            WHERE r.hotel_id = ?
+            AND res.check_in_date BETWEEN ? AND ?
+            AND res.status = 'completed'
         """, (config.hotel_id, start_date, end_date))
         avg_stay_length = cursor.fetchone()['avg_stay_length'] or 0.0
         
-        # Calculate average occupancy rate from daily data
-        total_occupied = 0
-        total_available = 0
-        for day_data in daily_data:
-            # Get room counts for this date
+        # Calculate average occupancy rate. Room counts are current snapshots
+        # rather than per-date values, so every day in the period contributes
+        # the same ratio and the average reduces to a single query.
+        average_occupancy_rate = 0
+        if daily_data:
             cursor.execute("""
                 SELECT 
-                    SUM(CASE WHEN status = 'occupied' THEN 1 ELSE 0 END) as occupied,
-                    COUNT(*) as total
+                    COALESCE(SUM(status = 'occupied'), 0) * 1.0
+                        / MAX(COUNT(*), 1) * 100 as average_occupancy_rate
                 FROM rooms 
                 WHERE hotel_id = ?
             """, (config.hotel_id,))
-            room_counts = cursor.fetchone()
-            occupied = room_counts['occupied'] or 0
-            total = room_counts['total'] or 1  # Avoid division by zero
-            
-            total_occupied += occupied
-            total_available += total
-        
-        average_occupancy_rate = (total_occupied / total_available * 100) if total_available > 0 else 0
+            average_occupancy_rate = cursor.fetchone()['average_occupancy_rate']
         
         data = {
             'period': {'start_date': start_date, 'end_date': end_date},
@@ -578,7 +651,7 @@ class HotelReportingSystem:
             'hotel_id': config.hotel_id,
             'start_date': start_date,
             'end_date': end_date,
-            'period_days': (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days + 1,
+            'period_days': period_days,
             'average_stay_length': avg_stay_length,
             'total_room_types': len(occupancy_by_type),
             'average_occupancy_rate': average_occupancy_rate
@@ -591,12 +664,7 @@ class HotelReportingSystem:
         cursor = self.conn.cursor()
         
         # Determine date range
-        if config.time_period == TimePeriod.MONTHLY:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        else:
-            start_date = config.start_date or (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = config.end_date or datetime.now().strftime('%Y-%m-%d')
+        start_date, end_date, period_days = self._resolve_period(config, (TimePeriod.MONTHLY,))
         
         # Get revenue by room type
         cursor.execute("""
@@ -606,7 +674,8 @@ class HotelReportingSystem:
                 COUNT(res.id) as reservations,
                 SUM(res.total_price) as total_revenue,
                 AVG(res.total_price) as avg_revenue_per_reservation,
-                AVG(res.total_price / (julianday(res.check_out_date) - julianday(res.check_in_date))) as avg_daily_rate
+                AVG(res.nightly_rate) as avg_daily_rate,
+                TOTAL(SUM(res.total_price)) OVER () as grand_total
             FROM room_types rt
             JOIN rooms r ON rt.id = r.room_type_id
             JOIN reservations res ON r.id = res.room_id
@@ -617,18 +686,13 @@ class HotelReportingSystem:
             ORDER BY total_revenue DESC
         """, (config.hotel_id, start_date, end_date))
         
+        # grand_total is the same on every row (a window over all groups)
         room_type_revenue = []
         total_revenue = 0.0
-        for row in cursor.fetchall():
-            room_type_revenue.append({
-                'room_type': row['room_type'],
-                'base_price': row['base_price'],
-                'reservations': row['reservations'],
-                'total_revenue': row['total_revenue'],
-                'avg_revenue_per_reservation': row['avg_revenue_per_reservation'],
-                'avg_daily_rate': row['avg_daily_rate']
-            })
-            total_revenue += row['total_revenue'] or 0.0
+        for row in cursor:
+            record = dict(row)
+            total_revenue = record.pop('grand_total')
+            room_type_revenue.append(record)
         
         data = {
             'period': {'start_date': start_date, 'end_date': end_date},
@@ -637,7 +701,7 @@ class HotelReportingSystem:
         }
         
         summary = {
-            'period_days': (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days + 1,
+            'period_days': period_days,
             'total_revenue': total_revenue,
             'room_types': len(room_type_revenue)
         }
@@ -649,49 +713,42 @@ class HotelReportingSystem:
         cursor = self.conn.cursor()
         
         # Determine date range
-        if config.time_period == TimePeriod.MONTHLY:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        else:
-            start_date = config.start_date or (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = config.end_date or datetime.now().strftime('%Y-%m-%d')
+        start_date, end_date, period_days = self._resolve_period(config, (TimePeriod.MONTHLY,))
         
-        # Get guest demographics
+        # Get guest demographics: only the top spenders unless details were
+        # requested, so SQLite keeps a bounded heap instead of sorting every
+        # guest; the window columns still count and total all of them
         cursor.execute("""
             SELECT 
                 g.id as guest_id,
-                g.first_name,
-                g.last_name,
+                g.first_name || ' ' || g.last_name as name,
                 g.email,
                 g.loyalty_points,
                 COUNT(res.id) as total_stays,
                 SUM(res.total_price) as total_spent,
-                AVG(res.total_price) as avg_spent_per_stay
+                AVG(res.total_price) as avg_spent_per_stay,
+                COUNT(*) OVER () as guest_count,
+                TOTAL(SUM(res.total_price)) OVER () as grand_total
             FROM guests g
             JOIN reservations res ON g.id = res.guest_id
-            WHERE res.room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
+            JOIN rooms r ON r.id = res.room_id
+            WHERE r.hotel_id = ?
             AND res.check_in_date BETWEEN ? AND ?
             GROUP BY g.id
-            ORDER BY total_spent DESC
-        """, (config.hotel_id, start_date, end_date))
+            ORDER BY total_spent DESC, g.id DESC
+            LIMIT ?
+        """, (config.hotel_id, start_date, end_date,
+              -1 if config.include_details else self._TOP_GUESTS))
         
+        # guest_count/grand_total are the same on every row (windows over all groups)
         guest_data = []
         total_guests = 0
         total_revenue = 0.0
-        for row in cursor.fetchall():
-            guest_data.append({
-                'guest_id': row['guest_id'],
-                'name': f"{row['first_name']} {row['last_name']}",
-                'email': row['email'],
-                'loyalty_points': row['loyalty_points'],
-                'total_stays': row['total_stays'],
-                'total_spent': row['total_spent'],
-                'avg_spent_per_stay': row['avg_spent_per_stay']
-            })
-            total_guests += 1
-            total_revenue += row['total_spent'] or 0.0
+        for row in cursor:
+            record = dict(row)
+            total_guests = record.pop('guest_count')
+            total_revenue = record.pop('grand_total')
+            guest_data.append(record)
         
         # Get loyalty program stats
         cursor.execute("""
@@ -701,12 +758,11 @@ class HotelReportingSystem:
                 SUM(loyalty_points) as total_loyalty_points
             FROM guests
             WHERE id IN (
-                SELECT DISTINCT guest_id 
-                FROM reservations 
-                WHERE room_id IN (
-                    SELECT id FROM rooms WHERE hotel_id = ?
-                )
-                AND check_in_date BETWEEN ? AND ?
+                SELECT DISTINCT res.guest_id 
+                FROM reservations res
+                JOIN rooms r ON r.id = res.room_id
+                WHERE r.hotel_id = ?
+                AND res.check_in_date BETWEEN ? AND ?
             )
         """, (config.hotel_id, start_date, end_date))
         loyalty_stats = cursor.fetchone()
@@ -720,7 +776,7 @@ class HotelReportingSystem:
         }
         
         summary = {
-            'period_days': (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days + 1,
+            'period_days': period_days,
             'total_guests': total_guests,
             'total_revenue': total_revenue,
             'avg_revenue_per_guest': total_revenue / total_guests if total_guests > 0 else 0
@@ -814,82 +870,128 @@ class HotelReportingSystem:
         cursor = self.conn.cursor()
         
         # Determine date range
-        if config.time_period == TimePeriod.MONTHLY:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        else:
-            start_date = config.start_date or (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = config.end_date or datetime.now().strftime('%Y-%m-%d')
-        
-        # Get cancellation statistics
+        start_date, end_date, period_days = self._resolve_period(config, (TimePeriod.MONTHLY,))
+        
+        # A hotel with no reservations at all has nothing to analyse; an
+        # EXISTS probe stops at the first index hit instead of running the
+        # aggregate query below
+        if not self._has_reservations(config.hotel_id):
+            empty_stats = {
+                'total_cancellations': 0,
+                'last_minute_cancellations': 0,
+                'short_notice_cancellations': 0,
+                'long_notice_cancellations': 0
+            }
+            data = {
+                'period': {'start_date': start_date, 'end_date': end_date},
+                'cancellation_stats': empty_stats,
+                'cancellation_reasons': [],
+                'cancellation_rate': 0,
+                'total_reservations': 0,
+                'total_cancellations': 0
+            }
+            summary = {
+                'period_days': period_days,
+                'cancellation_rate': 0,
+                'total_cancellations': 0,
+                'total_reservations': 0
+            }
+            return data, summary
+        
+        # One round-trip for the whole report: the booking-date totals form a
+        # single row, and the per-reason cancellation groups are LEFT JOINed
+        # onto it (one NULL group when nothing was cancelled). Grand totals
+        # of the notice buckets are summed from the groups. Both dates are
+        # timestamps, so they are cut to the day before comparing with the
+        # period's bounds, which keeps the last day in. MATERIALIZED keeps
+        # SQLite from inlining the julianday() pair into each bucket below
         cursor.execute("""
-            SELECT 
-                COUNT(*) as total_cancellations,
-                SUM(CASE WHEN julianday(cancellation_date) - julianday(booking_date) <= 1 THEN 1 ELSE 0 END) as last_minute_cancellations,
-                SUM(CASE WHEN julianday(cancellation_date) - julianday(booking_date) > 1 AND julianday(cancellation_date) - julianday(booking_date) <= 7 THEN 1 ELSE 0 END) as short_notice_cancellations,
-                SUM(CASE WHEN julianday(cancellation_date) - julianday(booking_date) > 7 THEN 1 ELSE 0 END) as long_notice_cancellations
-            FROM reservations
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
+            WITH hotel_rooms AS (
+                SELECT id FROM rooms WHERE hotel_id = :hotel_id
+            ),
+            cancellations AS MATERIALIZED (
+                SELECT 
+                    res.notes as reason,
+                    julianday(res.cancellation_date) - julianday(res.booking_date) as notice_days
+                FROM reservations res
+                WHERE res.room_id IN hotel_rooms
+                AND res.status = 'cancelled'
+                AND date(res.cancellation_date) BETWEEN :start_date AND :end_date
+            ),
+            rates AS (
+                SELECT 
+                    COUNT(*) as total_reservations,
+                    COALESCE(SUM(res.status = 'cancelled'), 0) as total_cancellations,
+                    COALESCE(SUM(res.status = 'cancelled') * 1.0 / NULLIF(COUNT(*), 0) * 100, 0) as cancellation_rate
+                FROM reservations res
+                WHERE res.room_id IN hotel_rooms
+                AND date(res.booking_date) BETWEEN :start_date AND :end_date
+            ),
+            reasons AS (
+                SELECT 
+                    reason,
+                    COUNT(*) as count,
+                    SUM(notice_days <= 1) as last_minute_cancellations,
+                    SUM(notice_days > 1 AND notice_days <= 7) as short_notice_cancellations,
+                    SUM(notice_days > 7) as long_notice_cancellations
+                FROM cancellations
+                GROUP BY reason
             )
-            AND status = 'cancelled'
-            AND cancellation_date BETWEEN ? AND ?
-        """, (config.hotel_id, start_date, end_date))
-        
-        cancellation_stats = cursor.fetchone()
-        
-        # Get cancellation reasons (if available in notes)
-        cursor.execute("""
             SELECT 
-                notes as reason,
-                COUNT(*) as count
-            FROM reservations
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND status = 'cancelled'
-            AND cancellation_date BETWEEN ? AND ?
-            AND notes IS NOT NULL
-            GROUP BY notes
-            ORDER BY count DESC
-        """, (config.hotel_id, start_date, end_date))
-        
+                rates.total_reservations,
+                rates.total_cancellations,
+                rates.cancellation_rate,
+                reasons.reason,
+                reasons.count,
+                reasons.last_minute_cancellations,
+                reasons.short_notice_cancellations,
+                reasons.long_notice_cancellations
+            FROM rates
+            LEFT JOIN reasons ON 1
+            ORDER BY reasons.count DESC, reasons.reason
+        """, {'hotel_id': config.hotel_id, 'start_date': start_date, 'end_date': end_date})
+        
+        rows = cursor.fetchall()
+        # Columns are selected in a fixed order, so unpack positionally
+        # rather than looking each one up by name
+        total_reservations, total_cancellations, cancellation_rate = rows[0][:3]
+        cancelled = last_minute = short_notice = long_notice = 0
         cancellation_reasons = []
-        for row in cursor.fetchall():
-            cancellation_reasons.append({
-                'reason': row['reason'],
-                'count': row['count']
-            })
-        
-        # Get cancellation rate
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_reservations,
-                SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as total_cancellations
-            FROM reservations
-            WHERE room_id IN (
-                SELECT id FROM rooms WHERE hotel_id = ?
-            )
-            AND booking_date BETWEEN ? AND ?
-        """, (config.hotel_id, start_date, end_date))
+        for _, _, _, reason, count, row_last_minute, row_short_notice, row_long_notice in rows:
+            if count is None:
+                continue
+            cancelled += count
+            last_minute += row_last_minute or 0
+            short_notice += row_short_notice or 0
+            long_notice += row_long_notice or 0
+            # Cancellation reasons (if available in notes)
+            if reason is not None:
+                cancellation_reasons.append({
+                    'reason': reason,
+                    'count': count
+                })
         
-        rate_data = cursor.fetchone()
-        cancellation_rate = (rate_data['total_cancellations'] / rate_data['total_reservations'] * 100) if rate_data['total_reservations'] > 0 else 0
+        cancellation_stats = {
+            'total_cancellations': cancelled,
+            'last_minute_cancellations': last_minute,
+            'short_notice_cancellations': short_notice,
+            'long_notice_cancellations': long_notice
+        }
         
         data = {
             'period': {'start_date': start_date, 'end_date': end_date},
-            'cancellation_stats': dict(cancellation_stats),
+            'cancellation_stats': cancellation_stats,
             'cancellation_reasons': cancellation_reasons,
             'cancellation_rate': cancellation_rate,
-            'total_reservations': rate_data['total_reservations'],
-            'total_cancellations': rate_data['total_cancellations']
+            'total_reservations': total_reservations,
+            'total_cancellations': total_cancellations
         }
         
         summary = {
-            'period_days': (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days + 1,
+            'period_days': period_days,
             'cancellation_rate': cancellation_rate,
-            'total_cancellations': rate_data['total_cancellations'],
-            'total_reservations': rate_data['total_reservations']
+            'total_cancellations': total_cancellations,
+            'total_reservations': total_reservations
         }
         
         return data, summary
@@ -946,7 +1048,7 @@ class HotelReportingSystem:
                 (r.check_out_date BETWEEN ? AND ?) OR
                 (r.check_in_date <= ? AND r.check_out_date >= ?)
             )
-            ORDER BY r.check_in_date
+            ORDER BY r.check_in_date, r.id
         """, (room_info['id'], start_date, end_date, start_date, end_date, start_date, end_date))
         
         reservations = cursor.fetchall()
@@ -965,7 +1067,7 @@ class HotelReportingSystem:
             JOIN reservations r ON t.reservation_id = r.id
             WHERE r.room_id = ?
             AND t.transaction_date BETWEEN ? AND ?
-            ORDER BY t.transaction_date
+            ORDER BY t.transaction_date, t.id
         """, (room_info['id'], start_date, end_date))
         
         transactions = cursor.fetchall()
@@ -985,7 +1087,7 @@ class HotelReportingSystem:
             out_date = min(check_out_date, end_date)
             
             if in_date <= out_date:
-                nights = (datetime.strptime(out_date, '%Y-%m-%d') - datetime.strptime(in_date, '%Y-%m-%d')).days
+                nights = _ymd_ordinal(out_date) - _ymd_ordinal(in_date)
                 if nights > 0:
                     total_nights += nights
                     total_guests += 1
@@ -1009,7 +1111,7 @@ class HotelReportingSystem:
                             'status': reservation['reservation_status']
                         })
                         
-                        current_date = (datetime.strptime(current_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+                        current_date = (_parse_ymd(current_date) + timedelta(days=1)).strftime('%Y-%m-%d')
         
         # Add transaction data to daily breakdown
         for transaction in transactions:
@@ -1035,7 +1137,7 @@ class HotelReportingSystem:
                     'revenue': 0.0,
                     'occupancy_status': 'available'
                 }
-            current_date = (datetime.strptime(current_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+            current_date = (_parse_ymd(current_date) + timedelta(days=1)).strftime('%Y-%m-%d')
         
         data = {
             'room_info': dict(room_info),
@@ -1059,203 +1161,183 @@ class HotelReportingSystem:
             'total_nights': total_nights,
             'total_guests': total_guests,
             'total_revenue': round(total_revenue, 2),
-            'occupancy_rate': round((total_nights / (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days * 100), 2) if start_date != end_date else 100 if total_nights > 0 else 0
+            'occupancy_rate': round((total_nights / (_ymd_ordinal(end_date) - _ymd_ordinal(start_date)) * 100), 2) if start_date != end_date else 100 if total_nights > 0 else 0
         }
         
         return data, summary
     
     # Utility methods
     
+    def _resolve_period(self, config: ReportConfig, periods: tuple,
+                        use_specific_date: bool = False) -> tuple:
+        """Resolve (start_date, end_date, period_days) for a report's time period
+        
+        Periods listed in `periods` are windows ending today (DAILY is just
+        today, or the config's specific_date with use_specific_date); any other
+        period uses the config's custom dates, defaulting to the last 30 days.
+        """
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        period = config.time_period
+        
+        if period in periods and period in self._PERIOD_DAYS:
+            if period == TimePeriod.DAILY:
+                target_date = (use_specific_date and config.specific_date) or today
+                return target_date, target_date, 1
+            days = self._PERIOD_DAYS[period]
+            return (now - timedelta(days=days)).strftime('%Y-%m-%d'), today, days + 1
+        
+        start_date = config.start_date or (now - timedelta(days=30)).strftime('%Y-%m-%d')
+        end_date = config.end_date or today
+        period_days = _ymd_ordinal(end_date) - _ymd_ordinal(start_date) + 1
+        return start_date, end_date, period_days
+    
+    def _fetch_pairs(self, query: str, params: tuple) -> Dict[Any, Any]:
+        """Run a two-column query and return its rows as a key -> value dict"""
+        # A plain tuple cursor lets dict() consume the rows directly instead
+        # of going through sqlite3.Row lookups per column
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        return dict(cursor)
+    
     def _hotel_exists(self, hotel_id: int) -> bool:
         """Check if hotel exists in database"""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM hotel WHERE id = ?", (hotel_id,))
-        return cursor.fetchone()[0] > 0
+        cursor.execute("SELECT 1 FROM hotel WHERE id = ? LIMIT 1", (hotel_id,))
+        return cursor.fetchone() is not None
+    
+    def _has_reservations(self, hotel_id: int) -> bool:
+        """Check if any reservation exists for the hotel's rooms"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT EXISTS(
+                SELECT 1 FROM reservations res
+                JOIN rooms r ON r.id = res.room_id
+                WHERE r.hotel_id = ?
+            )
+        """, (hotel_id,))
+        return bool(cursor.fetchone()[0])
     
     def _validate_date_parameters(self, config: ReportConfig) -> None:
         """Validate date parameters and provide helpful error messages"""
-        report_type = config.report_type
-        
-        # For daily status reports
-        if report_type == ReportType.DAILY_STATUS:
-            if config.specific_date:
-                # Validate specific date format (YYYY-MM-DD)
-                if not self._is_valid_date_format(config.specific_date):
-                    raise ValueError(
-                        f"Invalid date format: {config.specific_date}"
-                        f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
-                    )
-            # Daily status reports can use specific_date or default to today
-            return
-        
-        # For occupancy analysis reports
-        elif report_type == ReportType.OCCUPANCY_ANALYSIS:
-            if config.time_period == TimePeriod.CUSTOM:
-                if not config.start_date or not config.end_date:
-                    raise ValueError(
-                        "For CUSTOM time period, both start_date and end_date are required.\n"
-                        "Usage: start_date='YYYY-MM-DD', end_date='YYYY-MM-DD'"
-                    )
-                if not self._is_valid_date_format(config.start_date):
-                    raise ValueError(
-                        f"Invalid start_date format: {config.start_date}"
-                        f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
-                    )
-                if not self._is_valid_date_format(config.end_date):
-                    raise ValueError(
-                        f"Invalid end_date format: {config.end_date}"
-                        f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
-                    )
-                
-                # Validate date range
-                start_date = datetime.strptime(config.start_date, '%Y-%m-%d')
-                end_date = datetime.strptime(config.end_date, '%Y-%m-%d')
-                if start_date > end_date:
-                    raise ValueError(
-                        f"Invalid date range: start_date ({config.start_date}) "
-                        f"cannot be after end_date ({config.end_date})"
-                    )
-                
-                # Validate reasonable date range (max 365 days)
-                delta = end_date - start_date
-                if delta.days > 365:
-                    raise ValueError(
-                        f"Date range too large: {delta.days} days. "
-                        f"Maximum allowed is 365 days."
-                    )
-            # Other time periods don't require custom dates
-            return
-        
-        # For other report types, provide helpful guidance
-        else:
-            if config.specific_date or config.start_date or config.end_date:
-                print(f"Note: Date parameters are not typically used for {report_type.value} reports.")
-                print(f"For date-specific analysis, consider using:")
-                print(f"  - {ReportType.DAILY_STATUS.value} with specific_date parameter")
-                print(f"  - {ReportType.OCCUPANCY_ANALYSIS.value} with time_period and date range")
+        self._date_validators[config.report_type](config)
+    
+    def _validate_specific_date(self, config: ReportConfig) -> None:
+        """Validate the specific_date of a daily status report"""
+        if config.specific_date:
+            # Validate specific date format (YYYY-MM-DD)
+            if not self._is_valid_date_format(config.specific_date):
+                raise ValueError(
+                    f"Invalid date format: {config.specific_date}"
+                    f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
+                )
+        # Daily status reports can use specific_date or default to today
+    
+    def _validate_custom_range(self, config: ReportConfig) -> None:
+        """Validate the custom date range of an occupancy analysis report"""
+        if config.time_period == TimePeriod.CUSTOM:
+            if not config.start_date or not config.end_date:
+                raise ValueError(
+                    "For CUSTOM time period, both start_date and end_date are required.\n"
+                    "Usage: start_date='YYYY-MM-DD', end_date='YYYY-MM-DD'"
+                )
+            if not self._is_valid_date_format(config.start_date):
+                raise ValueError(
+                    f"Invalid start_date format: {config.start_date}"
+                    f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
+                )
+            if not self._is_valid_date_format(config.end_date):
+                raise ValueError(
+                    f"Invalid end_date format: {config.end_date}"
+                    f"Date should be in YYYY-MM-DD format. Example: '2026-02-01'"
+                )
+            
+            # Validate date range
+            span_days = _ymd_ordinal(config.end_date) - _ymd_ordinal(config.start_date)
+            if span_days < 0:
+                raise ValueError(
+                    f"Invalid date range: start_date ({config.start_date}) "
+                    f"cannot be after end_date ({config.end_date})"
+                )
+            
+            # Validate reasonable date range (max 365 days)
+            if span_days > 365:
+                raise ValueError(
+                    f"Date range too large: {span_days} days. "
+                    f"Maximum allowed is 365 days."
+                )
+        # Other time periods don't require custom dates
     
     def _is_valid_date_format(self, date_str: str) -> bool:
         """Check if date string is in valid YYYY-MM-DD format"""
+        # Canonical dates are checked with the regex and integer bounds,
+        # without building a datetime; looser input (e.g. 2026-2-1) still
+        # goes through strptime
+        match = _YMD_RE.fullmatch(date_str)
+        if match:
+            year, month, day = map(int, match.groups())
+            return year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
         try:
-            datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_ymd(date_str)
             return True
         except ValueError:
             return False
     
     def get_usage_help(self, report_type: ReportType = None) -> str:
         """Get helpful usage information for report generation"""
-        help_text = [
-            "📊 HOTEL REPORTING SYSTEM - USAGE GUIDE",
-            "=" * 60,
-            "",
-            "📋 REPORT TYPES:",
-            "  • daily_status - Daily occupancy and status report",
-            "  • financial_summary - Financial performance summary",
-            "  • occupancy_analysis - Occupancy trends and analysis",
-            "  • revenue_by_room_type - Revenue breakdown by room type",
-            "  • guest_demographics - Guest information and statistics",
-            "  • housekeeping_status - Housekeeping operations report",
-            "  • cancellation_analysis - Cancellation patterns and reasons",
-            "",
-            "📅 TIME PERIODS:",
-            "  • daily - Single day (use with specific_date)",
-            "  • weekly - Last 7 days",
-            "  • monthly - Last 30 days (default)",
-            "  • quarterly - Last 90 days",
-            "  • yearly - Last 365 days",
-            "  • custom - Custom date range (requires start_date and end_date)",
-            "",
-            "🗓️ DATE FORMAT: YYYY-MM-DD (Example: 2026-02-01)",
-            "",
-            "📈 USAGE EXAMPLES:",
-        ]
-        
-        examples = [
-            ("Daily Status Report (today)", 
-             "ReportConfig(report_type=ReportType.DAILY_STATUS, time_period=TimePeriod.DAILY, hotel_id=1)"),
-            
-            ("Daily Status Report (specific date)",
-             "ReportConfig(report_type=ReportType.DAILY_STATUS, time_period=TimePeriod.DAILY, hotel_id=1, specific_date='2026-02-01')"),
-            
-            ("Occupancy Analysis (weekly)",
-             "ReportConfig(report_type=ReportType.OCCUPANCY_ANALYSIS, time_period=TimePeriod.WEEKLY, hotel_id=1)"),
-            
-            ("Occupancy Analysis (custom range)",
-             "ReportConfig(report_type=ReportType.OCCUPANCY_ANALYSIS, time_period=TimePeriod.CUSTOM, hotel_id=1, start_date='2026-01-01', end_date='2026-01-31')"),
-            
-            ("Financial Summary (monthly)",
-             "ReportConfig(report_type=ReportType.FINANCIAL_SUMMARY, time_period=TimePeriod.MONTHLY, hotel_id=1)"),
-        ]
-        
-        for title, example in examples:
-            help_text.append(f"  {title}:")
-            help_text.append(f"    {example}")
-            help_text.append("")
-        
-        help_text.extend([
-            "💡 TIPS:",
-            "  • Use specific_date for daily reports to analyze historical days",
-            "  • Use CUSTOM time period with start_date and end_date for date ranges",
-            "  • Date format must be YYYY-MM-DD (e.g., 2026-02-01)",
-            "  • Maximum date range is 365 days for performance reasons",
-            "  • All reports support text, csv, and json output formats",
-            "",
-            "❌ COMMON ERRORS:",
-            "  • Wrong date format: '02/01/2026' → Use '2026-02-01' instead",
-            "  • Missing dates for CUSTOM period: Provide both start_date and end_date",
-            "  • Invalid date range: start_date cannot be after end_date",
-            "  • Date range too large: Maximum 365 days allowed",
-            "",
-            "=" * 60
-        ])
-        
-        return "\n".join(help_text)
+        return _build_usage_help()
     
     def _display_text_report(self, report: ReportResult) -> str:
         """Display report in text format"""
-        output = []
-        output.append(f"Hotel Report: {report.report_type.value}")
-        output.append(f"Hotel ID: {report.hotel_id}")
-        output.append(f"Generated: {report.generated_at}")
-        output.append("=" * 50)
-        
-        if report.report_type == ReportType.DAILY_STATUS:
-            output.append("DAILY STATUS REPORT")
-            output.append(f"Hotel: {report.data['hotel_info']['name']}")
-            output.append(f"Date: {report.data['date']}")
-            output.append("\nRoom Status:")
-            for status, count in report.data['room_status'].items():
-                output.append(f"  {status}: {count}")
-            
-            output.append("\nReservation Status:")
-            for key, value in report.data['reservation_stats'].items():
-                output.append(f"  {key}: {value}")
-            
-            output.append("\nHousekeeping Status:")
-            for status, count in report.data['housekeeping_status'].items():
-                output.append(f"  {status}: {count}")
-                
-        elif report.report_type == ReportType.FINANCIAL_SUMMARY:
-            output.append("FINANCIAL SUMMARY REPORT")
-            output.append(f"Period: {report.data['period']['start_date']} to {report.data['period']['end_date']}")
-            output.append(f"Total Revenue: ${report.data['total_revenue']:.2f}")
-            output.append(f"Occupancy Rate: {report.data['occupancy_rate']:.1f}%")
-            output.append(f"Average Daily Rate: ${report.data['average_daily_rate']:.2f}")
-            
-        elif report.report_type == ReportType.OCCUPANCY_ANALYSIS:
-            output.append("OCCUPANCY ANALYSIS REPORT")
-            output.append(f"Period: {report.data['period']['start_date']} to {report.data['period']['end_date']}")
-            output.append(f"Average Stay Length: {report.data['average_stay_length']:.1f} days")
-
-        elif report.report_type == ReportType.ROOM_SPECIFIC_REPORT:
+        if report.report_type == ReportType.ROOM_SPECIFIC_REPORT:
             return self._display_room_specific_text(report)
+        
+        # Each block is one template; every line after the header starts
+        # with its own newline, so no final join is needed
+        buf = io.StringIO()
+        buf.write(f"Hotel Report: {report.report_type.value}\n"
+                  f"Hotel ID: {report.hotel_id}\n"
+                  f"Generated: {report.generated_at}\n"
+                  f"{'=' * 50}")
+        
+        renderer = self._text_renderers.get(report.report_type)
+        if renderer:
+            renderer(report.data, buf)
             
         # Add summary section
-        output.append("\nSUMMARY:")
-        for key, value in report.summary.items():
-            output.append(f"  {key}: {value}")
+        buf.write("\n\nSUMMARY:")
+        buf.writelines(f"\n  {key}: {value}" for key, value in report.summary.items())
             
-        return "\n".join(output)
+        return buf.getvalue()
+    
+    def _render_daily_status_text(self, data: Dict[str, Any], buf: io.StringIO) -> None:
+        """Write the daily status section of a text report"""
+        buf.write(f"\nDAILY STATUS REPORT"
+                  f"\nHotel: {data['hotel_info']['name']}"
+                  f"\nDate: {data['date']}"
+                  f"\n\nRoom Status:")
+        buf.writelines(f"\n  {status}: {count}" for status, count in data['room_status'].items())
+        
+        buf.write("\n\nReservation Status:")
+        buf.writelines(f"\n  {key}: {value}" for key, value in data['reservation_stats'].items())
+        
+        buf.write("\n\nHousekeeping Status:")
+        buf.writelines(f"\n  {status}: {count}" for status, count in data['housekeeping_status'].items())
+    
+    def _render_financial_summary_text(self, data: Dict[str, Any], buf: io.StringIO) -> None:
+        """Write the financial summary section of a text report"""
+        buf.write(f"\nFINANCIAL SUMMARY REPORT"
+                  f"\nPeriod: {data['period']['start_date']} to {data['period']['end_date']}"
+                  f"\nTotal Revenue: ${data['total_revenue']:.2f}"
+                  f"\nOccupancy Rate: {data['occupancy_rate']:.1f}%"
+                  f"\nAverage Daily Rate: ${data['average_daily_rate']:.2f}")
+    
+    def _render_occupancy_analysis_text(self, data: Dict[str, Any], buf: io.StringIO) -> None:
+        """Write the occupancy analysis section of a text report"""
+        buf.write(f"\nOCCUPANCY ANALYSIS REPORT"
+                  f"\nPeriod: {data['period']['start_date']} to {data['period']['end_date']}"
+                  f"\nAverage Stay Length: {data['average_stay_length']:.1f} days")
     
     def _display_room_specific_text(self, report: ReportResult) -> str:
         """Display room-specific report in text format"""
@@ -1356,40 +1438,45 @@ class HotelReportingSystem:
         
         return "\n".join(output)
     
+    def _csv_rows(self, report: ReportResult) -> List[list]:
+        """Build all CSV rows for a report so they can be written in one batch"""
+        rows = [
+            [f"Hotel Report: {report.report_type.value}"],
+            [f"Hotel ID: {report.hotel_id}"],
+            [f"Generated: {report.generated_at}"],
+            []
+        ]
+        
+        # Data based on report type
+        if report.report_type == ReportType.DAILY_STATUS:
+            rows += [
+                ["DAILY STATUS REPORT"],
+                ["Hotel", report.data['hotel_info']['name']],
+                ["Date", report.data['date']],
+                [],
+                ["Room Status"],
+                ["Status", "Count"]
+            ]
+            rows += [[status, count] for status, count in report.data['room_status'].items()]
+        
+        # Summary
+        rows += [[], ["SUMMARY"]]
+        rows += [[key, value] for key, value in report.summary.items()]
+        
+        return rows
+    
+    def _write_csv(self, report: ReportResult, out) -> None:
+        """Write a report as CSV to a text stream (file or StringIO)"""
+        csv.writer(out).writerows(self._csv_rows(report))
+    
     def _display_csv_report(self, report: ReportResult) -> str:
         """Display report in CSV format"""
-        import io
         output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([f"Hotel Report: {report.report_type.value}"])
-        writer.writerow([f"Hotel ID: {report.hotel_id}"])
-        writer.writerow([f"Generated: {report.generated_at}"])
-        writer.writerow([])
-        
-        # Write data based on report type
-        if report.report_type == ReportType.DAILY_STATUS:
-            writer.writerow(["DAILY STATUS REPORT"])
-            writer.writerow(["Hotel", report.data['hotel_info']['name']])
-            writer.writerow(["Date", report.data['date']])
-            writer.writerow([])
-            writer.writerow(["Room Status"])
-            writer.writerow(["Status", "Count"])
-            for status, count in report.data['room_status'].items():
-                writer.writerow([status, count])
-        
-        # Add summary
-        writer.writerow([])
-        writer.writerow(["SUMMARY"])
-        for key, value in report.summary.items():
-            writer.writerow([key, value])
-        
+        self._write_csv(report, output)
         return output.getvalue()
     
     def _display_json_report(self, report: ReportResult) -> str:
         """Display report in JSON format"""
-        import json
         report_dict = {
             'report_type': report.report_type.value,
             'hotel_id': report.hotel_id,
@@ -1401,86 +1488,50 @@ class HotelReportingSystem:
     
     def _export_csv_report(self, report: ReportResult, filename: str) -> str:
         """Export report to CSV file"""
-        with open(filename, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Write header
-            writer.writerow([f"Hotel Report: {report.report_type.value}"])
-            writer.writerow([f"Hotel ID: {report.hotel_id}"])
-            writer.writerow([f"Generated: {report.generated_at}"])
-            writer.writerow([])
-            
-            # Write data based on report type
-            if report.report_type == ReportType.DAILY_STATUS:
-                writer.writerow(["DAILY STATUS REPORT"])
-                writer.writerow(["Hotel", report.data['hotel_info']['name']])
-                writer.writerow(["Date", report.data['date']])
-                writer.writerow([])
-                writer.writerow(["Room Status"])
-                writer.writerow(["Status", "Count"])
-                for status, count in report.data['room_status'].items():
-                    writer.writerow([status, count])
-            
-            # Add summary
-            writer.writerow([])
-            writer.writerow(["SUMMARY"])
-            for key, value in report.summary.items():
-                writer.writerow([key, value])
+        with open(filename, 'w', buffering=1 << 20, newline='') as csvfile:
+            self._write_csv(report, csvfile)
         
         return f"Report exported to {filename}"
     
     def _export_json_report(self, report: ReportResult, filename: str) -> str:
         """Export report to JSON file"""
-        import json
-        report_dict = {
-            'report_type': report.report_type.value,
-            'hotel_id': report.hotel_id,
-            'generated_at': report.generated_at,
-            'data': report.data,
-            'summary': report.summary
-        }
-        
+        # Serialize once and write the whole document in a single call;
+        # json.dump() would issue a separate write for every encoded chunk
+        json_text = self._display_json_report(report)
         with open(filename, 'w') as jsonfile:
-            json.dump(report_dict, jsonfile, indent=2)
+            jsonfile.write(json_text)
         
         return f"Report exported to {filename}"
 
 
+# Sample report configurations used by create_sample_reports
+_SAMPLE_REPORTS = (
+    ("DAILY STATUS REPORT", ReportConfig(
+        report_type=ReportType.DAILY_STATUS,
+        time_period=TimePeriod.DAILY,
+        hotel_id=1
+    )),
+    ("FINANCIAL SUMMARY REPORT", ReportConfig(
+        report_type=ReportType.FINANCIAL_SUMMARY,
+        time_period=TimePeriod.MONTHLY,
+        hotel_id=1
+    )),
+    ("OCCUPANCY ANALYSIS REPORT", ReportConfig(
+        report_type=ReportType.OCCUPANCY_ANALYSIS,
+        time_period=TimePeriod.MONTHLY,
+        hotel_id=1
+    )),
+)
+
+
 def create_sample_reports():
     """Create sample reports for demonstration"""
     with HotelReportingSystem() as reporter:
-        # Create daily status report
-        daily_config = ReportConfig(
-            report_type=ReportType.DAILY_STATUS,
-            time_period=TimePeriod.DAILY,
-            hotel_id=1
-        )
-        daily_report = reporter.generate_report(daily_config)
-        print("=== DAILY STATUS REPORT ===")
-        print(reporter.display_report(daily_report, "text"))
-        print()
-        
-        # Create financial summary report
-        financial_config = ReportConfig(
-            report_type=ReportType.FINANCIAL_SUMMARY,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        financial_report = reporter.generate_report(financial_config)
-        print("=== FINANCIAL SUMMARY REPORT ===")
-        print(reporter.display_report(financial_report, "text"))
-        print()
-        
-        # Create occupancy analysis report
-        occupancy_config = ReportConfig(
-            report_type=ReportType.OCCUPANCY_ANALYSIS,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        occupancy_report = reporter.generate_report(occupancy_config)
-        print("=== OCCUPANCY ANALYSIS REPORT ===")
-        print(reporter.display_report(occupancy_report, "text"))
-        print()
+        for title, config in _SAMPLE_REPORTS:
+            report = reporter.generate_report(config)
+            print(f"=== {title} ===")
+            print(reporter.display_report(report, "text"))
+            print()
 
 
 if __name__ == "__main__":
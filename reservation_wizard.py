@@ -4,38 +4,234 @@ Reservation Wizard
 Interactive wizard for creating new hotel reservations
 """
 
+import json
+import os
+import re
 import sys
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional, List, Dict
-from hotel_simulator import HotelSimulator, ReservationSystem, Guest
 from database import HotelDatabase
 
 
+# Set RESWIZ_DEBUG to print full tracebacks when a wizard fails
+_DEBUG = bool(os.environ.get("RESWIZ_DEBUG"))
+
+_NONDIGIT = re.compile(r'\D')
+
+# Rooms of a hotel free over a date range: the anti-join probes each room's
+# reservations through the room_id index instead of building the full set
+# of booked room ids
+_AVAILABLE_ROOMS_SQL = """
+    SELECT r.id, r.room_number, rt.name as room_type, rt.base_price, r.price_per_night
+    FROM rooms r
+    LEFT JOIN room_types rt ON r.room_type_id = rt.id
+    LEFT JOIN reservations res ON res.room_id = r.id
+        AND res.check_in_date <= ? AND res.check_out_date >= ?
+        AND res.status IN ('confirmed', 'checked_in')
+    WHERE r.hotel_id = ?
+    AND r.status = 'available'
+    AND res.id IS NULL
+    ORDER BY CAST(r.room_number AS INTEGER), r.room_number
+"""
+
+# Reservation search on check-in date; the name and hotel filters are
+# ignored when their parameter is NULL
+_SEARCH_SQL = """
+    SELECT r.id as reservation_id, 
+           rm.hotel_id, 
+           r.room_id, 
+           r.guest_id, 
+           r.check_in_date, 
+           r.check_out_date, 
+           r.status,
+           r.total_price,
+           g.first_name, 
+           g.last_name,
+           g.phone,
+           h.name as hotel_name,
+           rm.room_number,
+           rt.name as room_type
+    FROM reservations r
+    LEFT JOIN guests g ON r.guest_id = g.id
+    LEFT JOIN rooms rm ON r.room_id = rm.id
+    LEFT JOIN hotel h ON rm.hotel_id = h.id
+    LEFT JOIN room_types rt ON rm.room_type_id = rt.id
+    WHERE r.status IN ('confirmed', 'checked_in')
+    AND (:first_name IS NULL OR g.first_name LIKE :first_name)
+    AND (:last_name IS NULL OR g.last_name LIKE :last_name)
+    AND r.check_in_date = :search_date
+    AND (:hotel_id IS NULL OR rm.hotel_id = :hotel_id)
+    ORDER BY r.check_in_date, h.name, g.last_name, g.first_name
+    LIMIT :limit
+"""
+
+# Bulk reservation load: one prepared INSERT / UPDATE reused for every row
+_BULK_RESERVATION_SQL = """
+    INSERT INTO reservations
+    (room_id, guest_id, check_in_date, check_out_date, status, total_price)
+    VALUES (:room_id, :guest_id, :check_in, :check_out, :status, :total_price)
+"""
+_BULK_ROOM_STATUS_SQL = "UPDATE rooms SET status = :room_status WHERE id = :room_id"
+
+# Fields every bulk reservation row must supply
+_BULK_ROW_FIELDS = ('room_id', 'guest_id', 'check_in', 'check_out', 'total_price')
+
+# Longest stay and furthest check-in the create wizard (and a bulk load) accepts
+_MAX_STAY_NIGHTS = 365
+_MAX_BOOKING_AHEAD_DAYS = 730
+
+# Most search results listed; unfiltered searches (no name, all hotels)
+# get a smaller page
+_SEARCH_LIMIT = 1000
+_UNFILTERED_SEARCH_LIMIT = 200
+
+
+def _parse_bulk_row(row, today: date) -> Dict:
+    """Check one bulk reservation row and return its insert parameters
+    
+    Dates are returned as YYYY-MM-DD, so the availability query compares
+    them correctly whatever ISO form the row used.
+    
+    Raises:
+        ValueError: Saying what is wrong with the row
+    """
+    if not isinstance(row, dict):
+        raise ValueError("not an object")
+    missing = [field for field in _BULK_ROW_FIELDS if row.get(field) is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    for field in ('room_id', 'guest_id'):
+        if type(row[field]) is not int:
+            raise ValueError(f"{field} must be an integer")
+    if type(row['total_price']) not in (int, float):
+        raise ValueError("total_price must be a number")
+    try:
+        check_in = date.fromisoformat(row['check_in'])
+        check_out = date.fromisoformat(row['check_out'])
+    except (TypeError, ValueError):
+        raise ValueError("dates must use YYYY-MM-DD format")
+    if check_out <= check_in:
+        raise ValueError("check_out must be after check_in")
+    if (check_out - check_in).days > _MAX_STAY_NIGHTS:
+        raise ValueError(f"stay exceeds {_MAX_STAY_NIGHTS} nights")
+    if (check_in - today).days > _MAX_BOOKING_AHEAD_DAYS:
+        raise ValueError(f"check_in is more than {_MAX_BOOKING_AHEAD_DAYS} days ahead")
+    return {'room_id': row['room_id'], 'guest_id': row['guest_id'],
+            'check_in': check_in.isoformat(), 'check_out': check_out.isoformat(),
+            'total_price': row['total_price']}
+
+
+def _banner(title: str) -> str:
+    """Section banner: a title between two rules, as printed lines"""
+    return f"\n{'=' * 60}\n{title}\n{'=' * 60}\n"
+
+
+# Screen text that never changes, built once at import
+_CREATE_INTRO = (_banner("CREATE RESERVATION WIZARD")
+                 + "\nPlease enter the reservation information.\n"
+                 + "(Required fields are marked with *)\n")
+_HOTEL_HEADER = _banner("HOTEL INFORMATION")
+_GUEST_HEADER = _banner("GUEST INFORMATION")
+_DATES_HEADER = _banner("RESERVATION DATES")
+_ROOM_HEADER = _banner("ROOM SELECTION")
+_SUMMARY_HEADER = _banner("RESERVATION SUMMARY")
+_SEARCH_INTRO = (_banner("SEARCH RESERVATIONS WIZARD")
+                 + "\nSearch for existing reservations.\n"
+                 + "Leave fields blank to skip that search criterion.\n"
+                 + "Name search uses 'contains' logic (partial matches).\n"
+                 + "Use '*' for hotel_id to search all hotels.\n"
+                 + "Date defaults to today if not specified.\n\n")
+_RESULTS_HEADER = _banner("SEARCH RESULTS")
+_MENU_BANNER = (_banner("RESERVATION WIZARD MENU")
+                + "\n1. Create New Reservation\n"
+                + "2. Search Reservations\n"
+                + "3. Exit\n\n")
+
+
 class ReservationWizard:
     """Interactive wizard for creating hotel reservations"""
     
     def __init__(self, db_path: str = 'hotel.db'):
         """Initialize the reservation wizard"""
-        self.sim = HotelSimulator(db_path)
+        # One connection shared by the simulator, the reservation system and
+        # the wizard's own queries, so a guest and their reservation can be
+        # committed together and reads never wait on a second connection.
+        # The simulator side is only imported when a reservation is made,
+        # so searching doesn't pay for it (see the sim/res_system properties)
         self.db = HotelDatabase(db_path)
-        self.res_system = ReservationSystem(self.db)
+        self._sim = None
+        self._res_system = None
+        
+        # Interactive use mixes short writes with reads of the same tables:
+        # in the WAL mode HotelDatabase sets, synchronous=NORMAL skips the
+        # per-commit fsync, and reads are served from memory where possible
+        self.db.conn.executescript("""
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -20000;
+            PRAGMA mmap_size = 268435456;
+        """)
+        # Hotel id -> row, loaded on first use; hotels are not created or
+        # deleted from within the wizard, so one load per session is enough
+        # (an empty result is re-queried in case a hotel was added meanwhile)
+        self._hotels_cache = None
+    
+    @property
+    def sim(self):
+        """Hotel simulator sharing the wizard's connection, created on first use"""
+        if self._sim is None:
+            from hotel_simulator import HotelSimulator
+            self._sim = HotelSimulator(db=self.db)
+        return self._sim
+    
+    @property
+    def res_system(self):
+        """Reservation system sharing the wizard's connection, created on first use"""
+        if self._res_system is None:
+            from hotel_simulator import ReservationSystem
+            self._res_system = ReservationSystem(self.db)
+        return self._res_system
+    
+    def _get_hotels(self) -> Dict[int, Dict]:
+        """Get all hotels keyed by id, in name order"""
+        if not self._hotels_cache:
+            hotels = self.db.execute_query("SELECT id, name, address FROM hotel ORDER BY name", fetch=True)
+            self._hotels_cache = {hotel['id']: hotel for hotel in hotels}
+        return self._hotels_cache
+    
+    def _prompt(self, message: str, parse=None, *, label: str = None, default=None):
+        """Ask until the answer is valid, instead of abandoning the wizard
+        
+        parse turns the answer into a value or raises ValueError with the
+        reason, which is shown before asking again. A blank answer stands for
+        default (checked like a typed one), or re-asks when a label (the
+        field name) marks the field required.
+        """
+        while True:
+            value = input(message).strip()
+            if not value:
+                if default is not None:
+                    value = default
+                elif label:
+                    print(f"❌ {label} is required!")
+                    continue
+            if parse is None or not value:
+                return value
+            try:
+                return parse(value)
+            except ValueError as e:
+                print(f"❌ {e}")
     
     def create_reservation_wizard(self) -> Optional[Dict]:
         """Interactive wizard to create a new reservation"""
-        print("\n" + "=" * 60)
-        print("CREATE RESERVATION WIZARD")
-        print("=" * 60)
-        print("\nPlease enter the reservation information.")
-        print("(Required fields are marked with *)")
+        sys.stdout.write(_CREATE_INTRO)
         
         try:
             # Step 1: Hotel Selection
-            print("\n" + "=" * 60)
-            print("HOTEL INFORMATION")
-            print("=" * 60)
+            sys.stdout.write(_HOTEL_HEADER)
             
             # List available hotels
-            hotels = self.db.execute_query("SELECT id, name, address FROM hotel ORDER BY name", fetch=True)
+            hotels = self._get_hotels()
             
             if not hotels:
                 print("❌ No hotels available in the system!")
@@ -43,115 +239,93 @@ class ReservationWizard:
                 return None
             
             print("Available Hotels:")
-            for hotel in hotels:
+            for hotel in hotels.values():
                 address_display = f" - {hotel['address']}" if hotel['address'] else ""
                 print(f"  [{hotel['id']}] {hotel['name']}{address_display}")
             
-            hotel_id_input = input("\n* Hotel ID: ").strip()
-            if not hotel_id_input:
-                print("❌ Hotel ID is required!")
-                return None
-            
-            try:
-                hotel_id = int(hotel_id_input)
+            def parse_hotel_id(value):
+                try:
+                    hotel_id = int(value)
+                except ValueError:
+                    raise ValueError("Invalid hotel ID. Please enter a valid number.")
                 # Verify hotel exists
-                hotel = self.db.get_hotel_info(hotel_id)
-                if not hotel:
-                    print(f"❌ Hotel with ID {hotel_id} not found!")
-                    return None
-            except ValueError:
-                print("❌ Invalid hotel ID. Please enter a valid number.")
-                return None
+                if hotel_id not in hotels:
+                    raise ValueError(f"Hotel with ID {hotel_id} not found!")
+                return hotel_id
             
-            # Step 2: Guest Information
-            print("\n" + "=" * 60)
-            print("GUEST INFORMATION")
-            print("=" * 60)
+            hotel_id = self._prompt("\n* Hotel ID: ", parse_hotel_id, label="Hotel ID")
+            hotel = hotels[hotel_id]
             
-            first_name = input("* First Name: ").strip()
-            if not first_name:
-                print("❌ First name is required!")
-                return None
+            # Step 2: Guest Information
+            sys.stdout.write(_GUEST_HEADER)
             
-            last_name = input("* Last Name: ").strip()
-            if not last_name:
-                print("❌ Last name is required!")
-                return None
+            first_name = self._prompt("* First Name: ", label="First name")
+            last_name = self._prompt("* Last Name: ", label="Last name")
             
-            phone = input("* Phone Number (10-digit, e.g., 555-123-4567): ").strip()
-            if not phone:
-                print("❌ Phone number is required!")
-                return None
+            def parse_phone(value):
+                # Validate phone format
+                digits = _NONDIGIT.sub('', value)
+                if len(digits) != 10:
+                    print(f"⚠️  Warning: Phone should be 10 digits (got {len(digits)})")
+                    confirm = input("Continue anyway? (y/n): ").strip().lower()
+                    if confirm != 'y':
+                        raise ValueError("Please re-enter the phone number.")
+                return value
             
-            # Validate phone format
-            digits = ''.join(c for c in phone if c.isdigit())
-            if len(digits) != 10:
-                print(f"⚠️  Warning: Phone should be 10 digits (got {len(digits)})")
-                confirm = input("Continue anyway? (y/n): ").strip().lower()
-                if confirm != 'y':
-                    return None
+            phone = self._prompt("* Phone Number (10-digit, e.g., 555-123-4567): ", parse_phone,
+                                 label="Phone number")
             
             # Optional guest information
-            email = input("Email Address (optional): ").strip()
-            address = input("Address (optional): ").strip()
+            email = self._prompt("Email Address (optional): ")
+            address = self._prompt("Address (optional): ")
             
             # Step 3: Reservation Dates
-            print("\n" + "=" * 60)
-            print("RESERVATION DATES")
-            print("=" * 60)
+            sys.stdout.write(_DATES_HEADER)
             
-            today = datetime.now().date()
+            today = date.today()
             tomorrow = today + timedelta(days=1)
             
-            check_in_input = input(f"* Check-in Date (YYYY-MM-DD, default today {today}): ").strip()
-            if check_in_input:
+            def parse_date(value):
                 try:
-                    check_in_date = datetime.strptime(check_in_input, '%Y-%m-%d').date()
-                    if check_in_date < today:
-                        print("⚠️  Warning: Check-in date is in the past!")
-                        confirm = input("Continue anyway? (y/n): ").strip().lower()
-                        if confirm != 'y':
-                            return None
+                    return date.fromisoformat(value)
                 except ValueError:
-                    print(f"❌ Invalid date format: {check_in_input}")
-                    print("Please use YYYY-MM-DD format.")
-                    return None
-            else:
-                check_in_date = today
-            
-            check_out_input = input(f"* Check-out Date (YYYY-MM-DD, default tomorrow {tomorrow}): ").strip()
-            if check_out_input:
-                try:
-                    check_out_date = datetime.strptime(check_out_input, '%Y-%m-%d').date()
-                    if check_out_date <= check_in_date:
-                        print("❌ Check-out date must be after check-in date!")
-                        return None
-                except ValueError:
-                    print(f"❌ Invalid date format: {check_out_input}")
-                    print("Please use YYYY-MM-DD format.")
-                    return None
-            else:
-                check_out_date = tomorrow
+                    raise ValueError(f"Invalid date format: {value}. Please use YYYY-MM-DD format.")
+            
+            def parse_check_in(value):
+                check_in_date = parse_date(value)
+                # Reject absurd dates before running the availability query
+                if (check_in_date - today).days > _MAX_BOOKING_AHEAD_DAYS:
+                    raise ValueError(f"Check-in date is more than {_MAX_BOOKING_AHEAD_DAYS} days ahead!")
+                if check_in_date < today:
+                    print("⚠️  Warning: Check-in date is in the past!")
+                    confirm = input("Continue anyway? (y/n): ").strip().lower()
+                    if confirm != 'y':
+                        raise ValueError("Please enter another check-in date.")
+                return check_in_date
+            
+            def parse_check_out(value):
+                check_out_date = parse_date(value)
+                if check_out_date <= check_in_date:
+                    raise ValueError("Check-out date must be after check-in date!")
+                if (check_out_date - check_in_date).days > _MAX_STAY_NIGHTS:
+                    raise ValueError(f"Stay exceeds {_MAX_STAY_NIGHTS} nights!")
+                return check_out_date
+            
+            check_in_date = self._prompt(f"* Check-in Date (YYYY-MM-DD, default today {today}): ",
+                                         parse_check_in, default=today.isoformat())
+            check_out_date = self._prompt(f"* Check-out Date (YYYY-MM-DD, default tomorrow {tomorrow}): ",
+                                          parse_check_out, default=tomorrow.isoformat())
+            
+            # Formatted once; reused for the query, summary and result
+            check_in_str = check_in_date.isoformat()
+            check_out_str = check_out_date.isoformat()
             
             # Step 4: Room Selection
-            print("\n" + "=" * 60)
-            print("ROOM SELECTION")
-            print("=" * 60)
+            sys.stdout.write(_ROOM_HEADER)
             
             # Find available rooms for the selected hotel and dates
-            available_rooms = self.db.execute_query("""
-                SELECT r.id, r.room_number, rt.name as room_type, rt.base_price, r.price_per_night
-                FROM rooms r
-                LEFT JOIN room_types rt ON r.room_type_id = rt.id
-                WHERE r.hotel_id = ?
-                AND r.status = 'available'
-                AND r.id NOT IN (
-                    SELECT room_id FROM reservations 
-                    WHERE (check_in_date <= ? AND check_out_date >= ?)
-                    AND status IN ('confirmed', 'checked_in')
-                )
-                ORDER BY r.room_number
-            """, (hotel_id, check_out_date.strftime('%Y-%m-%d'), check_in_date.strftime('%Y-%m-%d')), fetch=True)
+            available_rooms = self.db.execute_query(
+                _AVAILABLE_ROOMS_SQL, (check_out_str, check_in_str, hotel_id), fetch=True)
             
             if not available_rooms:
                 print(f"❌ No available rooms found for {hotel['name']} from {check_in_date} to {check_out_date}")
@@ -162,26 +336,20 @@ class ReservationWizard:
                 price = room['price_per_night'] if room['price_per_night'] else room['base_price']
                 print(f"  [{i}] Room {room['room_number']} - {room['room_type']} (${price:.2f}/night)")
             
-            room_choice = input(f"\n* Select room number (1-{len(available_rooms)}): ").strip()
-            if not room_choice:
-                print("❌ Room selection is required!")
-                return None
+            def parse_room_choice(value):
+                try:
+                    room_index = int(value) - 1
+                except ValueError:
+                    raise ValueError("Invalid input. Please enter a valid number.")
+                if not 0 <= room_index < len(available_rooms):
+                    raise ValueError(f"Invalid room selection. Please enter a number between 1 and {len(available_rooms)}.")
+                return available_rooms[room_index]
             
-            try:
-                room_index = int(room_choice) - 1
-                if 0 <= room_index < len(available_rooms):
-                    selected_room = available_rooms[room_index]
-                else:
-                    print(f"❌ Invalid room selection. Please enter a number between 1 and {len(available_rooms)}.")
-                    return None
-            except ValueError:
-                print("❌ Invalid input. Please enter a valid number.")
-                return None
+            selected_room = self._prompt(f"\n* Select room number (1-{len(available_rooms)}): ",
+                                         parse_room_choice, label="Room selection")
             
             # Step 5: Confirmation
-            print("\n" + "=" * 60)
-            print("RESERVATION SUMMARY")
-            print("=" * 60)
+            sys.stdout.write(_SUMMARY_HEADER)
             
             guest_name = f"{first_name} {last_name}"
             room_info = f"Room {selected_room['room_number']} ({selected_room['room_type']})"
@@ -198,8 +366,8 @@ class ReservationWizard:
                 print(f"Address:    {address}")
             print(f"Room:       {room_info}")
             print(f"Price:      ${price_per_night:.2f}/night")
-            print(f"Check-in:   {check_in_date.strftime('%Y-%m-%d')}")
-            print(f"Check-out:  {check_out_date.strftime('%Y-%m-%d')}")
+            print(f"Check-in:   {check_in_str}")
+            print(f"Check-out:  {check_out_str}")
             print(f"Nights:     {nights}")
             print(f"Estimated Total: ${estimated_total:.2f}")
             
@@ -210,40 +378,24 @@ class ReservationWizard:
                 print("❌ Reservation creation cancelled.")
                 return None
             
-            # Create the guest first
-            guest = self.sim.create_guest(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                phone=phone,
-                address=address
-            )
-            
-            # Get the room object
-            room = self.sim.get_room_by_id(selected_room['id'])
-            
-            # Create the reservation
-            reservation = self.res_system.create_reservation(
-                hotel_sim=self.sim,
-                guest=guest,
-                room=room,
-                check_in=check_in_date.strftime('%Y-%m-%d'),
-                check_out=check_out_date.strftime('%Y-%m-%d')
+            guest, room, reservation = self._commit_reservation(
+                first_name, last_name, email, phone, address,
+                selected_room['id'], check_in_str, check_out_str
             )
             
             print("\n✅ Reservation created successfully!")
             print(f"Reservation ID: {reservation.id}")
             print(f"Guest ID: {guest.id}")
             print(f"Confirmation: {guest_name} at {hotel['name']}")
-            print(f"Dates: {check_in_date.strftime('%Y-%m-%d')} to {check_out_date.strftime('%Y-%m-%d')}")
+            print(f"Dates: {check_in_str} to {check_out_str}")
             
             return {
                 'reservation_id': reservation.id,
                 'guest_id': guest.id,
                 'hotel_id': hotel_id,
                 'room_id': room.id,
-                'check_in': check_in_date.strftime('%Y-%m-%d'),
-                'check_out': check_out_date.strftime('%Y-%m-%d'),
+                'check_in': check_in_str,
+                'check_out': check_out_str,
                 'total_price': reservation.total_price
             }
             
@@ -252,20 +404,131 @@ class ReservationWizard:
             return None
         except Exception as e:
             print(f"\n❌ Error creating reservation: {e}")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
             return None
     
+    def _commit_reservation(self, first_name: str, last_name: str, email: str, phone: str,
+                            address: str, room_id: int, check_in: str, check_out: str) -> tuple:
+        """Create the guest and their reservation in a single transaction
+        
+        One commit (and one fsync) covers the guest insert, the reservation
+        insert and the room status update; any failure rolls back all three.
+        """
+        with self.db.conn:
+            # Create the guest first
+            guest = self.sim.create_guest(
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                phone=phone,
+                address=address,
+                commit=False
+            )
+            
+            # Get the room object
+            room = self.sim.get_room_by_id(room_id)
+            
+            # Create the reservation
+            reservation = self.res_system.create_reservation(
+                hotel_sim=self.sim,
+                guest=guest,
+                room=room,
+                check_in=check_in,
+                check_out=check_out,
+                commit=False
+            )
+        
+        return guest, room, reservation
+    
+    def create_reservations_bulk(self, rows: List[Dict]) -> int:
+        """Create many reservations in a single transaction
+        
+        Each row needs room_id, guest_id, check_in, check_out (YYYY-MM-DD)
+        and total_price. Reservations are confirmed and their rooms marked
+        reserved, as for a single reservation. Returns the number created.
+        
+        Raises:
+            ValueError: Listing every row that is malformed, names an unknown
+                guest or room, or asks for a room that cannot be booked for
+                its dates (see _bulk_row_problems); nothing is created then
+        """
+        from hotel_simulator import ReservationStatus, RoomStatus
+        
+        if not isinstance(rows, list):
+            raise ValueError("expected a list of reservation rows")
+        
+        # Rows are checked inside the write transaction, so no reservation
+        # can be made for the same rooms between the check and the inserts
+        with self.db.transaction() as conn:
+            params, problems = self._bulk_row_problems(conn, rows)
+            if problems:
+                raise ValueError("; ".join(
+                    f"row {i + 1}: {problem}" for i, problem in sorted(problems.items())))
+            for row in params:
+                row['status'] = ReservationStatus.CONFIRMED.value
+                row['room_status'] = RoomStatus.RESERVED.value
+            conn.executemany(_BULK_RESERVATION_SQL, params)
+            conn.executemany(_BULK_ROOM_STATUS_SQL, params)
+        return len(params)
+    
+    def _bulk_row_problems(self, conn, rows: list) -> tuple:
+        """Validate bulk rows against their format and the database
+        
+        Each row is first checked on its own (_parse_bulk_row); the rest must
+        name an existing guest and a room that is in _AVAILABLE_ROOMS_SQL for
+        its hotel and dates. Each room can take one row per load, since the
+        first reservation marks it reserved, just as creating the
+        reservations one by one would.
+        
+        Returns:
+            Tuple of (insert parameters of the valid rows, row index -> problem)
+        """
+        today = date.today()
+        parsed = []
+        problems = {}
+        for i, row in enumerate(rows):
+            try:
+                parsed.append((i, _parse_bulk_row(row, today)))
+            except ValueError as e:
+                problems[i] = str(e)
+        
+        guest_ids = json.dumps(sorted({row['guest_id'] for _, row in parsed}))
+        known_guests = {guest[0] for guest in conn.execute(
+            "SELECT id FROM guests WHERE id IN (SELECT value FROM json_each(?))",
+            (guest_ids,))}
+        room_ids = json.dumps(sorted({row['room_id'] for _, row in parsed}))
+        hotel_by_room = dict(conn.execute(
+            "SELECT id, hotel_id FROM rooms WHERE id IN (SELECT value FROM json_each(?))",
+            (room_ids,)))
+        
+        # Available room ids per (hotel, check-in, check-out)
+        available = {}
+        booked = set()
+        for i, row in parsed:
+            room_id = row['room_id']
+            hotel_id = hotel_by_room.get(room_id)
+            if row['guest_id'] not in known_guests:
+                problems[i] = f"unknown guest {row['guest_id']}"
+                continue
+            if hotel_id is None:
+                problems[i] = f"unknown room {room_id}"
+                continue
+            key = (hotel_id, row['check_in'], row['check_out'])
+            if key not in available:
+                available[key] = {room[0] for room in conn.execute(
+                    _AVAILABLE_ROOMS_SQL, (row['check_out'], row['check_in'], hotel_id))}
+            if room_id in booked or room_id not in available[key]:
+                problems[i] = (f"room {room_id} is not available "
+                               f"from {row['check_in']} to {row['check_out']}")
+            booked.add(room_id)
+        
+        return [row for _, row in parsed], problems
+    
     def search_reservations_wizard(self) -> List[Dict]:
         """Interactive wizard to search for existing reservations"""
-        print("\n" + "=" * 60)
-        print("SEARCH RESERVATIONS WIZARD")
-        print("=" * 60)
-        print("\nSearch for existing reservations.")
-        print("Leave fields blank to skip that search criterion.")
-        print("Name search uses 'contains' logic (partial matches).")
-        print("Use '*' for hotel_id to search all hotels.")
-        print("Date defaults to today if not specified.\n")
+        sys.stdout.write(_SEARCH_INTRO)
         
         try:
             # Get search criteria
@@ -275,20 +538,23 @@ class ReservationWizard:
             first_name = input("First Name (partial match): ").strip()
             last_name = input("Last Name (partial match): ").strip()
             
-            date_input = input(f"Date (YYYY-MM-DD, default today {datetime.now().strftime('%Y-%m-%d')}): ").strip()
+            today = date.today()
+            date_input = input(f"Date (YYYY-MM-DD, default today {today}): ").strip()
             
             hotel_input = input("Hotel ID (number or '*' for all): ").strip()
             
             # Parse date - default to today
             if date_input:
                 try:
-                    search_date = datetime.strptime(date_input, '%Y-%m-%d').date()
+                    search_date = date.fromisoformat(date_input)
                 except ValueError:
                     print(f"⚠️  Invalid date format: {date_input}")
-                    print(f"📅 Using today's date: {datetime.now().strftime('%Y-%m-%d')}")
-                    search_date = datetime.now().date()
+                    print(f"📅 Using today's date: {today}")
+                    search_date = today
             else:
-                search_date = datetime.now().date()
+                search_date = today
+            
+            search_date_str = search_date.isoformat()
             
             # Parse hotel ID
             if hotel_input == '*':
@@ -303,84 +569,53 @@ class ReservationWizard:
             else:
                 hotel_id = None  # Default to search all hotels
             
-            # Build search query
-            query = """
-                SELECT r.id as reservation_id, 
-                       rm.hotel_id, 
-                       r.room_id, 
-                       r.guest_id, 
-                       r.check_in_date, 
-                       r.check_out_date, 
-                       r.status,
-                       r.total_price,
-                       g.first_name, 
-                       g.last_name,
-                       g.phone,
-                       h.name as hotel_name,
-                       rm.room_number,
-                       rt.name as room_type
-                FROM reservations r
-                LEFT JOIN guests g ON r.guest_id = g.id
-                LEFT JOIN rooms rm ON r.room_id = rm.id
-                LEFT JOIN hotel h ON rm.hotel_id = h.id
-                LEFT JOIN room_types rt ON rm.room_type_id = rt.id
-                WHERE r.status IN ('confirmed', 'checked_in')
-            """
-            
-            params = []
-            
-            # Add name conditions
-            if first_name:
-                query += " AND g.first_name LIKE ?"
-                params.append(f"%{first_name}%")
-            
-            if last_name:
-                query += " AND g.last_name LIKE ?"
-                params.append(f"%{last_name}%")
-            
-            # Add date condition (check-in date)
-            query += " AND r.check_in_date = ?"
-            params.append(search_date.strftime('%Y-%m-%d'))
-            
-            # Add hotel condition
-            if hotel_id is not None:
-                query += " AND rm.hotel_id = ?"
-                params.append(hotel_id)
-            
-            query += " ORDER BY r.check_in_date, h.name, g.last_name, g.first_name"
-            
-            # Execute search
-            results = self.db.execute_query(query, tuple(params), fetch=True)
+            unfiltered = not first_name and not last_name and hotel_id is None
+            limit = _UNFILTERED_SEARCH_LIMIT if unfiltered else _SEARCH_LIMIT
+            
+            # Execute search: skipped criteria are bound as NULL, so every
+            # search shares one SQL text and one cached prepared statement
+            results = self.db.execute_query(_SEARCH_SQL, {
+                'first_name': f"%{first_name}%" if first_name else None,
+                'last_name': f"%{last_name}%" if last_name else None,
+                'search_date': search_date_str,
+                'hotel_id': hotel_id,
+                'limit': limit
+            }, fetch=True)
             
             # Display results
-            print("\n" + "=" * 60)
-            print("SEARCH RESULTS")
-            print("=" * 60)
+            sys.stdout.write(_RESULTS_HEADER)
             
             if not results:
-                print(f"\n❌ No reservations found for {search_date.strftime('%Y-%m-%d')}")
+                print(f"\n❌ No reservations found for {search_date_str}")
                 if first_name or last_name:
                     print(f"   matching name criteria")
                 if hotel_id is not None:
                     print(f"   in hotel {hotel_id}")
                 return []
             
-            print(f"\n✅ Found {len(results)} reservation(s) for {search_date.strftime('%Y-%m-%d')}:")
+            print(f"\n✅ Found {len(results)} reservation(s) for {search_date_str}:")
+            if len(results) == limit:
+                print(f"   (showing the first {limit}; add a name or hotel ID to narrow the search)")
             
+            # One block per reservation, written to stdout in a single call
+            blocks = []
             for i, reservation in enumerate(results, 1):
                 guest_name = f"{reservation['first_name']} {reservation['last_name']}" if reservation['first_name'] else "(Unknown Guest)"
                 hotel_info = f"{reservation['hotel_name']} (ID: {reservation['hotel_id']})" if reservation['hotel_name'] else f"Hotel ID: {reservation['hotel_id']}"
                 room_info = f"Room {reservation['room_number']} ({reservation['room_type']})" if reservation['room_number'] else f"Room ID: {reservation['room_id']}"
                 
-                print(f"\n[{i}] Reservation ID: {reservation['reservation_id']}")
-                print(f"    Guest:      {guest_name}")
-                print(f"    Phone:      {reservation['phone']}")
-                print(f"    Hotel:      {hotel_info}")
-                print(f"    Room:       {room_info}")
-                print(f"    Check-in:   {reservation['check_in_date']}")
-                print(f"    Check-out:  {reservation['check_out_date']}")
-                print(f"    Status:     {reservation['status']}")
-                print(f"    Total:      ${reservation['total_price']:.2f}")
+                blocks.append(
+                    f"\n[{i}] Reservation ID: {reservation['reservation_id']}\n"
+                    f"    Guest:      {guest_name}\n"
+                    f"    Phone:      {reservation['phone']}\n"
+                    f"    Hotel:      {hotel_info}\n"
+                    f"    Room:       {room_info}\n"
+                    f"    Check-in:   {reservation['check_in_date']}\n"
+                    f"    Check-out:  {reservation['check_out_date']}\n"
+                    f"    Status:     {reservation['status']}\n"
+                    f"    Total:      ${reservation['total_price']:.2f}"
+                )
+            sys.stdout.write("\n".join(blocks) + "\n")
             
             return results
             
@@ -389,20 +624,15 @@ class ReservationWizard:
             return []
         except Exception as e:
             print(f"\n❌ Error searching reservations: {e}")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
             return []
     
     def main_menu(self):
         """Main menu for reservation wizard"""
         while True:
-            print("\n" + "=" * 60)
-            print("RESERVATION WIZARD MENU")
-            print("=" * 60)
-            print("\n1. Create New Reservation")
-            print("2. Search Reservations")
-            print("3. Exit")
-            print()
+            sys.stdout.write(_MENU_BANNER)
             
             choice = input("Select an option (1-3): ").strip()
             
@@ -426,13 +656,24 @@ def main():
         elif sys.argv[1] == 'search':
             wizard = ReservationWizard()
             wizard.search_reservations_wizard()
+        elif sys.argv[1] == 'bulk' and len(sys.argv) > 2:
+            wizard = ReservationWizard()
+            try:
+                with open(sys.argv[2]) as f:
+                    rows = json.load(f)
+                count = wizard.create_reservations_bulk(rows)
+            except (OSError, ValueError) as e:
+                print(f"❌ No reservations created: {e}")
+                sys.exit(1)
+            print(f"✅ Created {count} reservation(s) from {sys.argv[2]}")
         elif sys.argv[1] == 'menu':
             wizard = ReservationWizard()
             wizard.main_menu()
         else:
-            print("Usage: python3 reservation_wizard.py [create|search|menu]")
+            print("Usage: python3 reservation_wizard.py [create|search|bulk <file.json>|menu]")
             print("  create  - Run the create reservation wizard")
             print("  search  - Run the search reservations wizard")
+            print("  bulk    - Create reservations from a JSON list of objects")
             print("  menu    - Show interactive menu")
             sys.exit(1)
     else:
@@ -4,20 +4,105 @@ Hotel Simulator - Simulation Engine
 Implements time-based simulation with random events and statistical analysis
 """
 
+import csv
+import dataclasses
 import random
 import datetime
 import time
 import sys
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import io
+from typing import List, Dict, Any, Optional, Tuple, TextIO, Set
 from dataclasses import dataclass
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+import math
+import pickle
 import statistics
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from hotel_simulator import HotelSimulator, ReservationSystem, HotelReporter, Guest, Room
 from database import HotelDatabase
+from compat import DATACLASS_SLOTS
+
+
+# Guest names for simulation - expanded list
+_US_FIRST_NAMES = (
+    'John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Jennifer',
+    'William', 'Lisa', 'Thomas', 'Jessica', 'Daniel', 'Amanda', 'Christopher', 'Melissa',
+    'Matthew', 'Nicole', 'Andrew', 'Stephanie', 'James', 'Rebecca', 'Joshua', 'Laura',
+    'Kevin', 'Heather', 'Brian', 'Michelle', 'Timothy', 'Christina', 'Jason', 'Elizabeth',
+    'Ryan', 'Katherine', 'Jacob', 'Samantha', 'Gary', 'Ashley', 'Nicholas', 'Megan'
+)
+_US_LAST_NAMES = (
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson',
+    'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson',
+    'Garcia', 'Martinez', 'Robinson', 'Clark', 'Rodriguez', 'Lewis', 'Lee', 'Walker',
+    'Hall', 'Allen', 'Young', 'Hernandez', 'King', 'Wright', 'Lopez', 'Hill'
+)
+
+# Add some international names for diversity
+_INTERNATIONAL_FIRST_NAMES = (
+    'Carlos', 'Maria', 'Wei', 'Li', 'Pierre', 'Sophie', 'Hans', 'Anna',
+    'Yuki', 'Hiro', 'Aisha', 'Mohammed', 'Luca', 'Giovanna', 'Ivan', 'Olga'
+)
+_INTERNATIONAL_LAST_NAMES = (
+    'Gonzalez', 'Rodriguez', 'Wang', 'Zhang', 'Dubois', 'Muller', 'Tanaka', 'Ivanov',
+    'Khan', 'Rossi', 'Silva', 'Kim', 'Patel', 'Nguyen', 'Chen', 'Wong'
+)
+
+# Guest name pools, built once and shared by every booking path
+_FIRST_NAMES = _US_FIRST_NAMES + _INTERNATIONAL_FIRST_NAMES
+_LAST_NAMES = _US_LAST_NAMES + _INTERNATIONAL_LAST_NAMES
+
+
+# "HH:MM" for every minute of the day, indexed by minutes since midnight
+_HHMM = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60))
+
+
+def _bernoulli_indices(n: int, p: float):
+    """Yield the indices in range(n) that each succeed with probability p
+    
+    Jumps straight to the next success by drawing the geometric gap to it,
+    so it costs one random draw per success rather than one per index.
+    """
+    if n <= 0 or p <= 0:
+        return
+    if p >= 1:
+        yield from range(n)
+        return
+    log_q = math.log(1.0 - p)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1.0 - random.random()) / log_q)
+        if i >= n:
+            return
+        yield i
+
+
+@lru_cache(maxsize=None)
+def _minute_range(start: str, end: str) -> Tuple[int, int]:
+    """Convert an ('HH:MM', 'HH:MM') time window to minutes since midnight"""
+    start_h, start_m = map(int, start.split(':'))
+    end_h, end_m = map(int, end.split(':'))
+    return start_h * 60 + start_m, end_h * 60 + end_m
+
+
+@lru_cache(maxsize=None)
+def _psutil_process(pid: int):
+    """psutil handle for a process, or None if psutil isn't installed
+    
+    Keyed by pid so forked sweep workers get a handle on themselves rather
+    than on the parent; psutil is only imported the first time it's needed.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process(pid)
 
 
 @dataclass
@@ -79,6 +164,9 @@ class SimulationConfig:
     check_in_time_range: Tuple[str, str] = ('14:00', '23:00')
     check_out_time_range: Tuple[str, str] = ('07:00', '12:00')
     
+    # Output: write events to this file instead of keeping them in memory
+    event_log_path: Optional[str] = None
+    
     def __post_init__(self):
         """Initialize mutable fields"""
         if self.guest_types is None:
@@ -87,7 +175,7 @@ class SimulationConfig:
             self.payment_methods = ['credit_card', 'cash', 'bank_transfer']
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SimulationEvent:
     """Represents a simulation event"""
     day: int
@@ -118,6 +206,116 @@ class SimulationResults:
     
     def __init__(self):
         self.events = []
+    
+    def iter_events(self):
+        """Iterate over the events, whether held in memory, in an EventLog or in a CsvEventSink"""
+        return iter(self.events)
+
+
+class EventLog:
+    """Append-only file of simulation events
+    
+    Used as SimulationResults.events when SimulationConfig.event_log_path is
+    set, so long simulations don't hold every event in memory: append()
+    pickles the event to the file, and iterating reads them back in order.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._count = 0
+    
+    def append(self, event: SimulationEvent):
+        pickle.dump(event, self._file, pickle.HIGHEST_PROTOCOL)
+        self._count += 1
+    
+    def close(self):
+        """Finish writing; the events can still be read afterwards"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        if self._file is not None:
+            self._file.flush()
+        with open(self.path, 'rb') as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+
+_EVENT_CSV_HEADER = ("Day", "Time", "Event Type", "Description", "Amount", "Guest ID", "Room", "Reservation ID")
+
+
+def _event_csv_row(e: SimulationEvent) -> tuple:
+    """One event as a row under _EVENT_CSV_HEADER"""
+    return (e.day, e.time, e.event_type, e.description, e.amount,
+            e.guest_id or '', e.room_number or '', e.reservation_id or '')
+
+
+def _event_from_csv_row(row: List[str]) -> SimulationEvent:
+    """Rebuild an event from a row written by _event_csv_row"""
+    day, time, event_type, description, amount, guest_id, room_number, reservation_id = row
+    # Amounts read from the database may be whole numbers; keep them as
+    # written so exporting the events again gives the same text
+    amount = float(amount) if '.' in amount or 'e' in amount else int(amount)
+    return SimulationEvent(int(day), time, event_type, description, amount,
+                           int(guest_id) if guest_id else None, room_number or None,
+                           int(reservation_id) if reservation_id else None)
+
+
+class CsvEventSink:
+    """Writes simulation events to CSV as they happen instead of keeping them
+    
+    Used as SimulationResults.events when run_simulation is given an
+    event_sink, so memory stays flat however long the run. The counters
+    generate_detailed_report needs are kept as the events go by; iterating
+    reads the events back from the CSV, like iterating an EventLog.
+    """
+    
+    def __init__(self, f: TextIO):
+        self._file = f
+        self._writer = csv.writer(f, lineterminator='\n')
+        self._writer.writerow(_EVENT_CSV_HEADER)
+        self._count = 0
+        self.event_types = defaultdict(int)
+        self.revenue_by_type = defaultdict(float)
+        self.daily_check_ins = defaultdict(int)
+        self.daily_events = defaultdict(int)
+    
+    def append(self, event: SimulationEvent):
+        self._writer.writerow(_event_csv_row(event))
+        self._count += 1
+        self.event_types[event.event_type] += 1
+        self.revenue_by_type[event.event_type] += event.amount
+        self.daily_check_ins[event.day] += event.event_type == 'check_in'
+        self.daily_events[event.day] += 1
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        self._file.flush()
+        # An in-memory file is read from its buffer, a real one reopened
+        # by name so the caller's write position is left alone
+        if hasattr(self._file, 'getvalue'):
+            source = io.StringIO(self._file.getvalue())
+        else:
+            source = open(self._file.name, newline='')
+        header = list(_EVENT_CSV_HEADER)
+        with source:
+            rows = csv.reader(source)
+            # Skip anything the caller wrote to the file before the events
+            for row in rows:
+                if row == header:
+                    break
+            for row in rows:
+                yield _event_from_csv_row(row)
 
 
 class HotelSimulationEngine:
@@ -127,10 +325,20 @@ class HotelSimulationEngine:
         """Initialize simulation engine"""
         self.hotel_id = hotel_id
         self.db = HotelDatabase(db_path)
-        self.simulator = HotelSimulator(db_path)
+        # Everything shares one connection so each simulated day can be
+        # written as a single transaction (see run_simulation)
+        self.simulator = HotelSimulator(db=self.db)
         self.reservation_system = ReservationSystem(self.db)
         self.reporter = HotelReporter(self.db)
         
+        # The simulation is one writer committing once per day: in the WAL
+        # mode HotelDatabase sets, synchronous=NORMAL avoids an fsync per
+        # commit, and temporary b-trees for sorts and subqueries stay in memory
+        self.db.conn.executescript("""
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+        """)
+        
         # Load configuration
         if config is None:
             try:
@@ -149,13 +357,17 @@ class HotelSimulationEngine:
         if not self.simulator.load_hotel(hotel_id):
             raise ValueError(f"Failed to load hotel {hotel_id}")
     
-    def run_simulation(self, days: int = 30, verbose: bool = True, start_date: str = None) -> SimulationResults:
+    def run_simulation(self, days: int = 30, verbose: bool = True, start_date: str = None,
+                       event_sink: Optional[TextIO] = None) -> SimulationResults:
         """Run simulation for specified number of days
         
         Args:
             days: Number of days to simulate
             verbose: Whether to print progress
             start_date: Optional start date in YYYY-MM-DD format
+            event_sink: Optional text file (opened with newline='') to write
+                events to as CSV while simulating; results.events then keeps
+                only counts (see CsvEventSink)
             
         Returns:
             SimulationResults object with statistics
@@ -164,100 +376,130 @@ class HotelSimulationEngine:
             print(f"Starting Hotel Simulation: {days} days")
             print("=" * 60)
         
-        self.results = SimulationResults()
-        self.results.total_days = days
+        self._begin_run(days, event_sink)
         
-        # Generate guest names for simulation - expanded list
-        first_names = [
-            'John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Jennifer',
-            'William', 'Lisa', 'Thomas', 'Jessica', 'Daniel', 'Amanda', 'Christopher', 'Melissa',
-            'Matthew', 'Nicole', 'Andrew', 'Stephanie', 'James', 'Rebecca', 'Joshua', 'Laura',
-            'Kevin', 'Heather', 'Brian', 'Michelle', 'Timothy', 'Christina', 'Jason', 'Elizabeth',
-            'Ryan', 'Katherine', 'Jacob', 'Samantha', 'Gary', 'Ashley', 'Nicholas', 'Megan'
-        ]
-        last_names = [
-            'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson',
-            'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson',
-            'Garcia', 'Martinez', 'Robinson', 'Clark', 'Rodriguez', 'Lewis', 'Lee', 'Walker',
-            'Hall', 'Allen', 'Young', 'Hernandez', 'King', 'Wright', 'Lopez', 'Hill'
-        ]
-        
-        # Add some international names for diversity
-        international_first_names = [
-            'Carlos', 'Maria', 'Wei', 'Li', 'Pierre', 'Sophie', 'Hans', 'Anna',
-            'Yuki', 'Hiro', 'Aisha', 'Mohammed', 'Luca', 'Giovanna', 'Ivan', 'Olga'
-        ]
-        international_last_names = [
-            'Gonzalez', 'Rodriguez', 'Wang', 'Zhang', 'Dubois', 'Muller', 'Tanaka', 'Ivanov',
-            'Khan', 'Rossi', 'Silva', 'Kim', 'Patel', 'Nguyen', 'Chen', 'Wong'
-        ]
-        
-        # Combine all names
-        all_first_names = first_names + international_first_names
-        all_last_names = last_names + international_last_names
+        # Every simulated date, with its name and YYYY-MM-DD form, worked out
+        # once up front (one strftime pass per format for the whole run)
+        dates = [self.current_date + datetime.timedelta(days=i) for i in range(1, days + 1)]
+        day_names = [d.strftime("%A") for d in dates]
+        date_strs = [d.strftime("%Y-%m-%d") for d in dates]
         
         for day in range(1, days + 1):
-            self.current_date += datetime.timedelta(days=1)
-            day_name = self.current_date.strftime("%A")
-            date_str = self.current_date.strftime("%Y-%m-%d")
+            self.current_date = dates[day - 1]
+            day_name = day_names[day - 1]
+            date_str = date_strs[day - 1]
             
             if verbose:
                 print(f"\n📅 Day {day} ({day_name}, {date_str})")
                 print("-" * 50)
             
+            self._simulate_one_day(day, date_str, verbose)
+        
+        self._finish_run(days)
+        
+        if verbose:
+            print(f"\n" + "=" * 60)
+            print("🎉 SIMULATION COMPLETED")
+            print("=" * 60)
+        
+        return self.results
+    
+    def _begin_run(self, days: int, event_sink: Optional[TextIO] = None) -> None:
+        """Reset results and load the schedule for a run of the given length"""
+        self.results = SimulationResults()
+        self.results.total_days = days
+        # config_loader's SimulationConfig has no event_log_path field
+        event_log_path = getattr(self.config, 'event_log_path', None)
+        if event_sink is not None:
+            self.results.events = CsvEventSink(event_sink)
+        elif event_log_path:
+            self.results.events = EventLog(event_log_path)
+        
+        # Load the schedule once; the day loop reads it from memory
+        self._load_active_reservations()
+        # Rooms aren't added or removed during a simulation
+        self._room_count = self._get_room_count()
+    
+    def _finish_run(self, days: int) -> None:
+        """Average the daily figures once every day of the run has been simulated"""
+        # Calculate average occupancy
+        if days > 0:
+            self.results.occupancy_rate /= days
+        
+        if isinstance(self.results.events, EventLog):
+            self.results.events.close()
+    
+    def _simulate_one_day(self, day: int, date_str: str, verbose: bool) -> None:
+        """Simulate one day of operations on self.current_date (date_str)"""
+        # Bound once: the day below calls these many times
+        events_append = self.results.events.append
+        check_in = self._check_in
+        create_guest = self.simulator.create_guest
+        create_reservation = self._create_reservation
+        random_time = self._random_time
+        cfg = self.config
+        rand = random.random
+        randint = random.randint
+        choice = random.choice
+        room_count = self._room_count
+        
+        # Each day's writes are committed together, and everything it
+        # prints (including the simulator's own messages) is written out
+        # in one go at the end of the day
+        with self._day_output(), self.db.transaction():
             # Calculate target occupancy for this day
-            target_occupancy_pct = random.uniform(self.config.min_occupancy_percent, self.config.max_occupancy_percent)
+            target_occupancy_pct = random.uniform(cfg.min_occupancy_percent, cfg.max_occupancy_percent)
             # Get total rooms from database
             hotel_info = self.db.get_hotel_info(self.hotel_id)
             total_rooms = hotel_info['total_rooms'] if hotel_info else 100
             target_occupied_rooms = int(total_rooms * target_occupancy_pct / 100)
-            
+        
             if verbose:
                 print(f"🎯 Target: {target_occupancy_pct:.1f}% occupancy ({target_occupied_rooms} rooms)")
-            
+        
             # Track daily metrics
             daily_revenue = 0.0
             daily_guests = 0
-            
+        
             # Get current occupancy
             current_occupied = self._get_current_occupancy(date_str)
-            
+        
             # 1. Process scheduled check-ins (for today's date)
             check_ins = self._get_scheduled_check_ins(date_str)
             for res_id, guest_id, room_num in check_ins:
-                if self.reservation_system.check_in(res_id):
+                if check_in(res_id):
                     daily_guests += 1
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time(*self.config.check_in_time_range),
+                        time=random_time(*cfg.check_in_time_range),
                         event_type="check_in",
                         description=f"Guest checked into room {room_num}",
                         guest_id=guest_id,
                         room_number=room_num,
                         reservation_id=res_id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     if verbose:
                         print(f"✅ Check-in: Guest {guest_id} → Room {room_num}")
 
             # 1b. Process overdue check-ins (reservations that should have been checked in on previous days)
             overdue_check_ins = self._get_overdue_check_ins(date_str)
             for res_id, guest_id, room_num in overdue_check_ins:
-                if self.reservation_system.check_in(res_id):
+                if check_in(res_id):
                     daily_guests += 1
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time(*self.config.check_in_time_range),
+                        time=random_time(*cfg.check_in_time_range),
                         event_type="check_in",
                         description=f"Guest checked into room {room_num} (overdue)",
                         guest_id=guest_id,
                         room_number=room_num,
                         reservation_id=res_id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     if verbose:
                         print(f"✅ Check-in: Guest {guest_id} → Room {room_num} (overdue)")
-            
+        
             # 2. Process scheduled check-outs
             check_outs = self._get_scheduled_check_outs(date_str)
             for res_id, guest_id, room_num in check_outs:
@@ -267,7 +509,7 @@ class HotelSimulationEngine:
                     self.results.total_revenue += amount
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time(*self.config.check_out_time_range),
+                        time=random_time(*cfg.check_out_time_range),
                         event_type="check_out",
                         description=f"Guest checked out of room {room_num}",
                         amount=amount,
@@ -275,7 +517,7 @@ class HotelSimulationEngine:
                         room_number=room_num,
                         reservation_id=res_id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     if verbose:
                         print(f"💰 Check-out: Guest {guest_id} ← Room {room_num} (${amount})")
 
@@ -288,7 +530,7 @@ class HotelSimulationEngine:
                     self.results.total_revenue += amount
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time(*self.config.check_out_time_range),
+                        time=random_time(*cfg.check_out_time_range),
                         event_type="check_out",
                         description=f"Guest checked out of room {room_num} (overdue)",
                         amount=amount,
@@ -296,36 +538,41 @@ class HotelSimulationEngine:
                         room_number=room_num,
                         reservation_id=res_id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     if verbose:
                         print(f"💰 Check-out: Guest {guest_id} ← Room {room_num} (${amount}) (overdue)")
+        
+            # Steps 3-7 book from one list of today's available rooms;
+            # each booked room is removed so no later step picks it again
+            available_rooms = self.simulator.find_available_rooms(check_in=date_str)
             
             # 3. Generate new reservations (random events)
-            if random.random() < self.config.new_reservation_probability:
-                available_rooms = self.simulator.find_available_rooms(check_in=date_str)
+            if rand() < cfg.new_reservation_probability:
                 if available_rooms:
-                    room = random.choice(available_rooms)
-                    stay_days = random.randint(*self.config.average_stay_days)
+                    room = choice(available_rooms)
+                    available_rooms.remove(room)
+                    stay_days = randint(*cfg.average_stay_days)
                     check_out = (self.current_date + datetime.timedelta(days=stay_days)).strftime("%Y-%m-%d")
-                    
+                
                     # Create guest with expanded name pool
-                    guest = self.simulator.create_guest(
-                        first_name=random.choice(all_first_names),
-                        last_name=random.choice(all_last_names),
-                        email=f"guest{self.guest_counter}@example.com"
+                    guest = create_guest(
+                        first_name=choice(_FIRST_NAMES),
+                        last_name=choice(_LAST_NAMES),
+                        email=f"guest{self.guest_counter}@example.com",
+                        commit=False
                     )
                     self.guest_counter += 1
                     self.results.total_guests += 1
-                    
+                
                     # Create reservation
-                    reservation = self.reservation_system.create_reservation(
-                        self.simulator, guest, room, date_str, check_out
+                    reservation = create_reservation(
+                        guest, room, date_str, check_out
                     )
                     self.results.total_reservations += 1
-                    
+                
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time('09:00', '18:00'),
+                        time=random_time('09:00', '18:00'),
                         event_type="new_reservation",
                         description=f"New reservation: {guest.first_name} {guest.last_name} → Room {room.room_number}",
                         amount=reservation.total_price,
@@ -333,36 +580,37 @@ class HotelSimulationEngine:
                         room_number=room.room_number,
                         reservation_id=reservation.id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     if verbose:
                         print(f"📝 New Reservation: {guest.first_name} {guest.last_name} → Room {room.room_number} (${reservation.total_price})")
-            
+        
             # 4. Walk-in guests (same-day bookings)
-            if random.random() < self.config.walk_in_probability:
-                available_rooms = self.simulator.find_available_rooms(check_in=date_str)
+            if rand() < cfg.walk_in_probability:
                 if available_rooms:
-                    room = random.choice(available_rooms)
-                    stay_days = random.randint(1, 3)  # Shorter stays for walk-ins
+                    room = choice(available_rooms)
+                    available_rooms.remove(room)
+                    stay_days = randint(1, 3)  # Shorter stays for walk-ins
                     check_out = (self.current_date + datetime.timedelta(days=stay_days)).strftime("%Y-%m-%d")
-                     
+                 
                     # Create guest
-                    guest = self.simulator.create_guest(
-                        first_name=random.choice(all_first_names),
-                        last_name=random.choice(all_last_names),
-                        email=f"walkin{self.guest_counter}@example.com"
+                    guest = create_guest(
+                        first_name=choice(_FIRST_NAMES),
+                        last_name=choice(_LAST_NAMES),
+                        email=f"walkin{self.guest_counter}@example.com",
+                        commit=False
                     )
                     self.guest_counter += 1
                     self.results.total_guests += 1
-                    
+                
                     # Create reservation
-                    reservation = self.reservation_system.create_reservation(
-                        self.simulator, guest, room, date_str, check_out
+                    reservation = create_reservation(
+                        guest, room, date_str, check_out
                     )
                     self.results.total_reservations += 1
-                    
+                
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time('14:00', '20:00'),
+                        time=random_time('14:00', '20:00'),
                         event_type="walk_in_booking",
                         description=f"Walk-in booking: {guest.first_name} {guest.last_name} → Room {room.room_number}",
                         amount=reservation.total_price,
@@ -370,44 +618,46 @@ class HotelSimulationEngine:
                         room_number=room.room_number,
                         reservation_id=reservation.id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     self.results.total_walk_ins += 1
                     if verbose:
                         print(f"🚶 Walk-in Booking: {guest.first_name} {guest.last_name} → Room {room.room_number} (${reservation.total_price})")
-            
+        
             # 5. Group bookings (multiple rooms)
-            if random.random() < self.config.group_booking_probability:
-                available_rooms = self.simulator.find_available_rooms(check_in=date_str)
+            if rand() < cfg.group_booking_probability:
                 if len(available_rooms) >= 3:  # Need at least 3 rooms for a group
-                    group_size = random.randint(3, min(6, len(available_rooms)))  # 3-6 rooms
+                    group_size = randint(3, min(6, len(available_rooms)))  # 3-6 rooms
                     selected_rooms = random.sample(available_rooms, group_size)
-                    stay_days = random.randint(2, 5)
+                    for room in selected_rooms:
+                        available_rooms.remove(room)
+                    stay_days = randint(2, 5)
                     check_out = (self.current_date + datetime.timedelta(days=stay_days)).strftime("%Y-%m-%d")
-                    
+                
                     # Create group leader
-                    group_leader = self.simulator.create_guest(
-                        first_name=random.choice(all_first_names),
-                        last_name=random.choice(all_last_names),
-                        email=f"group{self.guest_counter}@example.com"
+                    group_leader = create_guest(
+                        first_name=choice(_FIRST_NAMES),
+                        last_name=choice(_LAST_NAMES),
+                        email=f"group{self.guest_counter}@example.com",
+                        commit=False
                     )
                     self.guest_counter += 1
                     self.results.total_guests += group_size
-                    
+                
                     total_group_price = 0
                     group_rooms = []
-                    
+                
                     # Create reservations for each room in the group
                     for room in selected_rooms:
-                        reservation = self.reservation_system.create_reservation(
-                            self.simulator, group_leader, room, date_str, check_out
+                        reservation = create_reservation(
+                            group_leader, room, date_str, check_out
                         )
                         total_group_price += reservation.total_price
                         self.results.total_reservations += 1
                         group_rooms.append(room.room_number)
-                    
+                
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time('10:00', '16:00'),
+                        time=random_time('10:00', '16:00'),
                         event_type="group_booking",
                         description=f"Group booking: {group_leader.first_name} {group_leader.last_name} → {group_size} rooms",
                         amount=total_group_price,
@@ -415,37 +665,38 @@ class HotelSimulationEngine:
                         room_number=", ".join(group_rooms),
                         reservation_id=None
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     self.results.total_group_bookings += 1
                     if verbose:
                         print(f"👥 Group Booking: {group_leader.first_name} {group_leader.last_name} → {group_size} rooms (${total_group_price})")
-            
+        
             # 6. Extended stays (longer reservations)
-            if random.random() < self.config.extended_stay_probability:
-                available_rooms = self.simulator.find_available_rooms(check_in=date_str)
+            if rand() < cfg.extended_stay_probability:
                 if available_rooms:
-                    room = random.choice(available_rooms)
-                    stay_days = random.randint(7, 14)  # 1-2 weeks
+                    room = choice(available_rooms)
+                    available_rooms.remove(room)
+                    stay_days = randint(7, 14)  # 1-2 weeks
                     check_out = (self.current_date + datetime.timedelta(days=stay_days)).strftime("%Y-%m-%d")
-                    
+                
                     # Create guest
-                    guest = self.simulator.create_guest(
-                        first_name=random.choice(all_first_names),
-                        last_name=random.choice(all_last_names),
-                        email=f"extended{self.guest_counter}@example.com"
+                    guest = create_guest(
+                        first_name=choice(_FIRST_NAMES),
+                        last_name=choice(_LAST_NAMES),
+                        email=f"extended{self.guest_counter}@example.com",
+                        commit=False
                     )
                     self.guest_counter += 1
                     self.results.total_guests += 1
-                    
+                
                     # Create reservation
-                    reservation = self.reservation_system.create_reservation(
-                        self.simulator, guest, room, date_str, check_out
+                    reservation = create_reservation(
+                        guest, room, date_str, check_out
                     )
                     self.results.total_reservations += 1
-                    
+                
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time('09:00', '17:00'),
+                        time=random_time('09:00', '17:00'),
                         event_type="extended_stay",
                         description=f"Extended stay: {guest.first_name} {guest.last_name} → Room {room.room_number} ({stay_days} nights)",
                         amount=reservation.total_price,
@@ -453,41 +704,42 @@ class HotelSimulationEngine:
                         room_number=room.room_number,
                         reservation_id=reservation.id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     self.results.total_extended_stays += 1
                     if verbose:
                         print(f"🏖️ Extended Stay: {guest.first_name} {guest.last_name} → Room {room.room_number} ({stay_days} nights, ${reservation.total_price})")
-            
+        
             # 7. Loyalty member bookings (higher probability, discounts)
-            if random.random() < self.config.loyalty_member_probability:
-                available_rooms = self.simulator.find_available_rooms(check_in=date_str)
+            if rand() < cfg.loyalty_member_probability:
                 if available_rooms:
-                    room = random.choice(available_rooms)
-                    stay_days = random.randint(2, 5)
+                    room = choice(available_rooms)
+                    available_rooms.remove(room)
+                    stay_days = randint(2, 5)
                     check_out = (self.current_date + datetime.timedelta(days=stay_days)).strftime("%Y-%m-%d")
-                    
+                
                     # Create loyalty member guest
-                    guest = self.simulator.create_guest(
-                        first_name=random.choice(all_first_names),
-                        last_name=random.choice(all_last_names),
-                        email=f"loyalty{self.guest_counter}@example.com"
+                    guest = create_guest(
+                        first_name=choice(_FIRST_NAMES),
+                        last_name=choice(_LAST_NAMES),
+                        email=f"loyalty{self.guest_counter}@example.com",
+                        commit=False
                     )
                     self.guest_counter += 1
                     self.results.total_guests += 1
-                    
+                
                     # Create reservation with loyalty discount
-                    reservation = self.reservation_system.create_reservation(
-                        self.simulator, guest, room, date_str, check_out
+                    reservation = create_reservation(
+                        guest, room, date_str, check_out
                     )
                     # Apply loyalty discount
-                    discount_amount = reservation.total_price * self.config.loyalty_discount
+                    discount_amount = reservation.total_price * cfg.loyalty_discount
                     discounted_price = reservation.total_price - discount_amount
-                    
+                
                     self.results.total_reservations += 1
-                    
+                
                     event = SimulationEvent(
                         day=day,
-                        time=self._random_time('09:00', '17:00'),
+                        time=random_time('09:00', '17:00'),
                         event_type="loyalty_booking",
                         description=f"Loyalty booking: {guest.first_name} {guest.last_name} → Room {room.room_number} (${discounted_price:.2f} with discount)",
                         amount=discounted_price,
@@ -495,26 +747,26 @@ class HotelSimulationEngine:
                         room_number=room.room_number,
                         reservation_id=reservation.id
                     )
-                    self.results.events.append(event)
+                    events_append(event)
                     self.results.total_loyalty_bookings += 1
                     if verbose:
                         print(f"💎 Loyalty Booking: {guest.first_name} {guest.last_name} → Room {room.room_number} (${discounted_price:.2f} with discount)")
-            
+        
             # 8. Special requests (room upgrades, late checkouts, etc.)
-            if random.random() < self.config.special_request_probability:
+            if rand() < cfg.special_request_probability:
                 # Find guests who are currently checked in
                 checked_in_guests = self._get_checked_in_guests(date_str)
                 if checked_in_guests:
-                    guest_id, room_num, res_id = random.choice(checked_in_guests)
-                    
+                    guest_id, room_num, res_id = choice(checked_in_guests)
+                
                     # Randomly select type of special request
-                    request_type = random.choice(['upgrade', 'late_checkout', 'extra_amenities', 'room_service'])
-                    
+                    request_type = choice(['upgrade', 'late_checkout', 'extra_amenities', 'room_service'])
+                
                     if request_type == 'upgrade':
                         # Room upgrade request
                         event = SimulationEvent(
                             day=day,
-                            time=self._random_time('10:00', '18:00'),
+                            time=random_time('10:00', '18:00'),
                             event_type="special_request",
                             description=f"Room upgrade request: Guest {guest_id} in Room {room_num}",
                             amount=50.00,  # Upgrade fee
@@ -524,12 +776,12 @@ class HotelSimulationEngine:
                         )
                         if verbose:
                             print(f"📈 Special Request: Guest {guest_id} requested room upgrade (Room {room_num})")
-                    
+                
                     elif request_type == 'late_checkout':
                         # Late checkout request
                         event = SimulationEvent(
                             day=day,
-                            time=self._random_time('08:00', '12:00'),
+                            time=random_time('08:00', '12:00'),
                             event_type="special_request",
                             description=f"Late checkout request: Guest {guest_id} in Room {room_num}",
                             amount=25.00,  # Late checkout fee
@@ -539,12 +791,12 @@ class HotelSimulationEngine:
                         )
                         if verbose:
                             print(f"⏰ Special Request: Guest {guest_id} requested late checkout (Room {room_num})")
-                    
+                
                     elif request_type == 'extra_amenities':
                         # Extra amenities request
                         event = SimulationEvent(
                             day=day,
-                            time=self._random_time('09:00', '20:00'),
+                            time=random_time('09:00', '20:00'),
                             event_type="special_request",
                             description=f"Extra amenities request: Guest {guest_id} in Room {room_num}",
                             amount=35.00,  # Amenities fee
@@ -554,12 +806,12 @@ class HotelSimulationEngine:
                         )
                         if verbose:
                             print(f"🛎️ Special Request: Guest {guest_id} requested extra amenities (Room {room_num})")
-                    
+                
                     else:  # room_service
                         # Room service request
                         event = SimulationEvent(
                             day=day,
-                            time=self._random_time('18:00', '22:00'),
+                            time=random_time('18:00', '22:00'),
                             event_type="special_request",
                             description=f"Room service request: Guest {guest_id} in Room {room_num}",
                             amount=45.00,  # Room service fee
@@ -569,152 +821,174 @@ class HotelSimulationEngine:
                         )
                         if verbose:
                             print(f"🍽️ Special Request: Guest {guest_id} ordered room service (Room {room_num})")
-                    
-                    self.results.events.append(event)
+                
+                    events_append(event)
                     self.results.total_special_requests += 1
-            
+        
             # 9. Random cancellations
             active_reservations = self._get_active_reservations(date_str)
-            for res_id, guest_id, room_num in active_reservations:
-                if random.random() < self.config.cancellation_probability:
-                    if self.reservation_system.cancel_reservation(res_id):
-                        self.results.total_cancellations += 1
-                        event = SimulationEvent(
-                            day=day,
-                            time=self._random_time('09:00', '17:00'),
-                            event_type="cancellation",
-                            description=f"Reservation cancelled: Room {room_num}",
-                            guest_id=guest_id,
-                            room_number=room_num,
-                            reservation_id=res_id
-                        )
-                        self.results.events.append(event)
-                        if verbose:
-                            print(f"❌ Cancellation: Room {room_num}")
-            
+            for i in _bernoulli_indices(len(active_reservations), cfg.cancellation_probability):
+                res_id, guest_id, room_num = active_reservations[i]
+                if self._cancel_reservation(res_id, date_str):
+                    self.results.total_cancellations += 1
+                    event = SimulationEvent(
+                        day=day,
+                        time=random_time('09:00', '17:00'),
+                        event_type="cancellation",
+                        description=f"Reservation cancelled: Room {room_num}",
+                        guest_id=guest_id,
+                        room_number=room_num,
+                        reservation_id=res_id
+                    )
+                    events_append(event)
+                    if verbose:
+                        print(f"❌ Cancellation: Room {room_num}")
+        
             # 5. Synchronize room and reservation statuses first to ensure accurate occupancy calculation
             self._synchronize_reservation_statuses(date_str)
-            
+        
             # 6. Check if we're meeting minimum occupancy targets and generate additional events if needed
             current_occupied = self._get_current_occupancy(date_str)
             if current_occupied < target_occupied_rooms:
                 # We need to generate more check-ins to meet the target
                 needed_check_ins = target_occupied_rooms - current_occupied
                 self._generate_additional_check_ins(date_str, needed_check_ins, verbose)
-                
+            
                 # Update current occupancy after generating additional check-ins
                 current_occupied = self._get_current_occupancy(date_str)
-            
+        
             # 6. Update daily metrics
             self.results.total_revenue += daily_revenue
-            
+        
             # 7. Synchronize room and reservation statuses
             self._synchronize_reservation_statuses(date_str)
-            
-            # 8. Get daily status
-            status = self.reporter.get_hotel_status(self.hotel_id)
-            if status:
-                daily_occupancy = status.get('occupancy_rate', 0)
-                self.results.occupancy_rate += daily_occupancy
-                if verbose:
-                    print(f"📊 Daily Stats: {daily_occupancy}% occupancy, ${daily_revenue} revenue, {daily_guests} check-ins")
         
-        # Calculate average occupancy
-        if days > 0:
-            self.results.occupancy_rate /= days
-        
-        if verbose:
-            print(f"\n" + "=" * 60)
-            print("🎉 SIMULATION COMPLETED")
-            print("=" * 60)
-        
-        return self.results
+            # 8. Get daily status (same rate get_hotel_status reports)
+            occupied = self._get_current_occupancy(date_str)
+            daily_occupancy = round(occupied / room_count * 100, 2) if room_count > 0 else 0
+            self.results.occupancy_rate += daily_occupancy
+            if verbose:
+                print(f"📊 Daily Stats: {daily_occupancy}% occupancy, ${daily_revenue} revenue, {daily_guests} check-ins")
     
-    def _get_scheduled_check_ins(self, date: str) -> List[Tuple[int, int, str]]:
-        """Get reservations scheduled for check-in on given date"""
+    def _load_active_reservations(self) -> None:
+        """Load the hotel's confirmed and checked-in reservations into memory
+        
+        These are the only reservations the day loop schedules, so its
+        check-in, check-out and cancellation lookups are served from here
+        instead of querying every day. Each is kept in self._active as
+        id -> [guest_id, room_number, check_in_date, check_out_date, status]
+        and indexed by check-in and check-out date. The engine's own
+        bookings, check-ins, check-outs and cancellations keep it current.
+        """
+        self._active = {}
+        self._checkins_by_date = defaultdict(list)
+        self._checkouts_by_date = defaultdict(list)
         try:
             query = """
-                SELECT r.id, r.guest_id, rm.room_number
+                SELECT r.id, r.guest_id, rm.room_number, r.check_in_date, r.check_out_date, r.status
                 FROM reservations r
                 JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.check_in_date = ?
-                AND r.status = 'confirmed'
-                AND rm.hotel_id = ?
+                WHERE rm.hotel_id = ?
+                AND r.status IN ('confirmed', 'checked_in')
+                ORDER BY r.id
             """
-            results = self.db.execute_query(query, (date, self.hotel_id), fetch=True)
-            return [(row['id'], row['guest_id'], row['room_number']) for row in results]
+            results = self.db.execute_query(query, (self.hotel_id,), fetch=True)
+            for row in results:
+                self._track_reservation(row['id'], row['guest_id'], row['room_number'],
+                                        row['check_in_date'], row['check_out_date'], row['status'])
         except Exception as e:
-            print(f"Error getting check-ins: {e}")
-            return []
+            print(f"Error loading active reservations: {e}")
+    
+    def _track_reservation(self, res_id: int, guest_id: int, room_number: str,
+                           check_in: str, check_out: str, status: str = 'confirmed') -> None:
+        """Add a reservation to the in-memory schedule"""
+        self._active[res_id] = [guest_id, room_number, check_in, check_out, status]
+        self._checkins_by_date[check_in].append(res_id)
+        self._checkouts_by_date[check_out].append(res_id)
+    
+    def _set_reservation_status(self, res_id: int, status: str) -> None:
+        """Record a status change; reservations that are no longer active are dropped"""
+        if status in ('confirmed', 'checked_in'):
+            if res_id in self._active:
+                self._active[res_id][4] = status
+        else:
+            self._active.pop(res_id, None)
+    
+    def _create_reservation(self, guest: Guest, room: Room, check_in: str, check_out: str):
+        """Create a reservation and add it to the schedule"""
+        reservation = self.reservation_system.create_reservation(
+            self.simulator, guest, room, check_in, check_out, commit=False
+        )
+        self._track_reservation(reservation.id, guest.id, room.room_number, check_in, check_out)
+        return reservation
+    
+    def _check_in(self, reservation_id: int) -> bool:
+        """Check in a reservation and update the schedule"""
+        if self.reservation_system.check_in(reservation_id, commit=False):
+            self._set_reservation_status(reservation_id, 'checked_in')
+            return True
+        return False
+    
+    def _cancel_reservation(self, reservation_id: int, date: str) -> bool:
+        """Cancel a reservation on the simulated date and drop it from the schedule"""
+        if self.reservation_system.cancel_reservation(reservation_id, commit=False,
+                                                      cancellation_date=date):
+            self._set_reservation_status(reservation_id, 'cancelled')
+            return True
+        return False
+    
+    def _scheduled(self, res_ids, status: str) -> List[Tuple[int, int, str]]:
+        """(id, guest_id, room_number) for the given reservations still in status"""
+        active = self._active
+        return [(res_id, active[res_id][0], active[res_id][1])
+                for res_id in res_ids
+                if res_id in active and active[res_id][4] == status]
+    
+    @contextmanager
+    def _day_output(self):
+        """Collect everything printed inside the block and write it at the end"""
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                yield
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    
+    def _get_scheduled_check_ins(self, date: str) -> List[Tuple[int, int, str]]:
+        """Get reservations scheduled for check-in on given date"""
+        return self._scheduled(self._checkins_by_date.get(date, ()), 'confirmed')
 
     def _get_overdue_check_ins(self, date: str) -> List[Tuple[int, int, str]]:
         """Get reservations that should have been checked in on previous days"""
-        try:
-            query = """
-                SELECT r.id, r.guest_id, rm.room_number
-                FROM reservations r
-                JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.check_in_date < ?
-                AND r.check_out_date >= ?
-                AND r.status = 'confirmed'
-                AND rm.hotel_id = ?
-            """
-            results = self.db.execute_query(query, (date, date, self.hotel_id), fetch=True)
-            return [(row['id'], row['guest_id'], row['room_number']) for row in results]
-        except Exception as e:
-            print(f"Error getting overdue check-ins: {e}")
-            return []
+        return [(res_id, guest_id, room_number)
+                for res_id, (guest_id, room_number, check_in, check_out, status) in self._active.items()
+                if status == 'confirmed' and check_in < date <= check_out]
 
     def _get_overdue_check_outs(self, date: str) -> List[Tuple[int, int, str]]:
         """Get reservations that should have been checked out on previous days"""
-        try:
-            query = """
-                SELECT r.id, r.guest_id, rm.room_number
-                FROM reservations r
-                JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.check_out_date < ?
-                AND r.status = 'checked_in'
-                AND rm.hotel_id = ?
-            """
-            results = self.db.execute_query(query, (date, self.hotel_id), fetch=True)
-            return [(row['id'], row['guest_id'], row['room_number']) for row in results]
-        except Exception as e:
-            print(f"Error getting overdue check-outs: {e}")
-            return []
+        return [(res_id, guest_id, room_number)
+                for res_id, (guest_id, room_number, check_in, check_out, status) in self._active.items()
+                if status == 'checked_in' and check_out < date]
     
     def _get_scheduled_check_outs(self, date: str) -> List[Tuple[int, int, str]]:
         """Get reservations scheduled for check-out on given date"""
-        try:
-            query = """
-                SELECT r.id, r.guest_id, rm.room_number
-                FROM reservations r
-                JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.check_out_date = ?
-                AND r.status = 'checked_in'
-                AND rm.hotel_id = ?
-            """
-            results = self.db.execute_query(query, (date, self.hotel_id), fetch=True)
-            return [(row['id'], row['guest_id'], row['room_number']) for row in results]
-        except Exception as e:
-            print(f"Error getting check-outs: {e}")
-            return []
+        return self._scheduled(self._checkouts_by_date.get(date, ()), 'checked_in')
     
     def _get_active_reservations(self, date: str) -> List[Tuple[int, int, str]]:
         """Get active reservations that could be cancelled"""
+        return [(res_id, guest_id, room_number)
+                for res_id, (guest_id, room_number, check_in, check_out, status) in self._active.items()
+                if status == 'confirmed' and check_in > date]
+    
+    def _get_room_count(self) -> int:
+        """Get the number of rooms in the hotel"""
         try:
-            query = """
-                SELECT r.id, r.guest_id, rm.room_number
-                FROM reservations r
-                JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.check_in_date > ?
-                AND r.status = 'confirmed'
-                AND rm.hotel_id = ?
-            """
-            results = self.db.execute_query(query, (date, self.hotel_id), fetch=True)
-            return [(row['id'], row['guest_id'], row['room_number']) for row in results]
+            query = "SELECT COUNT(*) as rooms FROM rooms WHERE hotel_id = ?"
+            results = self.db.execute_query(query, (self.hotel_id,), fetch=True)
+            return results[0]['rooms'] if results else 0
         except Exception as e:
-            print(f"Error getting active reservations: {e}")
-            return []
+            print(f"Error getting room count: {e}")
+            return 0
     
     def _get_current_occupancy(self, date: str) -> int:
         """Get current number of occupied rooms"""
@@ -732,20 +1006,9 @@ class HotelSimulationEngine:
     
     def _get_checked_in_guests(self, date: str) -> List[Tuple[int, str, int]]:
         """Get guests who are currently checked in"""
-        try:
-            query = """
-                SELECT r.id, r.guest_id, rm.room_number
-                FROM reservations r
-                JOIN rooms rm ON r.room_id = rm.id
-                WHERE r.status = 'checked_in'
-                AND r.check_out_date >= ?
-                AND rm.hotel_id = ?
-            """
-            results = self.db.execute_query(query, (date, self.hotel_id), fetch=True)
-            return [(row['guest_id'], row['room_number'], row['id']) for row in results]
-        except Exception as e:
-            print(f"Error getting checked-in guests: {e}")
-            return []
+        return [(guest_id, room_number, res_id)
+                for res_id, (guest_id, room_number, check_in, check_out, status) in self._active.items()
+                if status == 'checked_in' and check_out >= date]
 
     def _get_available_rooms_with_reservations(self, date: str) -> List[Tuple[int, int, int, str]]:
         """Get available rooms that have confirmed reservations for today"""
@@ -782,35 +1045,6 @@ class HotelSimulationEngine:
                 print(f"⚠️  No available rooms for walk-in reservations")
             return 0
             
-        # Generate guest names for simulation - use the same expanded list
-        first_names = [
-            'John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Jennifer',
-            'William', 'Lisa', 'Thomas', 'Jessica', 'Daniel', 'Amanda', 'Christopher', 'Melissa',
-            'Matthew', 'Nicole', 'Andrew', 'Stephanie', 'James', 'Rebecca', 'Joshua', 'Laura',
-            'Kevin', 'Heather', 'Brian', 'Michelle', 'Timothy', 'Christina', 'Jason', 'Elizabeth',
-            'Ryan', 'Katherine', 'Jacob', 'Samantha', 'Gary', 'Ashley', 'Nicholas', 'Megan'
-        ]
-        last_names = [
-            'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson',
-            'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson',
-            'Garcia', 'Martinez', 'Robinson', 'Clark', 'Rodriguez', 'Lewis', 'Lee', 'Walker',
-            'Hall', 'Allen', 'Young', 'Hernandez', 'King', 'Wright', 'Lopez', 'Hill'
-        ]
-        
-        # Add some international names for diversity
-        international_first_names = [
-            'Carlos', 'Maria', 'Wei', 'Li', 'Pierre', 'Sophie', 'Hans', 'Anna',
-            'Yuki', 'Hiro', 'Aisha', 'Mohammed', 'Luca', 'Giovanna', 'Ivan', 'Olga'
-        ]
-        international_last_names = [
-            'Gonzalez', 'Rodriguez', 'Wang', 'Zhang', 'Dubois', 'Muller', 'Tanaka', 'Ivanov',
-            'Khan', 'Rossi', 'Silva', 'Kim', 'Patel', 'Nguyen', 'Chen', 'Wong'
-        ]
-        
-        # Combine all names
-        all_first_names = first_names + international_first_names
-        all_last_names = last_names + international_last_names
-        
         # Create walk-in reservations and check them in immediately
         for i in range(min(count, len(available_rooms))):
             room = available_rooms[i]
@@ -819,21 +1053,22 @@ class HotelSimulationEngine:
               
             # Create guest
             guest = self.simulator.create_guest(
-                first_name=random.choice(all_first_names),
-                last_name=random.choice(all_last_names),
-                email=f"walkin{self.guest_counter}@example.com"
+                first_name=random.choice(_FIRST_NAMES),
+                last_name=random.choice(_LAST_NAMES),
+                email=f"walkin{self.guest_counter}@example.com",
+                commit=False
             )
             self.guest_counter += 1
             self.results.total_guests += 1
              
             # Create reservation
-            reservation = self.reservation_system.create_reservation(
-                self.simulator, guest, room, date, check_out
+            reservation = self._create_reservation(
+                guest, room, date, check_out
             )
             self.results.total_reservations += 1
             
             # Check in immediately
-            if self.reservation_system.check_in(reservation.id):
+            if self._check_in(reservation.id):
                 check_ins_generated += 1
                 
                 event = SimulationEvent(
@@ -872,7 +1107,7 @@ class HotelSimulationEngine:
                 break
                 
             # Check in the reservation
-            if self.reservation_system.check_in(reservation_id):
+            if self._check_in(reservation_id):
                 check_ins_generated += 1
                 self.results.total_guests += 1
                 
@@ -900,17 +1135,22 @@ class HotelSimulationEngine:
     
     def _random_time(self, start: str, end: str) -> str:
         """Generate random time between start and end"""
-        start_h, start_m = map(int, start.split(':'))
-        end_h, end_m = map(int, end.split(':'))
-        
-        start_minutes = start_h * 60 + start_m
-        end_minutes = end_h * 60 + end_m
-        
-        random_minutes = random.randint(start_minutes, end_minutes)
-        return f"{random_minutes // 60:02d}:{random_minutes % 60:02d}"
+        start_minutes, end_minutes = _minute_range(start, end)
+        return _HHMM[random.randint(start_minutes, end_minutes)]
     
-    def generate_detailed_report(self, results: SimulationResults) -> Dict[str, Any]:
-        """Generate comprehensive report from simulation results"""
+    # Report fields that need a walk over the events; everything else comes
+    # straight from the SimulationResults counters
+    _EVENT_REPORT_FIELDS = frozenset(('event_breakdown', 'revenue_breakdown', 'busy_days', 'slow_days'))
+    
+    def generate_detailed_report(self, results: SimulationResults,
+                                 fields: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Generate comprehensive report from simulation results
+        
+        Args:
+            results: Results of a simulation run
+            fields: Optional set of report keys to return; the events are
+                only scanned if one of _EVENT_REPORT_FIELDS is asked for
+        """
         if not results:
             return {}
         
@@ -925,16 +1165,7 @@ class HotelSimulationEngine:
         loyalty_booking_rate = results.total_loyalty_bookings / results.total_reservations if results.total_reservations > 0 else 0
         special_requests_per_guest = results.total_special_requests / results.total_guests if results.total_guests > 0 else 0
         
-        # Event type breakdown
-        event_types = defaultdict(int)
-        revenue_by_type = defaultdict(float)
-        
-        for event in results.events:
-            event_types[event.event_type] += 1
-            if event.amount > 0:
-                revenue_by_type[event.event_type] += event.amount
-        
-        return {
+        report = {
             'simulation_period': f"{results.total_days} days",
             'total_revenue': round(results.total_revenue, 2),
             'revenue_per_day': round(revenue_per_day, 2),
@@ -955,61 +1186,114 @@ class HotelSimulationEngine:
             'total_loyalty_bookings': results.total_loyalty_bookings,
             'total_special_requests': results.total_special_requests,
             'average_occupancy': round(results.occupancy_rate, 2),
-            'event_breakdown': dict(event_types),
-            'revenue_breakdown': {k: round(v, 2) for k, v in revenue_by_type.items()},
-            'busy_days': self._find_busy_days(results),
-            'slow_days': self._find_slow_days(results)
         }
-    
-    def _find_busy_days(self, results: SimulationResults) -> List[str]:
-        """Find days with high occupancy"""
-        if not results.events:
-            return []
         
-        # Group events by day
-        daily_events = defaultdict(list)
-        for event in results.events:
-            daily_events[event.day].append(event)
-        
-        # Find days with many check-ins
-        busy_days = []
-        for day, events in daily_events.items():
-            check_ins = sum(1 for e in events if e.event_type == 'check_in')
-            if check_ins >= 3:  # Arbitrary threshold
-                busy_days.append(f"Day {day}")
+        if fields is None or not self._EVENT_REPORT_FIELDS.isdisjoint(fields):
+            event_types, revenue_by_type, daily_check_ins, daily_events = self._tally_events(results)
+            report['event_breakdown'] = dict(event_types)
+            # Amounts are never negative, so this drops the types that
+            # brought in no revenue (check-ins, cancellations)
+            report['revenue_breakdown'] = {k: round(v, 2) for k, v in revenue_by_type.items() if v > 0}
+            report['busy_days'] = self._find_busy_days(daily_check_ins)
+            report['slow_days'] = self._find_slow_days(daily_events)
         
-        return busy_days
+        if fields is not None:
+            report = {k: v for k, v in report.items() if k in fields}
+        return report
     
-    def _find_slow_days(self, results: SimulationResults) -> List[str]:
-        """Find days with low activity"""
-        if not results.events:
-            return []
+    def _tally_events(self, results: SimulationResults) -> Tuple[Dict[str, int], Dict[str, float],
+                                                                 Dict[int, int], Dict[int, int]]:
+        """Count events by type, revenue by type, and check-ins and events by day
         
-        # Group events by day
-        daily_events = defaultdict(list)
-        for event in results.events:
-            daily_events[event.day].append(event)
+        One pass over the events (days keep the order they first appear in);
+        a CsvEventSink kept these counts while the events were written.
+        """
+        if isinstance(results.events, CsvEventSink):
+            sink = results.events
+            return sink.event_types, sink.revenue_by_type, sink.daily_check_ins, sink.daily_events
+        
+        event_types = defaultdict(int)
+        revenue_by_type = defaultdict(float)
+        daily_check_ins = defaultdict(int)
+        daily_events = defaultdict(int)
         
-        # Find days with few events
-        slow_days = []
-        for day, events in daily_events.items():
-            if len(events) <= 2:  # Arbitrary threshold
-                slow_days.append(f"Day {day}")
+        # Events arrive grouped by day, so per-day counts are kept as a
+        # run and only hashed into the dicts when the day changes (+= so
+        # a day seen again later still adds up correctly)
+        run_day = None
+        run_check_ins = run_events = 0
+        for event in results.events:
+            event_type = event.event_type
+            event_types[event_type] += 1
+            revenue_by_type[event_type] += event.amount
+            if event.day != run_day:
+                if run_events:
+                    daily_check_ins[run_day] += run_check_ins
+                    daily_events[run_day] += run_events
+                run_day = event.day
+                run_check_ins = run_events = 0
+            run_check_ins += event_type == 'check_in'
+            run_events += 1
+        if run_events:
+            daily_check_ins[run_day] += run_check_ins
+            daily_events[run_day] += run_events
         
-        return slow_days
+        return event_types, revenue_by_type, daily_check_ins, daily_events
+    
+    def _find_busy_days(self, daily_check_ins: Dict[int, int]) -> List[str]:
+        """Find days with high occupancy, given check-ins per day"""
+        # Arbitrary threshold
+        return [f"Day {day}" for day, check_ins in daily_check_ins.items() if check_ins >= 3]
+    
+    def _find_slow_days(self, daily_events: Dict[int, int]) -> List[str]:
+        """Find days with low activity, given events per day"""
+        # Arbitrary threshold
+        return [f"Day {day}" for day, event_count in daily_events.items() if event_count <= 2]
     
     def export_events_to_csv(self, results: SimulationResults, filename: str = "simulation_events.csv"):
         """Export simulation events to CSV file"""
         try:
-            with open(filename, 'w') as f:
-                f.write("Day,Time,Event Type,Description,Amount,Guest ID,Room,Reservation ID\n")
-                for event in results.events:
-                    f.write(f"{event.day},{event.time},{event.event_type},{event.description},"
-                           f"{event.amount},{event.guest_id or ''},{event.room_number or ''},{event.reservation_id or ''}\n")
+            with open(filename, 'w', buffering=1 << 20, newline='') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(_EVENT_CSV_HEADER)
+                # Rows are generated as the C writer consumes them, so no
+                # list of rows is built up alongside the events
+                writer.writerows(map(_event_csv_row, results.events))
             print(f"✓ Exported events to {filename}")
         except Exception as e:
             print(f"Error exporting events: {e}")
     
+    @classmethod
+    def run_sweep(cls, hotel_id: int, db_paths: List[str], configs: List[SimulationConfig],
+                  days: int = 30, n_workers: int = None, seed: int = None) -> List[SimulationResults]:
+        """Run independent simulations in parallel, one process per run
+        
+        Args:
+            hotel_id: Hotel to simulate in every database
+            db_paths: One database file per run; use separate copies, since
+                runs write to their database and would otherwise contend
+                for SQLite's write lock
+            configs: One SimulationConfig per run (None for the default)
+            days: Number of days each run simulates
+            n_workers: Worker processes (defaults to the CPU count)
+            seed: Base random seed; run i is seeded with seed + i, so a sweep
+                can be repeated exactly (drawn at random when not given)
+            
+        Returns:
+            SimulationResults for each run, in the order given
+        """
+        if len(db_paths) != len(configs):
+            raise ValueError("db_paths and configs must have the same length")
+        
+        # Forked workers start from a copy of this process's random state,
+        # so every run gets its own seed rather than repeating the same draws
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        jobs = [(cls, hotel_id, db_path, config, days, seed + i)
+                for i, (db_path, config) in enumerate(zip(db_paths, configs))]
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(_run_sweep_job, jobs))
+    
     def run_benchmark(self, days: int = 30) -> Dict[str, float]:
         """Run performance benchmark"""
         print(f"Running benchmark for {days} days...")
@@ -1029,20 +1313,18 @@ class HotelSimulationEngine:
     
     def _get_memory_usage(self) -> float:
         """Get current memory usage (simplified)"""
-        try:
-            import psutil
-            import os
-            process = psutil.Process(os.getpid())
-            return round(process.memory_info().rss / 1024 / 1024, 2)
-        except ImportError:
+        process = _psutil_process(os.getpid())
+        if process is None:
             return 0.0  # psutil not available
+        return round(process.memory_info().rss / 1024 / 1024, 2)
 
     def _check_out_with_date(self, reservation_id: int, date: str) -> Tuple[bool, float]:
         """Check out a reservation with proper transaction dating"""
         # Call the original check_out method
-        success, amount = self.reservation_system.check_out(reservation_id)
+        success, amount = self.reservation_system.check_out(reservation_id, commit=False)
         
         if success:
+            self._set_reservation_status(reservation_id, 'checked_out')
             # The transaction was created with current timestamp, so we need to update it
             # Find the transaction and update its date
             try:
@@ -1061,7 +1343,7 @@ class HotelSimulationEngine:
                         SET transaction_date = ?
                         WHERE id = ?
                     """
-                    self.db.execute_query(update_query, (date, transaction_id))
+                    self.db.execute_query(update_query, (date, transaction_id), commit=False)
             except Exception as e:
                 print(f"Error updating transaction date: {e}")
         
@@ -1086,7 +1368,7 @@ class HotelSimulationEngine:
                     AND r.id IS NULL
                 )
             """
-            self.db.execute_query(query, (date, date, self.hotel_id))
+            self.db.execute_query(query, (date, date, self.hotel_id), commit=False)
             
             # Fix rooms that should be reserved but are marked as available
             query = """
@@ -1103,7 +1385,7 @@ class HotelSimulationEngine:
                     AND r.check_out_date >= ?
                 )
             """
-            self.db.execute_query(query, (self.hotel_id, date, date))
+            self.db.execute_query(query, (self.hotel_id, date, date), commit=False)
             
             # Fix rooms that should be occupied but are marked as reserved
             query = """
@@ -1120,64 +1402,75 @@ class HotelSimulationEngine:
                     AND r.check_out_date >= ?
                 )
             """
-            self.db.execute_query(query, (self.hotel_id, date, date))
+            self.db.execute_query(query, (self.hotel_id, date, date), commit=False)
             
         except Exception as e:
             print(f"Error synchronizing reservation statuses: {e}")
 
 
+def _run_sweep_job(job: Tuple) -> SimulationResults:
+    """Run one simulation of a sweep in a worker process"""
+    engine_class, hotel_id, db_path, config, days, seed = job
+    random.seed(seed)
+    engine = engine_class(hotel_id, db_path, config)
+    try:
+        return engine.run_simulation(days, verbose=False)
+    finally:
+        engine.db.close()
+
+
 class AdvancedSimulationEngine(HotelSimulationEngine):
     """Extended simulation engine with more sophisticated features"""
     
-    def __init__(self, hotel_id: int, db_path: str = 'hotel.db'):
-        super().__init__(hotel_id, db_path)
+    # Seasonal price multiplier indexed by month (index 0 unused):
+    # 10% winter discount (Dec-Feb), 20% summer premium (Jun-Aug)
+    _SEASONAL = (1.0, 0.9, 0.9, 1.0, 1.0, 1.0, 1.2, 1.2, 1.2, 1.0, 1.0, 1.0, 0.9)
+    # Indexed by datetime.weekday() (0 = Monday)
+    _DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+    
+    def __init__(self, hotel_id: int, db_path: str = 'hotel.db', config: SimulationConfig = None):
+        # run_simulation changes the config day by day, so work on a copy
+        # rather than the caller's
+        super().__init__(hotel_id, db_path, dataclasses.replace(config) if config is not None else None)
         # Extend config with additional parameters
         self.config.seasonal_variation = True
         self.config.weekend_effect = True
+        # (new_reservation_probability, average_stay_days) for each kind of day
+        self._weekday_cfg = (0.3, (1, 7))  # Normal stays
+        self._weekend_cfg = (0.45, (1, 3))  # More weekend bookings, shorter stays
     
-    def run_simulation(self, days: int = 30, verbose: bool = True) -> SimulationResults:
+    def run_simulation(self, days: int = 30, verbose: bool = True,
+                       event_sink: Optional[TextIO] = None) -> SimulationResults:
         """Run advanced simulation with seasonal and weekend effects"""
         print(f"Starting Advanced Hotel Simulation: {days} days")
         print("=" * 60)
         
-        self.results = SimulationResults()
-        self.results.total_days = days
-        
-        # Generate guest names
-        first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Jennifer']
-        last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis', 'Wilson']
+        self._begin_run(days, event_sink)
         
         for day in range(1, days + 1):
             self.current_date += datetime.timedelta(days=1)
-            day_name = self.current_date.strftime("%A")
-            date_str = self.current_date.strftime("%Y-%m-%d")
-            is_weekend = day_name in ['Saturday', 'Sunday']
+            date_str = self.current_date.date().isoformat()  # YYYY-MM-DD
+            weekday = self.current_date.weekday()
+            is_weekend = weekday >= 5  # Saturday or Sunday
             
             if verbose:
+                day_name = self._DAY_NAMES[weekday]
                 print(f"\n📅 Day {day} ({day_name}, {date_str}) {'🎉 Weekend' if is_weekend else ''}")
                 print("-" * 50)
             
             # Apply weekend effects
-            if is_weekend:
-                self.config.new_reservation_probability *= 1.5  # More weekend bookings
-                self.config.average_stay_days = (1, 3)  # Shorter weekend stays
-            else:
-                self.config.new_reservation_probability = 0.3  # Reset to default
-                self.config.average_stay_days = (1, 7)  # Normal stays
+            self.config.new_reservation_probability, self.config.average_stay_days = (
+                self._weekend_cfg if is_weekend else self._weekday_cfg
+            )
             
             # Run standard simulation day
-            super().run_simulation(1, verbose=verbose)
+            self._simulate_one_day(day, date_str, verbose)
             
             # Add seasonal pricing variation (simplified)
             if self.config.seasonal_variation:
-                month = self.current_date.month
-                if month in [6, 7, 8]:  # Summer season
-                    self._apply_seasonal_pricing(1.2)  # 20% premium
-                elif month in [12, 1, 2]:  # Winter season
-                    self._apply_seasonal_pricing(0.9)  # 10% discount
-                else:
-                    self._apply_seasonal_pricing(1.0)  # Normal pricing
+                self._apply_seasonal_pricing(self._SEASONAL[self.current_date.month])
         
+        self._finish_run(days)
         return self.results
     
     def _apply_seasonal_pricing(self, multiplier: float):
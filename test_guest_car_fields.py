@@ -7,17 +7,28 @@ Updated with full American-style addresses and 10-digit phone numbers
 
 import sqlite3
 import sys
+from functools import lru_cache
 from hotel_simulator import HotelSimulator, Guest
 from database import HotelDatabase
 
+@lru_cache(maxsize=1)
+def _db():
+    """Connection shared by the tests below, opened by the first one that runs"""
+    return HotelDatabase('hotel.db')
+
+def teardown_module():
+    """Close the shared connection once the tests in this file are done"""
+    if _db.cache_info().currsize:
+        _db().close()
+        _db.cache_clear()
+
 def test_database_schema():
     """Test that the database schema includes car fields"""
     print("=" * 60)
     print("TEST 1: Database Schema Validation")
     print("=" * 60)
     
-    db = HotelDatabase('hotel.db')
-    cursor = db.conn.cursor()
+    cursor = _db().conn.cursor()
     
     # Get table info
     cursor.execute("PRAGMA table_info(guests)")
@@ -46,21 +57,31 @@ def test_create_guest_with_car():
     print("TEST 2: Create Guest with Car Information")
     print("=" * 60)
     
-    sim = HotelSimulator('hotel.db')
+    sim = HotelSimulator(db=_db())
+    
+    # All four guests are written in one transaction
+    guest1, guest2, guest3, guest4 = sim.create_guests_bulk([
+        dict(first_name="Alice", last_name="Johnson",
+             email="alice.johnson@example.com", phone="555-123-4567",
+             address="123 Main Street, Anytown, CA 90210",
+             car_make="Toyota", car_model="Camry", car_color="Blue"),
+        # No car info (should default to empty strings)
+        dict(first_name="Robert", last_name="Smith",
+             email="robert.smith@example.com", phone="555-234-5678",
+             address="456 Oak Avenue, Springfield, IL 62701"),
+        dict(first_name="Charles", last_name="Brown",
+             email="charles.brown@example.com", phone="555-345-6789",
+             address="789 Peanuts Lane, Minneapolis, MN 55401",
+             car_make="N/A", car_model="N/A", car_color="N/A"),
+        # car_model is omitted
+        dict(first_name="Diana", last_name="Prince",
+             email="diana.prince@example.com", phone="555-456-7890",
+             address="1600 Pennsylvania Avenue NW, Washington, DC 20500",
+             car_make="Honda", car_color="Red"),
+    ])
     
     # Test 1: Guest with full car info
-    print("\n[Test 2.1] Creating guest with complete car info...")
-    guest1 = sim.create_guest(
-        first_name="Alice",
-        last_name="Johnson",
-        email="alice.johnson@example.com",
-        phone="555-123-4567",
-        address="123 Main Street, Anytown, CA 90210",
-        car_make="Toyota",
-        car_model="Camry",
-        car_color="Blue"
-    )
-    
+    print("\n[Test 2.1] Checking guest with complete car info...")
     if guest1.car_make == "Toyota" and guest1.car_model == "Camry" and guest1.car_color == "Blue":
         print(f"✓ PASSED: Guest created with car info")
         print(f"  Name: {guest1.first_name} {guest1.last_name}")
@@ -72,14 +93,7 @@ def test_create_guest_with_car():
         return False
     
     # Test 2: Guest without car info (should default to empty strings)
-    print("\n[Test 2.2] Creating guest without car info...")
-    guest2 = sim.create_guest(
-        first_name="Robert",
-        last_name="Smith",
-        email="robert.smith@example.com",
-        phone="555-234-5678",
-        address="456 Oak Avenue, Springfield, IL 62701"
-    )
+    print("\n[Test 2.2] Checking guest without car info...")
     
     if guest2.car_make == "" and guest2.car_model == "" and guest2.car_color == "":
         print(f"✓ PASSED: Guest created without car info (defaults to empty)")
@@ -92,17 +106,7 @@ def test_create_guest_with_car():
         return False
     
     # Test 3: Guest with N/A car info
-    print("\n[Test 2.3] Creating guest with N/A car info...")
-    guest3 = sim.create_guest(
-        first_name="Charles",
-        last_name="Brown",
-        email="charles.brown@example.com",
-        phone="555-345-6789",
-        address="789 Peanuts Lane, Minneapolis, MN 55401",
-        car_make="N/A",
-        car_model="N/A",
-        car_color="N/A"
-    )
+    print("\n[Test 2.3] Checking guest with N/A car info...")
     
     if guest3.car_make == "N/A" and guest3.car_model == "N/A" and guest3.car_color == "N/A":
         print(f"✓ PASSED: Guest created with N/A car info")
@@ -115,17 +119,7 @@ def test_create_guest_with_car():
         return False
     
     # Test 4: Partial car info
-    print("\n[Test 2.4] Creating guest with partial car info...")
-    guest4 = sim.create_guest(
-        first_name="Diana",
-        last_name="Prince",
-        email="diana.prince@example.com",
-        phone="555-456-7890",
-        address="1600 Pennsylvania Avenue NW, Washington, DC 20500",
-        car_make="Honda",
-        car_color="Red"
-        # Note: car_model is omitted
-    )
+    print("\n[Test 2.4] Checking guest with partial car info...")
     
     if guest4.car_make == "Honda" and guest4.car_model == "" and guest4.car_color == "Red":
         print(f"✓ PASSED: Guest created with partial car info")
@@ -145,8 +139,7 @@ def test_retrieve_guest_data():
     print("TEST 3: Retrieve Guest Data from Database")
     print("=" * 60)
     
-    db = HotelDatabase('hotel.db')
-    cursor = db.conn.cursor()
+    cursor = _db().conn.cursor()
     
     # Get the most recent guests with car info
     query = """
@@ -169,11 +162,12 @@ def test_retrieve_guest_data():
         print(f"    Car: {color} {make} {model}")
     
     # Get count of guests with and without car info
-    cursor.execute("SELECT COUNT(*) FROM guests WHERE car_make IS NOT NULL AND car_make != '' AND car_make != 'N/A'")
-    with_cars = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM guests WHERE car_make IS NULL OR car_make = '' OR car_make = 'N/A'")
-    without_cars = cursor.fetchone()[0]
+    cursor.execute("""
+        SELECT SUM(CASE WHEN car_make IS NOT NULL AND car_make NOT IN ('', 'N/A') THEN 1 ELSE 0 END),
+               SUM(CASE WHEN car_make IS NULL OR car_make IN ('', 'N/A') THEN 1 ELSE 0 END)
+        FROM guests
+    """)
+    with_cars, without_cars = (count or 0 for count in cursor.fetchone())
     
     print(f"\n✓ Guest statistics:")
     print(f"  - Guests with car info: {with_cars}")
@@ -187,8 +181,7 @@ def test_query_by_car():
     print("TEST 4: Query Guests by Car Information")
     print("=" * 60)
     
-    db = HotelDatabase('hotel.db')
-    cursor = db.conn.cursor()
+    cursor = _db().conn.cursor()
     
     # Find all Toyota owners
     print("\n[Test 4.1] Finding all Toyota owners...")
@@ -265,6 +258,7 @@ def main():
             import traceback
             traceback.print_exc()
             results.append((test_name, False))
+    teardown_module()
     
     # Summary
     print("\n" + "=" * 60)
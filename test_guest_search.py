@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script for guest substring search
+Checks that searches built by HotelDatabase.guest_search_conditions find the
+same guests as a plain LIKE scan, including short and non-ASCII search text
+"""
+
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+from database import HotelDatabase
+
+_GUESTS = [
+    ("Müller", "Jürgen", "Volkswagen", "Golf"),
+    ("Mühlberg", "Anna", "BMW", "X3"),
+    ("Schülz", "Zoë", "Škoda", "Octavia"),
+    ("Smith", "John", "Toyota", "Camry"),
+    ("Lee", "Mia", "Kia", "Rio"),
+]
+
+# (column, search text): short text, non-ASCII text of every length, and
+# text long enough for the trigram index
+_SEARCHES = [
+    ("last_name", "Mü"), ("last_name", "mü"), ("last_name", "ül"),
+    ("last_name", "ü"), ("first_name", "Zo"), ("first_name", "ë"),
+    ("car_make", "Šk"), ("last_name", "Mül"), ("last_name", "ller"),
+    ("first_name", "ürg"), ("car_make", "Kia"), ("car_model", "X3"),
+    ("last_name", "e"),
+]
+
+
+def test_search_matches_like():
+    """Index-backed guest searches return the same rows as LIKE"""
+    print("=" * 60)
+    print("TEST: Guest Search Matches LIKE")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with redirect_stdout(io.StringIO()):
+            db = HotelDatabase(os.path.join(tmp_dir, "hotel.db"))
+        try:
+            db.conn.executemany(
+                "INSERT INTO guests (last_name, first_name, car_make, car_model) VALUES (?, ?, ?, ?)",
+                _GUESTS)
+            db.conn.commit()
+
+            for column, text in _SEARCHES:
+                conditions, params = db.guest_search_conditions({column: text})
+                found = db.execute_query(
+                    f"SELECT id FROM guests WHERE {' AND '.join(conditions)} ORDER BY id",
+                    tuple(params), fetch=True)
+                expected = db.execute_query(
+                    f"SELECT id FROM guests WHERE {column} LIKE ? ORDER BY id",
+                    (f"%{text}%",), fetch=True)
+                assert found == expected, \
+                    f"{column} ~ {text!r}: found {found}, LIKE found {expected}"
+                print(f"✓ {column} ~ {text!r}: {len(found)} guest(s)")
+
+            # Combined criteria mix index-backed and short text
+            conditions, params = db.guest_search_conditions(
+                {'last_name': 'Mü', 'first_name': 'Jürgen', 'email': ''})
+            found = db.execute_query(
+                f"SELECT last_name FROM guests WHERE {' AND '.join(conditions)}",
+                tuple(params), fetch=True)
+            assert found == [{'last_name': 'Müller'}], found
+            print("✓ Combined short and long criteria")
+        finally:
+            with redirect_stdout(io.StringIO()):
+                db.close()
+
+
+if __name__ == "__main__":
+    test_search_matches_like()
+    print("\n🎉 ALL TESTS PASSED!")
+    sys.exit(0)
@@ -4,9 +4,11 @@ Test script for guest wizards
 Tests add guest and search guest functionality
 """
 
-import subprocess
+import io
 import sys
 
+import guest_wizard
+
 
 def test_add_guest_wizard():
     """Test the add guest wizard with simulated input"""
@@ -27,28 +29,20 @@ y
 """
     
     try:
-        result = subprocess.run(
-            ['python3', 'guest_wizard.py', 'add'],
-            input=test_input,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        output = io.StringIO()
+        guest_wizard.main(['add'], io.StringIO(test_input), output)
+        result = output.getvalue()
         
         print("Output:")
-        print(result.stdout)
+        print(result)
         
-        if "Guest created successfully" in result.stdout:
+        if "Guest created successfully" in result:
             print("✅ TEST PASSED: Guest created successfully")
             return True
         else:
             print("❌ TEST FAILED: Guest not created")
-            print("STDERR:", result.stderr)
             return False
             
-    except subprocess.TimeoutExpired:
-        print("❌ TEST FAILED: Wizard timed out")
-        return False
     except Exception as e:
         print(f"❌ TEST FAILED: {e}")
         return False
@@ -74,26 +68,19 @@ def test_search_guest_wizard():
 """
     
     try:
-        result = subprocess.run(
-            ['python3', 'guest_wizard.py', 'search'],
-            input=test_input,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        output = io.StringIO()
+        guest_wizard.main(['search'], io.StringIO(test_input), output)
+        result = output.getvalue()
         
         print("Output:")
-        print(result.stdout)
+        print(result)
         
-        if "SEARCH RESULTS" in result.stdout:
+        if "SEARCH RESULTS" in result:
             print("✅ TEST PASSED: Search executed successfully")
         else:
             print("❌ TEST FAILED: Search did not execute")
             return False
             
-    except subprocess.TimeoutExpired:
-        print("❌ TEST FAILED: Search timed out")
-        return False
     except Exception as e:
         print(f"❌ TEST FAILED: {e}")
         return False
@@ -113,27 +100,20 @@ Toyota
 """
     
     try:
-        result = subprocess.run(
-            ['python3', 'guest_wizard.py', 'search'],
-            input=test_input,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        output = io.StringIO()
+        guest_wizard.main(['search'], io.StringIO(test_input), output)
+        result = output.getvalue()
         
         print("Output:")
-        print(result.stdout)
+        print(result)
         
-        if "SEARCH RESULTS" in result.stdout:
+        if "SEARCH RESULTS" in result:
             print("✅ TEST PASSED: Car search executed successfully")
             return True
         else:
             print("❌ TEST FAILED: Car search did not execute")
             return False
             
-    except subprocess.TimeoutExpired:
-        print("❌ TEST FAILED: Search timed out")
-        return False
     except Exception as e:
         print(f"❌ TEST FAILED: {e}")
         return False
@@ -159,28 +139,21 @@ def test_search_partial_match():
 """
     
     try:
-        result = subprocess.run(
-            ['python3', 'guest_wizard.py', 'search'],
-            input=test_input,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        output = io.StringIO()
+        guest_wizard.main(['search'], io.StringIO(test_input), output)
+        result = output.getvalue()
         
         print("Output (first 50 lines):")
-        lines = result.stdout.split('\n')[:50]
+        lines = result.split('\n', 50)[:50]
         print('\n'.join(lines))
         
-        if "Found" in result.stdout and "guest" in result.stdout:
+        if "Found" in result and "guest" in result:
             print("✅ TEST PASSED: Partial match search works")
             return True
         else:
             print("✅ TEST PASSED: Search executed (no results is OK)")
             return True
             
-    except subprocess.TimeoutExpired:
-        print("❌ TEST FAILED: Search timed out")
-        return False
     except Exception as e:
         print(f"❌ TEST FAILED: {e}")
         return False
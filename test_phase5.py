@@ -3,28 +3,50 @@
 Test script for Phase 5 CLI functionality
 """
 
+import io
 import subprocess
 import sys
 import os
 
-def run_command(cmd, input_data=None):
-    """Run a command and return the result"""
+import hotel_cli
+
+def run_command(args, input_data=None):
+    """Run a Python script with this interpreter and return the result"""
     try:
+        # No shell in between, and the child is the same interpreter the
+        # tests run under rather than whichever python3 is first on PATH.
+        # An absolute executable plus close_fds=False (our own fds are
+        # non-inheritable anyway) lets subprocess use posix_spawn
         result = subprocess.run(
-            cmd, 
-            shell=True, 
+            [sys.executable] + args, 
             capture_output=True, 
+            close_fds=False,
             text=True,
-            input=input_data
+            input=input_data,
+            timeout=30
         )
         return result.returncode, result.stdout, result.stderr
+    except subprocess.TimeoutExpired as e:
+        # subprocess.run has already killed and reaped the child
+        return -1, "", f"Timed out after {e.timeout} seconds"
     except Exception as e:
         return -1, "", str(e)
 
+def run_cli(argv, input_data=None):
+    """Run hotel_cli.main in-process and return the same tuple as run_command"""
+    output = io.StringIO()
+    try:
+        hotel_cli.main(argv, io.StringIO(input_data or ""), output)
+        return 0, output.getvalue(), ""
+    except SystemExit as e:
+        return e.code or 0, output.getvalue(), ""
+    except Exception as e:
+        return -1, output.getvalue(), str(e)
+
 def test_help():
     """Test help command"""
     print("Testing help command...")
-    code, stdout, stderr = run_command("python3 hotel_cli.py --help")
+    code, stdout, stderr = run_command(["hotel_cli.py", "--help"])
     
     if code == 0 and "Hotel Simulator CLI" in stdout:
         print("✓ Help command works")
@@ -41,7 +63,7 @@ def test_interactive_mode():
     commands = """help
 exit"""
     
-    code, stdout, stderr = run_command("python3 hotel_cli.py interactive", commands)
+    code, stdout, stderr = run_cli(["interactive"], commands)
     
     if code == 0 and "Welcome to Hotel Simulator CLI" in stdout:
         print("✓ Interactive mode works")
@@ -55,7 +77,8 @@ def test_batch_mode():
     print("Testing batch simulation mode...")
     
     # First create a test hotel
-    code, stdout, stderr = run_command("python3 hotel_cli.py create --name 'Phase5 Test' --address 'Test Address' --stars 3 --floors 2 --rooms 10")
+    code, stdout, stderr = run_cli(["create", "--name", "Phase5 Test", "--address", "Test Address",
+                                   "--stars", "3", "--floors", "2", "--rooms", "10"])
     
     if code != 0:
         print(f"✗ Failed to create test hotel: {stderr}")
@@ -73,15 +96,14 @@ def test_batch_mode():
         return False
     
     # Add some rooms
-    code1, _, _ = run_command(f"python3 hotel_cli.py room --hotel-id {hotel_id} --floor 1 --room-number '101' --room-type 'Standard'")
-    code2, _, _ = run_command(f"python3 hotel_cli.py room --hotel-id {hotel_id} --floor 1 --room-number '102' --room-type 'Standard'")
+    code, _, _ = run_cli(["rooms-bulk", "--hotel-id", hotel_id, "--floor", "1", "--spec", "101:Standard,102:Standard"])
     
-    if code1 != 0 or code2 != 0:
+    if code != 0:
         print("✗ Failed to create test rooms")
         return False
     
     # Run batch simulation
-    code, stdout, stderr = run_command(f"python3 hotel_cli.py batch --hotel-id {hotel_id} --days 2")
+    code, stdout, stderr = run_cli(["batch", "--hotel-id", hotel_id, "--days", "2"])
     
     if code == 0 and "Batch simulation completed successfully!" in stdout:
         print("✓ Batch simulation mode works")
@@ -95,17 +117,17 @@ def test_cli_commands():
     print("Testing CLI commands...")
     
     # Test list command
-    code, stdout, stderr = run_command("python3 hotel_cli.py list")
+    code, stdout, stderr = run_cli(["list"])
     
     if code != 0:
         print(f"✗ List command failed: {stderr}")
         return False
     
     # Test info command (use hotel ID 1 if available)
-    code, stdout, stderr = run_command("python3 hotel_cli.py info --hotel-id 1")
+    code, stdout, stderr = run_cli(["info", "--hotel-id", "1"])
     
     # Test list-rooms command
-    code, stdout, stderr = run_command("python3 hotel_cli.py list-rooms --hotel-id 1")
+    code, stdout, stderr = run_cli(["list-rooms", "--hotel-id", "1"])
     
     if code == 0:
         print("✓ Basic CLI commands work")
@@ -126,7 +148,7 @@ financial_report 1
 occupancy_report 1
 exit"""
     
-    code, stdout, stderr = run_command("python3 hotel_cli.py interactive", commands)
+    code, stdout, stderr = run_cli(["interactive"], commands)
     
     if code == 0 and "Hotel Report:" in stdout:
         print("✓ Interactive commands work")
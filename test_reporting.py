@@ -5,7 +5,43 @@ Demonstrates all report types and functionality
 """
 
 from reporting_system import HotelReportingSystem, ReportConfig, ReportType, TimePeriod
+from hotel_simulator import HotelSimulator, ReservationSystem
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 import os
+import sqlite3
+import tempfile
+
+# (title, report type, time period, detail lines) for each report under test
+REPORT_CASES = [
+    ("Daily Status Report", ReportType.DAILY_STATUS, TimePeriod.DAILY, lambda r: [
+        f"Hotel: {r.data['hotel_info']['name']}",
+        f"Total Rooms: {r.summary['total_rooms']}",
+        f"Occupancy Rate: {r.summary['occupancy_rate']}%"]),
+    ("Financial Summary Report", ReportType.FINANCIAL_SUMMARY, TimePeriod.MONTHLY, lambda r: [
+        f"Period: {r.data['period']['start_date']} to {r.data['period']['end_date']}",
+        f"Total Revenue: ${r.data['total_revenue']:.2f}",
+        f"Occupancy Rate: {r.data['occupancy_rate']}%"]),
+    ("Occupancy Analysis Report", ReportType.OCCUPANCY_ANALYSIS, TimePeriod.MONTHLY, lambda r: [
+        f"Period: {r.data['period']['start_date']} to {r.data['period']['end_date']}",
+        f"Average Stay Length: {r.data['average_stay_length']:.1f} days",
+        f"Daily Data Points: {len(r.data['daily_occupancy'])}"]),
+    ("Revenue by Room Type Report", ReportType.REVENUE_BY_ROOM_TYPE, TimePeriod.MONTHLY, lambda r: [
+        f"Total Revenue: ${r.data['total_revenue']:.2f}",
+        f"Room Types: {len(r.data['room_type_revenue'])}"]),
+    ("Guest Demographics Report", ReportType.GUEST_DEMOGRAPHICS, TimePeriod.MONTHLY, lambda r: [
+        f"Total Guests: {r.summary['total_guests']}",
+        f"Total Revenue: ${r.summary['total_revenue']:.2f}",
+        f"Avg Revenue per Guest: ${r.summary['avg_revenue_per_guest']:.2f}"]),
+    ("Housekeeping Status Report", ReportType.HOUSEKEEPING_STATUS, TimePeriod.DAILY, lambda r: [
+        f"Total Rooms: {r.summary['total_rooms']}",
+        f"Clean Rooms: {r.summary['clean_rooms']}",
+        f"Rooms Needing Attention: {r.summary['rooms_needing_attention']}"]),
+    ("Cancellation Analysis Report", ReportType.CANCELLATION_ANALYSIS, TimePeriod.MONTHLY, lambda r: [
+        f"Total Reservations: {r.summary['total_reservations']}",
+        f"Total Cancellations: {r.summary['total_cancellations']}",
+        f"Cancellation Rate: {r.summary['cancellation_rate']:.1f}%"])
+]
 
 def test_reporting_system():
     """Test all report types and functionality"""
@@ -15,111 +51,47 @@ def test_reporting_system():
     # Create reporting system instance
     with HotelReportingSystem('hotel.db') as reporter:
         
-        # Test 1: Daily Status Report
-        print("\n1. Testing Daily Status Report...")
-        daily_config = ReportConfig(
-            report_type=ReportType.DAILY_STATUS,
-            time_period=TimePeriod.DAILY,
-            hotel_id=1
-        )
-        daily_report = reporter.generate_report(daily_config)
-        print("✅ Daily Status Report generated successfully")
-        print(f"   - Hotel: {daily_report.data['hotel_info']['name']}")
-        print(f"   - Total Rooms: {daily_report.summary['total_rooms']}")
-        print(f"   - Occupancy Rate: {daily_report.summary['occupancy_rate']}%")
-        
-        # Test 2: Financial Summary Report
-        print("\n2. Testing Financial Summary Report...")
-        financial_config = ReportConfig(
-            report_type=ReportType.FINANCIAL_SUMMARY,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        financial_report = reporter.generate_report(financial_config)
-        print("✅ Financial Summary Report generated successfully")
-        print(f"   - Period: {financial_report.data['period']['start_date']} to {financial_report.data['period']['end_date']}")
-        print(f"   - Total Revenue: ${financial_report.data['total_revenue']:.2f}")
-        print(f"   - Occupancy Rate: {financial_report.data['occupancy_rate']}%")
-        
-        # Test 3: Occupancy Analysis Report
-        print("\n3. Testing Occupancy Analysis Report...")
-        occupancy_config = ReportConfig(
-            report_type=ReportType.OCCUPANCY_ANALYSIS,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        occupancy_report = reporter.generate_report(occupancy_config)
-        print("✅ Occupancy Analysis Report generated successfully")
-        print(f"   - Period: {occupancy_report.data['period']['start_date']} to {occupancy_report.data['period']['end_date']}")
-        print(f"   - Average Stay Length: {occupancy_report.data['average_stay_length']:.1f} days")
-        print(f"   - Daily Data Points: {len(occupancy_report.data['daily_occupancy'])}")
-        
-        # Test 4: Revenue by Room Type Report
-        print("\n4. Testing Revenue by Room Type Report...")
-        revenue_config = ReportConfig(
-            report_type=ReportType.REVENUE_BY_ROOM_TYPE,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        revenue_report = reporter.generate_report(revenue_config)
-        print("✅ Revenue by Room Type Report generated successfully")
-        print(f"   - Total Revenue: ${revenue_report.data['total_revenue']:.2f}")
-        print(f"   - Room Types: {len(revenue_report.data['room_type_revenue'])}")
-        
-        # Test 5: Guest Demographics Report
-        print("\n5. Testing Guest Demographics Report...")
-        guest_config = ReportConfig(
-            report_type=ReportType.GUEST_DEMOGRAPHICS,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        guest_report = reporter.generate_report(guest_config)
-        print("✅ Guest Demographics Report generated successfully")
-        print(f"   - Total Guests: {guest_report.summary['total_guests']}")
-        print(f"   - Total Revenue: ${guest_report.summary['total_revenue']:.2f}")
-        print(f"   - Avg Revenue per Guest: ${guest_report.summary['avg_revenue_per_guest']:.2f}")
-        
-        # Test 6: Housekeeping Status Report
-        print("\n6. Testing Housekeeping Status Report...")
-        housekeeping_config = ReportConfig(
-            report_type=ReportType.HOUSEKEEPING_STATUS,
-            time_period=TimePeriod.DAILY,
-            hotel_id=1
-        )
-        housekeeping_report = reporter.generate_report(housekeeping_config)
-        print("✅ Housekeeping Status Report generated successfully")
-        print(f"   - Total Rooms: {housekeeping_report.summary['total_rooms']}")
-        print(f"   - Clean Rooms: {housekeeping_report.summary['clean_rooms']}")
-        print(f"   - Rooms Needing Attention: {housekeeping_report.summary['rooms_needing_attention']}")
-        
-        # Test 7: Cancellation Analysis Report
-        print("\n7. Testing Cancellation Analysis Report...")
-        cancellation_config = ReportConfig(
-            report_type=ReportType.CANCELLATION_ANALYSIS,
-            time_period=TimePeriod.MONTHLY,
-            hotel_id=1
-        )
-        try:
-            cancellation_report = reporter.generate_report(cancellation_config)
-            print("✅ Cancellation Analysis Report generated successfully")
-            print(f"   - Total Reservations: {cancellation_report.summary['total_reservations']}")
-            print(f"   - Total Cancellations: {cancellation_report.summary['total_cancellations']}")
-            print(f"   - Cancellation Rate: {cancellation_report.summary['cancellation_rate']:.1f}%")
-        except Exception as e:
-            print("⚠️  Cancellation Analysis Report: Database schema limitation (no cancellation_date column)")
-            print("   - This is expected with the test database")
-            print("   - Full functionality available with complete schema")
+        # Every report is read-only and independent of the others, so
+        # generate them concurrently; sqlite3 connections can't be shared
+        # across threads, so each task gets its own reporting system
+        def generate(report_type, time_period):
+            config = ReportConfig(report_type=report_type, time_period=time_period, hotel_id=1)
+            with HotelReportingSystem('hotel.db') as worker_reporter:
+                return worker_reporter.generate_report(config)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {report_type: executor.submit(generate, report_type, time_period)
+                       for _, report_type, time_period, _ in REPORT_CASES}
+        
+        # Tests 1-7: one per report type
+        reports = {}
+        for number, (title, report_type, _, details) in enumerate(REPORT_CASES, 1):
+            print(f"\n{number}. Testing {title}...")
+            report = futures[report_type].result()
+            lines = details(report)
+            reports[report_type] = report
+            print(f"✅ {title} generated successfully")
+            for line in lines:
+                print(f"   - {line}")
+        
+        daily_report = reports[ReportType.DAILY_STATUS]
+        financial_report = reports[ReportType.FINANCIAL_SUMMARY]
         
         # Test Export Functionality
         print("\n8. Testing Export Functionality...")
         
-        # Export CSV
-        csv_result = reporter.export_report(daily_report, "test_daily_report.csv", "csv")
-        print(f"✅ CSV Export: {csv_result}")
-        
-        # Export JSON
-        json_result = reporter.export_report(financial_report, "test_financial_report.json", "json")
-        print(f"✅ JSON Export: {json_result}")
+        # Exports go to a temporary directory that is removed afterwards,
+        # even if an export fails
+        with tempfile.TemporaryDirectory() as export_dir:
+            # Export CSV
+            csv_result = reporter.export_report(
+                daily_report, os.path.join(export_dir, "test_daily_report.csv"), "csv")
+            print(f"✅ CSV Export: {csv_result}")
+            
+            # Export JSON
+            json_result = reporter.export_report(
+                financial_report, os.path.join(export_dir, "test_financial_report.json"), "json")
+            print(f"✅ JSON Export: {json_result}")
         
         # Test Display Formats
         print("\n9. Testing Display Formats...")
@@ -144,13 +116,115 @@ def test_reporting_system():
         print("✅ Error handling working")
         print("✅ Database integration working")
         
-        # Cleanup test files
-        if os.path.exists("test_daily_report.csv"):
-            os.remove("test_daily_report.csv")
-        if os.path.exists("test_financial_report.json"):
-            os.remove("test_financial_report.json")
-        
         return True
 
+# Tables as the first release created them, before the reservations gained
+# their generated nights / nightly_rate columns and the cancellation columns
+_OLD_SCHEMA = """
+    CREATE TABLE hotel (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, address TEXT,
+        stars INTEGER DEFAULT 3, total_floors INTEGER, total_rooms INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+    CREATE TABLE floors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, hotel_id INTEGER NOT NULL,
+        floor_number INTEGER NOT NULL, description TEXT, UNIQUE(hotel_id, floor_number));
+    CREATE TABLE room_types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, description TEXT,
+        base_price DECIMAL(10,2) NOT NULL, max_occupancy INTEGER NOT NULL, amenities TEXT);
+    CREATE TABLE rooms (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, hotel_id INTEGER NOT NULL,
+        floor_id INTEGER NOT NULL, room_number TEXT NOT NULL, room_type_id INTEGER NOT NULL,
+        status TEXT DEFAULT 'available', price_per_night DECIMAL(10,2), max_occupancy INTEGER,
+        UNIQUE(hotel_id, room_number));
+    CREATE TABLE guests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, first_name TEXT NOT NULL, last_name TEXT NOT NULL,
+        email TEXT, phone TEXT, address TEXT, car_make TEXT, car_model TEXT, car_color TEXT,
+        loyalty_points INTEGER DEFAULT 0, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+    CREATE TABLE reservations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, room_id INTEGER NOT NULL, guest_id INTEGER NOT NULL,
+        check_in_date TEXT NOT NULL, check_out_date TEXT NOT NULL,
+        status TEXT DEFAULT 'confirmed', total_price DECIMAL(10,2),
+        booking_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP, payment_status TEXT DEFAULT 'pending');
+    CREATE TABLE transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, reservation_id INTEGER NOT NULL,
+        amount DECIMAL(10,2) NOT NULL, transaction_type TEXT NOT NULL, payment_method TEXT,
+        transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP, description TEXT);
+    CREATE TABLE housekeeping (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, room_id INTEGER NOT NULL,
+        status TEXT DEFAULT 'clean', last_cleaned TIMESTAMP, notes TEXT, UNIQUE(room_id));
+"""
+
+def test_reports_on_old_schema():
+    """Reports on a database created by the first release bring its schema up to date"""
+    print("Testing reports on a database with the original schema")
+    print("=" * 50)
+    
+    check_in = (date.today() - timedelta(days=5)).isoformat()
+    check_out = (date.today() - timedelta(days=2)).isoformat()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "old_hotel.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(_OLD_SCHEMA)
+        conn.executescript(f"""
+            INSERT INTO hotel (name, total_floors, total_rooms) VALUES ('Old Hotel', 1, 1);
+            INSERT INTO floors (hotel_id, floor_number) VALUES (1, 1);
+            INSERT INTO room_types (name, base_price, max_occupancy) VALUES ('Standard', 100, 2);
+            INSERT INTO rooms (hotel_id, floor_id, room_number, room_type_id, price_per_night)
+            VALUES (1, 1, '101', 1, 100);
+            INSERT INTO guests (first_name, last_name) VALUES ('Old', 'Guest');
+            INSERT INTO reservations (room_id, guest_id, check_in_date, check_out_date, status, total_price)
+            VALUES (1, 1, '{check_in}', '{check_out}', 'checked_out', 300);
+            INSERT INTO transactions (reservation_id, amount, transaction_type, transaction_date)
+            VALUES (1, 300, 'payment', '{check_out} 11:00:00');
+        """)
+        conn.close()
+        
+        with HotelReportingSystem(db_path) as reporter:
+            for report_type in (ReportType.FINANCIAL_SUMMARY, ReportType.OCCUPANCY_ANALYSIS,
+                                ReportType.REVENUE_BY_ROOM_TYPE, ReportType.CANCELLATION_ANALYSIS):
+                report = reporter.generate_report(
+                    ReportConfig(report_type=report_type, time_period=TimePeriod.MONTHLY, hotel_id=1))
+                print(f"✅ {report_type.value}: {report.summary}")
+
+def test_cancellation_on_last_day():
+    """A reservation booked and cancelled today counts in a period ending today"""
+    print("Testing a cancellation on the last day of the report period")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "hotel.db")
+        sim = HotelSimulator(db_path)
+        hotel_id = sim.db.create_hotel("Cancel Test Hotel", "3 Test Lane", 3, 1, 1)
+        floor_ids = sim.db.create_floors(hotel_id, 1)
+        room_type_ids = sim.db.create_room_types([
+            {"name": "Standard", "base_price": 100.00, "max_occupancy": 2},
+            {"name": "Deluxe", "base_price": 150.00, "max_occupancy": 3},
+            {"name": "Suite", "base_price": 250.00, "max_occupancy": 4}
+        ])
+        sim.db.create_rooms(hotel_id, floor_ids, room_type_ids, 1)
+        sim.load_hotel(hotel_id)
+        
+        res_system = ReservationSystem(sim.db)
+        guest = sim.create_guest("Last", "Minute")
+        check_in = (date.today() + timedelta(days=7)).isoformat()
+        check_out = (date.today() + timedelta(days=9)).isoformat()
+        reservation = res_system.create_reservation(
+            sim, guest, sim.find_available_rooms()[0], check_in, check_out)
+        assert res_system.cancel_reservation(reservation.id, reason="Change of plans")
+        sim.db.close()
+        
+        with HotelReportingSystem(db_path) as reporter:
+            report = reporter.generate_report(ReportConfig(
+                report_type=ReportType.CANCELLATION_ANALYSIS,
+                time_period=TimePeriod.MONTHLY, hotel_id=hotel_id))
+        
+        assert report.summary['total_reservations'] == 1, report.summary
+        assert report.summary['total_cancellations'] == 1, report.summary
+        assert report.data['cancellation_reasons'] == [{'reason': 'Change of plans', 'count': 1}]
+        print(f"✅ Cancelled today: {report.summary}")
+
 if __name__ == "__main__":
-    test_reporting_system()
\ No newline at end of file
+    test_reporting_system()
+    test_reports_on_old_schema()
+    test_cancellation_on_last_day()
\ No newline at end of file
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk reservation loading
+Checks that a load with a room that is not available is rejected as a whole
+"""
+
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+
+from reservation_wizard import ReservationWizard
+
+
+def _create_test_hotel(wizard):
+    """Create a small hotel with a guest and return (room ids, guest id)"""
+    db = wizard.db
+    hotel_id = db.create_hotel("Bulk Test Hotel", "2 Test Lane", 3, 1, 3)
+    floor_ids = db.create_floors(hotel_id, 1)
+    room_type_ids = db.create_room_types([
+        {"name": "Standard", "base_price": 120.00, "max_occupancy": 2},
+        {"name": "Deluxe", "base_price": 180.00, "max_occupancy": 3},
+        {"name": "Suite", "base_price": 300.00, "max_occupancy": 4}
+    ])
+    db.create_rooms(hotel_id, floor_ids, room_type_ids, 3)
+    room_ids = [row['id'] for row in db.execute_query(
+        "SELECT id FROM rooms WHERE hotel_id = ? ORDER BY id", (hotel_id,), fetch=True)]
+    return room_ids, wizard.sim.create_guest("Bulk", "Guest").id
+
+
+def _row(room_id, guest_id, check_in, check_out):
+    return {'room_id': room_id, 'guest_id': guest_id, 'check_in': check_in,
+            'check_out': check_out, 'total_price': 240.00}
+
+
+def _day(offset):
+    """The date offset days from today, as YYYY-MM-DD"""
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def _reservation_count(db):
+    return db.execute_query("SELECT COUNT(*) AS n FROM reservations", fetch=True)[0]['n']
+
+
+def _assert_rejected(wizard, rows, *expected):
+    """Check a load fails naming each expected text and writes nothing; return the error"""
+    count = _reservation_count(wizard.db)
+    try:
+        wizard.create_reservations_bulk(rows)
+    except ValueError as e:
+        error = str(e)
+    else:
+        raise AssertionError("A load with a bad row was accepted")
+    for text in expected:
+        assert text in error, f"{text!r} missing from error: {error}"
+    print(f"✓ Rejected: {error}")
+    assert _reservation_count(wizard.db) == count, "A rejected load left reservations behind"
+    return error
+
+
+def test_bulk_rejects_conflicting_row():
+    """A load with a double-booked room creates no reservations at all"""
+    print("=" * 60)
+    print("TEST: Bulk Reservations with a Conflicting Row")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with redirect_stdout(io.StringIO()):
+            wizard = ReservationWizard(os.path.join(tmp_dir, "hotel.db"))
+            room_ids, guest_id = _create_test_hotel(wizard)
+
+        try:
+            count = wizard.create_reservations_bulk([
+                _row(room_ids[0], guest_id, _day(10), _day(12))
+            ])
+            assert count == 1, f"Created {count} reservations, expected 1"
+            print("✓ Loaded a row for an available room")
+
+            # The second row either overlaps the reservation above or books
+            # the room its own load already takes in row 1
+            for conflicting in (
+                _row(room_ids[0], guest_id, _day(11), _day(13)),
+                _row(room_ids[1], guest_id, _day(40), _day(42)),
+            ):
+                rows = [_row(room_ids[1], guest_id, _day(10), _day(12)), conflicting]
+                _assert_rejected(wizard, rows, "row 2: room", "not available")
+                status = wizard.db.get_room_by_id(room_ids[1])['status']
+                assert status == 'available', f"Room of a rejected load is {status}"
+            print("✓ Rejected loads created no reservations")
+        finally:
+            wizard.db.close()
+
+
+def test_bulk_rejects_invalid_rows():
+    """Malformed rows and unknown guests or rooms are all reported at once"""
+    print("=" * 60)
+    print("TEST: Bulk Reservations with Invalid Rows")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with redirect_stdout(io.StringIO()):
+            wizard = ReservationWizard(os.path.join(tmp_dir, "hotel.db"))
+            room_ids, guest_id = _create_test_hotel(wizard)
+
+        try:
+            missing_guest = _row(room_ids[2], guest_id, _day(1), _day(2))
+            del missing_guest['guest_id']
+            rows = [
+                _row(room_ids[0], guest_id, _day(1), _day(3)),
+                _row(room_ids[1], guest_id + 100, _day(1), _day(3)),
+                missing_guest,
+                _row(room_ids[2], guest_id, '01/05/2030', _day(3)),
+                _row(room_ids[2], guest_id, _day(3), _day(1)),
+                _row(room_ids[2], guest_id, _day(1), _day(400)),
+                _row(room_ids[2], guest_id, _day(800), _day(801)),
+                _row(room_ids[2] + 100, guest_id, _day(1), _day(3)),
+                "not a row",
+            ]
+            error = _assert_rejected(
+                wizard, rows,
+                f"row 2: unknown guest {guest_id + 100}",
+                "row 3: missing guest_id",
+                "row 4: dates must use YYYY-MM-DD format",
+                "row 5: check_out must be after check_in",
+                "row 6: stay exceeds",
+                "row 7: check_in is more than",
+                f"row 8: unknown room {room_ids[2] + 100}",
+                "row 9: not an object")
+            assert "row 1:" not in error, f"Valid row 1 was reported: {error}"
+            _assert_rejected(wizard, {"room_id": room_ids[0]}, "list of reservation rows")
+            print("✓ Invalid loads created no reservations")
+        finally:
+            wizard.db.close()
+
+
+if __name__ == "__main__":
+    test_bulk_rejects_conflicting_row()
+    test_bulk_rejects_invalid_rows()
+    print("\n🎉 ALL TESTS PASSED!")
+    sys.exit(0)
@@ -13,10 +13,17 @@ def test_search_functionality():
     
     wizard = GuestWizard()
     
+    # Same conditions the wizard's search builds, served from the
+    # guests_fts trigram index rather than a LIKE scan over every guest row
+    def search(**criteria):
+        conditions, params = wizard.db.guest_search_conditions(criteria)
+        query = (f"SELECT * FROM guests WHERE {' AND '.join(conditions)} "
+                 "ORDER BY last_name, first_name LIMIT 10")
+        return wizard.db.execute_query(query, tuple(params), fetch=True)
+    
     # Test 1: Search by last name "Johnson"
     print("\n[Test 1] Searching for last name containing 'Johnson'...")
-    query = "SELECT * FROM guests WHERE last_name LIKE ? ORDER BY last_name, first_name LIMIT 10"
-    results = wizard.db.execute_query(query, ('%Johnson%',), fetch=True)
+    results = search(last_name='Johnson')
     
     print(f"✓ Found {len(results)} guest(s) with 'Johnson' in last name")
     for guest in results[:3]:
@@ -24,8 +31,7 @@ def test_search_functionality():
     
     # Test 2: Search by car make "Toyota"
     print("\n[Test 2] Searching for car make containing 'Toyota'...")
-    query = "SELECT * FROM guests WHERE car_make LIKE ? ORDER BY last_name, first_name LIMIT 10"
-    results = wizard.db.execute_query(query, ('%Toyota%',), fetch=True)
+    results = search(car_make='Toyota')
     
     print(f"✓ Found {len(results)} guest(s) with Toyota vehicles")
     for guest in results[:3]:
@@ -34,8 +40,7 @@ def test_search_functionality():
     
     # Test 3: Search by phone area code
     print("\n[Test 3] Searching for phone containing '555-123'...")
-    query = "SELECT * FROM guests WHERE phone LIKE ? ORDER BY last_name, first_name LIMIT 10"
-    results = wizard.db.execute_query(query, ('%555-123%',), fetch=True)
+    results = search(phone='555-123')
     
     print(f"✓ Found {len(results)} guest(s) with phone matching '555-123'")
     for guest in results[:3]:
@@ -43,8 +48,7 @@ def test_search_functionality():
     
     # Test 4: Search by address state
     print("\n[Test 4] Searching for address containing 'CA'...")
-    query = "SELECT * FROM guests WHERE address LIKE ? ORDER BY last_name, first_name LIMIT 10"
-    results = wizard.db.execute_query(query, ('%CA%',), fetch=True)
+    results = search(address='CA')
     
     print(f"✓ Found {len(results)} guest(s) with CA in address")
     for guest in results[:3]:
@@ -52,12 +56,7 @@ def test_search_functionality():
     
     # Test 5: Combined search
     print("\n[Test 5] Combined search: first_name='John' AND car_make='Tesla'...")
-    query = """
-        SELECT * FROM guests 
-        WHERE first_name LIKE ? AND car_make LIKE ?
-        ORDER BY last_name, first_name LIMIT 10
-    """
-    results = wizard.db.execute_query(query, ('%John%', '%Tesla%'), fetch=True)
+    results = search(first_name='John', car_make='Tesla')
     
     print(f"✓ Found {len(results)} guest(s) matching combined criteria")
     for guest in results:
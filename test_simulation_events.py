@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for simulation event storage
+Checks that events written to a CSV event sink can be read back and exported
+"""
+
+import csv
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+from database import HotelDatabase
+from simulation_engine import HotelSimulationEngine, CsvEventSink
+
+
+def _create_test_hotel(db_path):
+    """Create a small hotel with rooms to simulate and return its ID"""
+    room_types = [
+        {"name": "Standard", "base_price": 120.00, "max_occupancy": 2},
+        {"name": "Deluxe", "base_price": 180.00, "max_occupancy": 3},
+        {"name": "Suite", "base_price": 300.00, "max_occupancy": 4}
+    ]
+    with HotelDatabase(db_path) as db:
+        hotel_id = db.create_hotel("Event Test Hotel", "1 Test Lane", 3, 2, 20)
+        floor_ids = db.create_floors(hotel_id, 2)
+        room_type_ids = db.create_room_types(room_types)
+        db.create_rooms(hotel_id, floor_ids, room_type_ids, 10)
+    return hotel_id
+
+
+def test_export_from_csv_sink():
+    """Export the events of a run whose events went to a CsvEventSink"""
+    print("=" * 60)
+    print("TEST: Export Events from a CSV Event Sink")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "hotel.db")
+        sink_path = os.path.join(tmp_dir, "events_live.csv")
+        export_path = os.path.join(tmp_dir, "events_export.csv")
+
+        with redirect_stdout(io.StringIO()):
+            hotel_id = _create_test_hotel(db_path)
+            engine = HotelSimulationEngine(hotel_id, db_path)
+            with open(sink_path, 'w', newline='') as sink:
+                results = engine.run_simulation(days=5, verbose=False, event_sink=sink)
+                assert isinstance(results.events, CsvEventSink)
+
+                events = list(results.iter_events())
+                engine.export_events_to_csv(results, export_path)
+            engine.db.close()
+
+        print(f"✓ Simulated {len(results.events)} events into the sink")
+        assert len(events) == len(results.events), \
+            f"Read back {len(events)} events, expected {len(results.events)}"
+        print(f"✓ Read back {len(events)} events")
+
+        with open(sink_path, newline='') as f:
+            written = list(csv.reader(f))
+        with open(export_path, newline='') as f:
+            exported = list(csv.reader(f))
+        assert exported == written, "Exported CSV differs from the CSV written during the run"
+        print(f"✓ Exported CSV matches the sink ({len(exported) - 1} rows)")
+
+
+if __name__ == "__main__":
+    test_export_from_csv_sink()
+    print("\n🎉 ALL TESTS PASSED!")
+    sys.exit(0)
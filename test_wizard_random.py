@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
-import subprocess
+import io
 import sys
+import hotel_cli
 from database import HotelDatabase
 
 def test_wizard_random_distribution():
@@ -32,67 +33,53 @@ def test_wizard_random_distribution():
 """
     
     try:
-        # Run the wizard
-        process = subprocess.Popen(
-            [sys.executable, 'hotel_cli.py', 'wizard'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        stdout, stderr = process.communicate(input=user_input)
+        # Run the wizard in-process
+        output = io.StringIO()
+        hotel_cli.main(['wizard'], io.StringIO(user_input), output)
+        stdout = output.getvalue()
         
         print("Wizard output:")
         print(stdout)
         
-        if stderr:
-            print("Errors:")
-            print(stderr)
-        
-        # Verify the hotel was created
-        db = HotelDatabase()
-        
-        hotels = db.execute_query("SELECT * FROM hotel WHERE name = ?", (hotel_name,), fetch=True)
-        if not hotels:
-            print("❌ Hotel was not created")
-            return False
+        with HotelDatabase() as db:
+            # Verify the hotel was created
+            hotels = db.execute_query("SELECT * FROM hotel WHERE name = ?", (hotel_name,), fetch=True)
+            if not hotels:
+                print("❌ Hotel was not created")
+                return False
             
-        hotel = hotels[0]
-        hotel_id = hotel['id']
-        print(f"✅ Hotel created with ID: {hotel_id}")
+            hotel = hotels[0]
+            hotel_id = hotel['id']
+            print(f"✅ Hotel created with ID: {hotel_id}")
         
-        # Check room distribution
-        room_details = db.execute_query("""
-            SELECT rt.name as room_type, r.price_per_night, COUNT(*) as count
-            FROM rooms r 
-            JOIN room_types rt ON r.room_type_id = rt.id
-            WHERE r.hotel_id = ?
-            GROUP BY rt.name, r.price_per_night
-            ORDER BY rt.name
-        """, (hotel_id,), fetch=True)
+            # Check room distribution
+            room_details = db.execute_query("""
+                SELECT rt.name as room_type, r.price_per_night, COUNT(*) as count
+                FROM rooms r 
+                JOIN room_types rt ON r.room_type_id = rt.id
+                WHERE r.hotel_id = ?
+                GROUP BY rt.name, r.price_per_night
+                ORDER BY rt.name
+            """, (hotel_id,), fetch=True)
         
-        total_rooms = sum(detail['count'] for detail in room_details)
-        print(f"✅ Created {total_rooms} rooms with random distribution:")
+            total_rooms = sum(detail['count'] for detail in room_details)
+            print(f"✅ Created {total_rooms} rooms with random distribution:")
         
-        for detail in room_details:
-            print(f"  • {detail['room_type']}: {detail['count']} rooms at ${detail['price_per_night']}/night")
+            for detail in room_details:
+                print(f"  • {detail['room_type']}: {detail['count']} rooms at ${detail['price_per_night']}/night")
         
-        # Verify all rooms were created
-        if total_rooms == rooms:
-            print("✅ All rooms accounted for!")
-        else:
-            print(f"⚠️  Expected {rooms} rooms, got {total_rooms}")
+            # Verify all rooms were created
+            if total_rooms == rooms:
+                print("✅ All rooms accounted for!")
+            else:
+                print(f"⚠️  Expected {rooms} rooms, got {total_rooms}")
         
-        print("🎉 Random distribution test completed successfully!")
-        return True
+            print("🎉 Random distribution test completed successfully!")
+            return True
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False
-    finally:
-        if 'db' in locals():
-            db.conn.close()
 
 if __name__ == "__main__":
     success = test_wizard_random_distribution()
@@ -1,50 +1,72 @@
 #!/usr/bin/env python3
 """
-Script to update database.py and hotel_simulator.py with car fields
+Script to update hotel_simulator.py with car fields
 """
 
-# Update database.py
-with open('database.py', 'r') as f:
-    content = f.read()
-
-# Replace the guests table schema
-old_schema = """                '''CREATE TABLE IF NOT EXISTS guests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    email TEXT,
-                    phone TEXT,
-                    address TEXT,
-                    loyalty_points INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )'''"""
-
-new_schema = """                '''CREATE TABLE IF NOT EXISTS guests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    email TEXT,
-                    phone TEXT,
-                    address TEXT,
-                    car_make TEXT,
-                    car_model TEXT,
-                    car_color TEXT,
-                    loyalty_points INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )'''"""
-
-content = content.replace(old_schema, new_schema)
-
-with open('database.py', 'w') as f:
-    f.write(content)
-
-print("✓ Updated database.py schema")
+import ast
+import os
+import re
+import shutil
+import tempfile
+
+
+def definition_span(source, name):
+    """(start, end) offsets of the class or function called name, decorators included"""
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and node.name == name:
+            first_line = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            offsets = [0]
+            for line in source.splitlines(keepends=True):
+                offsets.append(offsets[-1] + len(line))
+            return offsets[first_line - 1], offsets[node.end_lineno]
+    raise ValueError(f"{name} is not defined in the source")
+
+
+def patch_definitions(path, replacements_by_name):
+    """Apply old -> new replacements inside named classes/functions of a file
+    
+    Each definition is located by parsing the file, so its replacements can
+    only match inside it, and a definition that is missing altogether is an
+    error rather than a silent no-op. The result is written with replace_file
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    for name, replacements in replacements_by_name.items():
+        start, end = definition_span(content, name)
+        pattern = re.compile('|'.join(map(re.escape, replacements)))
+        patched = pattern.sub(lambda match: replacements[match.group(0)], content[start:end])
+        content = content[:start] + patched + content[end:]
+    replace_file(path, content)
+
+
+def add_import(path, after, statement):
+    """Add an import line below the line `after`, unless the file already has it"""
+    with open(path, 'r') as f:
+        lines = f.read().splitlines(keepends=True)
+    if statement + '\n' in lines:
+        return
+    lines.insert(lines.index(after + '\n') + 1, statement + '\n')
+    replace_file(path, ''.join(lines))
+
+
+def replace_file(path, content):
+    """Write content to a temporary file next to path, then move it over path
+    
+    The move is atomic, so an interrupted run never leaves a half-written
+    source file. update_phone_documentation.py writes through this as well.
+    """
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(path)),
+                                     delete=False) as tmp:
+        tmp.write(content)
+    shutil.copymode(path, tmp.name)
+    os.replace(tmp.name, path)
+
+
+# database.py needs no patching: HotelDatabase creates the car columns for
+# new databases and adds them with ALTER TABLE to existing guests tables
 
 # Update hotel_simulator.py - Guest class
-with open('hotel_simulator.py', 'r') as f:
-    content = f.read()
-
-# Update Guest dataclass
+# Update Guest dataclass, making it slotted as well
 old_guest_class = """@dataclass
 class Guest:
     \"\"\"Represents a hotel guest\"\"\"
@@ -56,7 +78,7 @@ class Guest:
     address: str = \"\"
     loyalty_points: int = 0"""
 
-new_guest_class = """@dataclass
+new_guest_class = """@dataclass(**DATACLASS_SLOTS)
 class Guest:
     \"\"\"Represents a hotel guest\"\"\"
     id: Optional[int] = None
@@ -70,8 +92,6 @@ class Guest:
     car_color: str = \"\"
     loyalty_points: int = 0"""
 
-content = content.replace(old_guest_class, new_guest_class)
-
 # Update create_guest method signature
 old_signature = """    def create_guest(self, first_name: str, last_name: str, email: str = "", 
                     phone: str = "", address: str = "") -> Guest:"""
@@ -80,8 +100,6 @@ new_signature = """    def create_guest(self, first_name: str, last_name: str, e
                     phone: str = "", address: str = "", car_make: str = "",
                     car_model: str = "", car_color: str = "") -> Guest:"""
 
-content = content.replace(old_signature, new_signature)
-
 # Update create_guest INSERT query
 old_insert = """            query = \"\"\"
                 INSERT INTO guests (first_name, last_name, email, phone, address)
@@ -97,8 +115,6 @@ new_insert = """            query = \"\"\"
             cursor = self.db.conn.cursor()
             cursor.execute(query, (first_name, last_name, email, phone, address, car_make, car_model, car_color))"""
 
-content = content.replace(old_insert, new_insert)
-
 # Update Guest object creation in create_guest
 old_guest_obj = """            guest = Guest(
                 id=guest_id,
@@ -121,10 +137,24 @@ new_guest_obj = """            guest = Guest(
                 car_color=car_color
             )"""
 
-content = content.replace(old_guest_obj, new_guest_obj)
-
-with open('hotel_simulator.py', 'w') as f:
-    f.write(content)
 
-print("✓ Updated hotel_simulator.py")
-print("\nAll files updated successfully!")
+def main():
+    """Patch hotel_simulator.py with the car fields"""
+    patch_definitions('hotel_simulator.py', {
+        'Guest': {old_guest_class: new_guest_class},
+        'create_guest': {
+            old_signature: new_signature,
+            old_insert: new_insert,
+            old_guest_obj: new_guest_obj
+        }
+    })
+    
+    add_import('hotel_simulator.py', 'from database import HotelDatabase',
+               'from compat import DATACLASS_SLOTS')
+    
+    print("✓ Updated hotel_simulator.py")
+    print("\nAll files updated successfully!")
+
+
+if __name__ == "__main__":
+    main()
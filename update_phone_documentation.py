@@ -3,10 +3,20 @@
 Script to update documentation for phone field (cell numbers only)
 """
 
-# Update database.py
-with open('database.py', 'r') as f:
-    content = f.read()
+import re
+
+from update_guest_schema import replace_file
+
+
+def patch_file(path, replacements):
+    """Apply every old -> new replacement to a file in one pass and write it once"""
+    with open(path, 'r') as f:
+        content = f.read()
+    pattern = re.compile('|'.join(map(re.escape, replacements)))
+    replace_file(path, pattern.sub(lambda match: replacements[match.group(0)], content))
+
 
+# Update database.py
 # Add comment to guests table schema
 old_schema = """                '''CREATE TABLE IF NOT EXISTS guests (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,17 +46,11 @@ new_schema = """                '''CREATE TABLE IF NOT EXISTS guests (
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )'''"""
 
-content = content.replace(old_schema, new_schema)
-
-with open('database.py', 'w') as f:
-    f.write(content)
+patch_file('database.py', {old_schema: new_schema})
 
 print("✓ Updated database.py")
 
 # Update hotel_simulator.py
-with open('hotel_simulator.py', 'r') as f:
-    content = f.read()
-
 # Update create_guest docstring
 old_docstring = """    def create_guest(self, first_name: str, last_name: str, email: str = "", 
                     phone: str = "", address: str = "", car_make: str = "",
@@ -72,10 +76,8 @@ new_docstring = """    def create_guest(self, first_name: str, last_name: str, e
             phone: Guest's cell/mobile phone number (cell numbers only)
             address: Guest's physical address"""
 
-content = content.replace(old_docstring, new_docstring)
-
 # Update Guest class docstring
-old_guest_doc = """@dataclass
+old_guest_doc = """@dataclass(**DATACLASS_SLOTS)
 class Guest:
     \"\"\"Represents a hotel guest\"\"\"
     id: Optional[int] = None
@@ -89,7 +91,7 @@ class Guest:
     car_color: str = ""
     loyalty_points: int = 0"""
 
-new_guest_doc = """@dataclass
+new_guest_doc = """@dataclass(**DATACLASS_SLOTS)
 class Guest:
     \"\"\"Represents a hotel guest
     
@@ -116,10 +118,10 @@ class Guest:
     car_color: str = ""
     loyalty_points: int = 0"""
 
-content = content.replace(old_guest_doc, new_guest_doc)
-
-with open('hotel_simulator.py', 'w') as f:
-    f.write(content)
+patch_file('hotel_simulator.py', {
+    old_docstring: new_docstring,
+    old_guest_doc: new_guest_doc
+})
 
 print("✓ Updated hotel_simulator.py")
 print("\nAll documentation updated successfully!")